@@ -0,0 +1,382 @@
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from typing import Callable, Dict, List
+
+# Ajouter le répertoire parent au PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.game import Puissance4Game
+from shared.protocol import (
+    send_message,
+    receive_message,
+    create_game_update_message
+)
+
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+# name -> (fonction, unité, plus_grand_est_meilleur)
+BENCHMARKS: Dict[str, tuple] = {}
+
+def benchmark(name: str, unit: str, higher_is_better: bool = True):
+    """Enregistre une fonction de mesure ; elle retourne une valeur numérique"""
+    def decorator(func: Callable[[float], float]):
+        BENCHMARKS[name] = (func, unit, higher_is_better)
+        return func
+    return decorator
+
+@contextlib.contextmanager
+def quiet():
+    """Coupe les print et les journaux INFO du code mesuré"""
+    logging.disable(logging.INFO)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+def random_games(count: int, seed: int = 42) -> List[List[int]]:
+    """Génère des suites de colonnes jouables, jouées jusqu'à la fin de la partie"""
+    rng = random.Random(seed)
+    games = []
+    with quiet():
+        for _ in range(count):
+            game = Puissance4Game()
+            while not game.is_game_over():
+                col = rng.choice([c for c in range(game.COLS) if game.board[0][c] == 0])
+                game.play_move(None, col)
+            games.append(list(game.moves))
+    return games
+
+@benchmark("game.play_move", "coups/s")
+def bench_play_move(min_time: float) -> float:
+    games = random_games(200)
+    moves = 0
+    start = time.perf_counter()
+    with quiet():
+        while time.perf_counter() - start < min_time:
+            for columns in games:
+                game = Puissance4Game()
+                for col in columns:
+                    game.play_move(None, col)
+                moves += len(columns)
+    return moves / (time.perf_counter() - start)
+
+@benchmark("game.check_winner", "appels/s")
+def bench_check_winner(min_time: float) -> float:
+    # Positions de milieu de partie, testées sur chaque case occupée
+    positions = []
+    with quiet():
+        for columns in random_games(200, seed=7):
+            game = Puissance4Game()
+            for col in columns[:len(columns) // 2]:
+                game.play_move(None, col)
+            cells = [(r, c) for r in range(game.ROWS) for c in range(game.COLS) if game.board[r][c]]
+            positions.append((game, cells))
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        for game, cells in positions:
+            for row, col in cells:
+                game.check_winner(row, col)
+            calls += len(cells)
+    return calls / (time.perf_counter() - start)
+
+@benchmark("engine.check_winner", "appels/s")
+def bench_engine_check_winner(min_time: float) -> float:
+    from shared.connect_engine import ConnectEngine
+    
+    # Mêmes positions que game.check_winner, sur le moteur à masques de lignes
+    positions = []
+    with quiet():
+        for columns in random_games(200, seed=7):
+            engine = ConnectEngine()
+            for col in columns[:len(columns) // 2]:
+                engine.play_move(None, col)
+            cells = [(r, c) for r in range(engine.ROWS) for c in range(engine.COLS) if engine.board[r][c]]
+            positions.append((engine, cells))
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        for engine, cells in positions:
+            for row, col in cells:
+                engine.check_winner(row, col)
+            calls += len(cells)
+    return calls / (time.perf_counter() - start)
+
+@benchmark("game.play_ai_move", "µs/coup", higher_is_better=False)
+def bench_play_ai_move(min_time: float) -> float:
+    positions = []
+    with quiet():
+        for columns in random_games(100, seed=11):
+            game = Puissance4Game()
+            for col in columns[:len(columns) // 2]:
+                game.play_move(None, col)
+            if not game.is_game_over():
+                positions.append(game)
+    calls = 0
+    start = time.perf_counter()
+    with quiet():
+        while time.perf_counter() - start < min_time:
+            for game in positions:
+                game.play_ai_move()
+            calls += len(positions)
+    return (time.perf_counter() - start) / calls * 1e6
+
+@benchmark("mcts.search", "itérations/s")
+def bench_mcts(min_time: float) -> float:
+    from shared.mcts import MCTS
+    
+    mcts = MCTS(seed=3)
+    iterations = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        mcts.search(1000)
+        iterations += 1000
+        mcts.set_position(0, 0)
+    return iterations / (time.perf_counter() - start)
+
+@benchmark("search.nodes", "nœuds/s")
+def bench_search_nodes(min_time: float) -> float:
+    from shared.search import Search
+    
+    # Recherche à profondeur 6 depuis des positions de début de partie (évaluation incrémentale)
+    positions = []
+    with quiet():
+        for columns in random_games(10, seed=31):
+            game = Puissance4Game()
+            for col in columns[:6]:
+                game.play_move(None, col)
+            positions.append(game)
+    nodes = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        for game in positions:
+            search = Search(game)
+            search.score_moves(6)
+            nodes += search.nodes
+    return nodes / (time.perf_counter() - start)
+
+def register_parallel_search(workers: int, depth: int = 7):
+    """Benchmark de la recherche répartie sur workers processus (ms par coup à la profondeur depth)"""
+    @benchmark(f"search.parallel.{workers}", "ms/coup", higher_is_better=False)
+    def bench_parallel_search(min_time: float) -> float:
+        from shared.search import ParallelSearch
+        
+        positions = []
+        with quiet():
+            for columns in random_games(5, seed=23):
+                game = Puissance4Game()
+                for col in columns[:8]:
+                    game.play_move(None, col)
+                positions.append(game)
+        # Table de transposition vidée à chaque tâche : chaque coup est cherché à froid
+        search = ParallelSearch(workers, max_tt_entries=0)
+        try:
+            search.best_move(positions[0], 2)  # Démarrage des processus, hors mesure
+            moves = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < min_time:
+                search.best_move(positions[moves % len(positions)], depth)
+                moves += 1
+            return (time.perf_counter() - start) / moves * 1000
+        finally:
+            search.close()
+
+# Passage à l'échelle de la recherche répartie
+for workers in (1, 2, 4, 8):
+    register_parallel_search(workers)
+
+@benchmark("batch.self_play", "parties/s")
+def bench_batch_self_play(min_time: float) -> float:
+    from shared.batch import self_play
+    
+    games = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_time:
+        self_play(4096, seed=games)
+        games += 4096
+    return games / (time.perf_counter() - start)
+
+@benchmark("protocol.roundtrip", "messages/s")
+def bench_protocol(min_time: float) -> float:
+    sender, receiver = socket.socketpair()
+    message = create_game_update_message([[0, 1, 2, 0, 1, 2, 0] for _ in range(6)], 1)
+    count = 0
+    try:
+        with quiet():
+            start = time.perf_counter()
+            while time.perf_counter() - start < min_time:
+                for _ in range(100):
+                    send_message(sender, message)
+                    receive_message(receiver)
+                count += 100
+            elapsed = time.perf_counter() - start
+    finally:
+        sender.close()
+        receiver.close()
+    return count / elapsed
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def wait_for_server(host: str, port: int, timeout: float = 5.0):
+    """Attend que le serveur accepte les connexions (plutôt qu'un délai fixe)"""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return
+        except OSError:
+            if time.perf_counter() >= deadline:
+                raise
+            time.sleep(0.01)
+
+@contextlib.contextmanager
+def thread_errors():
+    """Collecte les exceptions non rattrapées des threads (le serveur en lance un par client)"""
+    errors = []
+    previous = threading.excepthook
+    threading.excepthook = errors.append
+    try:
+        yield errors
+    finally:
+        threading.excepthook = previous
+
+@benchmark("server.matches", "matchs/s")
+def bench_server_matches(min_time: float) -> float:
+    from server.server import Puissance4Server
+    from client.bot import LoadGenerator
+
+    port = free_port()
+    # Base jetable hors de l'arbre de travail (le serveur n'écrit rien d'autre : ses
+    # journaux ne sont configurés que par son point d'entrée)
+    with tempfile.TemporaryDirectory() as tmp, quiet(), thread_errors() as errors:
+        db_path = os.path.join(tmp, "bench.db")
+        # File d'attente servie toutes les 20 ms : le débit mesuré est celui des parties,
+        # pas celui du délai d'appariement
+        server = Puissance4Server("127.0.0.1", port, db_path=db_path, pairing_interval=0.02)
+        threading.Thread(target=server.start, daemon=True).start()
+        try:
+            wait_for_server("127.0.0.1", port)
+            generator = LoadGenerator("127.0.0.1", port, players=20, ramp_up=0.5)
+            result = asyncio.run(generator.run(max(min_time, 5.0)))
+        finally:
+            server.stop()
+            server.database.close()
+    if errors:
+        first = errors[0]
+        details = "".join(traceback.format_exception(first.exc_type, first.exc_value, first.exc_traceback))
+        raise RuntimeError(f"{len(errors)} exception(s) dans les threads du serveur, la première :\n{details}")
+    return result["matches_per_second"]
+
+def run_benchmarks(names: List[str], min_time: float) -> Dict:
+    results = {}
+    for name in names:
+        func, unit, higher_is_better = BENCHMARKS[name]
+        value = func(min_time)
+        results[name] = {"value": value, "unit": unit, "higher_is_better": higher_is_better}
+        print(f"{name:24s} {value:14.2f} {unit}")
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> bool:
+    """
+    Compare deux jeux de résultats et affiche les écarts.
+
+    Returns:
+        True si aucune régression au-delà du seuil (fraction, ex. 0.1 = 10 %)
+    """
+    ok = True
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            continue
+        value = current["results"][name]["value"]
+        if base["value"] == 0:
+            continue
+        change = (value - base["value"]) / base["value"]
+        # Une variation positive est une amélioration si plus grand est meilleur
+        gain = change if base["higher_is_better"] else -change
+        status = "OK"
+        if gain < -threshold:
+            status = "RÉGRESSION"
+            ok = False
+        elif gain > threshold:
+            status = "amélioration"
+        print(f"{name:24s} {base['value']:12.2f} -> {value:12.2f} {base['unit']:10s} {change:+7.1%}  {status}")
+    return ok
+
+def load_results(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks du Puissance 4")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Lance les benchmarks")
+    run_parser.add_argument("names", nargs="*", help="Benchmarks à lancer (tous par défaut)")
+    run_parser.add_argument("--min-time", type=float, default=1.0, help="Durée minimale par benchmark (s)")
+    run_parser.add_argument("--save", help="Enregistre les résultats (chemin, ou nom dans benchmarks/baselines)")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare des résultats à une référence")
+    compare_parser.add_argument("baseline", help="Fichier JSON de référence")
+    compare_parser.add_argument("current", nargs="?", help="Résultats à comparer (sinon, nouvelle exécution)")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="Tolérance avant régression (0.10 = 10 %%)")
+    compare_parser.add_argument("--min-time", type=float, default=1.0)
+
+    subparsers.add_parser("list", help="Liste les benchmarks disponibles")
+
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for name, (_, unit, _) in BENCHMARKS.items():
+            print(f"{name:24s} {unit}")
+        return
+
+    if args.command == "run":
+        names = args.names or list(BENCHMARKS)
+        unknown = [name for name in names if name not in BENCHMARKS]
+        if unknown:
+            parser.error(f"Benchmarks inconnus: {', '.join(unknown)}")
+        results = run_benchmarks(names, args.min_time)
+        if args.save:
+            path = args.save if os.sep in args.save or args.save.endswith(".json") else os.path.join(BASELINES_DIR, f"{args.save}.json")
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+            print(f"Résultats enregistrés dans {path}")
+        return
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        current = run_benchmarks(list(baseline["results"]), args.min_time)
+    if not compare(baseline, current, args.threshold):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
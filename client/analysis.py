@@ -0,0 +1,106 @@
+import multiprocessing
+import queue
+from typing import Dict, List, Optional, Tuple
+
+def analysis_worker(jobs, results, generation):
+    """
+    Boucle du processus d'analyse.
+
+    Chaque tâche porte un numéro de génération ; dès que generation.value change
+    (nouvelle position ou annulation), la recherche en cours s'interrompt.
+    """
+    from shared.game import Puissance4Game
+    from shared.search import Search, SearchCancelled
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        job_id, board, player, max_depth = job
+        if job_id != generation.value:
+            continue  # Déjà remplacée par une position plus récente
+
+        game = Puissance4Game()
+        game.set_board(board, player)
+        search = Search(game, should_stop=lambda: generation.value != job_id)
+        try:
+            for depth, scores in search.iterate(max_depth):
+                results.put((job_id, depth, scores, search.nodes, False))
+            results.put((job_id, None, None, search.nodes, True))
+        except SearchCancelled:
+            continue
+
+class PositionAnalyzer:
+    """
+    Analyse de position dans un processus séparé.
+
+    La recherche ne tourne jamais sur le thread Tk : analyse() envoie la position
+    au processus, qui renvoie les scores par colonne après chaque profondeur ;
+    poll() récupère, sans bloquer, ceux de la position courante.
+    """
+
+    def __init__(self, max_depth: int = 8):
+        self.max_depth = max_depth
+        self.process = None
+        self.jobs = None
+        self.results = None
+        self.generation = None
+
+    def start(self):
+        """Démarre le processus d'analyse (spawn : le client a des threads et une fenêtre Tk)"""
+        if self.process is not None:
+            return
+        context = multiprocessing.get_context("spawn")
+        self.jobs = context.Queue()
+        self.results = context.Queue()
+        self.generation = context.Value("i", 0)
+        self.process = context.Process(
+            target=analysis_worker,
+            args=(self.jobs, self.results, self.generation),
+            daemon=True
+        )
+        self.process.start()
+
+    def analyse(self, board: List[List[int]], player: int):
+        """Lance l'analyse d'une position en annulant immédiatement la précédente"""
+        if self.process is None:
+            self.start()
+        job_id = self.cancel()
+        self.jobs.put((job_id, [line[:] for line in board], player, self.max_depth))
+
+    def cancel(self) -> int:
+        """Annule l'analyse en cours ; retourne le nouveau numéro de génération"""
+        if self.generation is None:
+            return 0
+        with self.generation.get_lock():
+            self.generation.value += 1
+            return self.generation.value
+
+    def poll(self) -> List[Tuple[Optional[int], Optional[Dict[int, int]], int, bool]]:
+        """Retourne les résultats reçus pour la position courante : (profondeur, scores, nœuds, terminé)"""
+        if self.results is None:
+            return []
+        current = self.generation.value
+        received = []
+        try:
+            while True:
+                job_id, depth, scores, nodes, done = self.results.get_nowait()
+                if job_id == current:
+                    received.append((depth, scores, nodes, done))
+        except queue.Empty:
+            pass
+        return received
+
+    def stop(self):
+        """Arrête le processus d'analyse"""
+        if self.process is None:
+            return
+        self.cancel()
+        self.jobs.put(None)
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
+        self.jobs = None
+        self.results = None
+        self.generation = None
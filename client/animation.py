@@ -0,0 +1,124 @@
+import time
+from typing import Callable, Dict, Optional
+
+class Animation:
+    """
+    Animation pilotée par l'AnimationScheduler.
+
+    step(dt) reçoit le temps écoulé (en secondes) depuis le pas précédent et
+    retourne False quand l'animation est terminée.
+    """
+    __slots__ = ("step", "tag", "on_done", "on_cancel", "interval", "next_due")
+
+    def __init__(self, step: Callable[[float], bool], tag: Optional[str] = None,
+                 on_done: Optional[Callable[[], None]] = None,
+                 on_cancel: Optional[Callable[[], None]] = None,
+                 interval: Optional[float] = None):
+        self.step = step
+        self.tag = tag
+        self.on_done = on_done
+        self.on_cancel = on_cancel
+        self.interval = interval  # None : à chaque image ; sinon tâche périodique
+        self.next_due = None
+
+class AnimationScheduler:
+    """
+    Ordonnanceur unique des animations du client.
+
+    Un seul minuteur Tk fait avancer toutes les animations actives à chaque image.
+    Les animations sont basées sur le temps écoulé : si une image est en retard,
+    elles avancent d'autant (les images manquées sont sautées au lieu de s'empiler).
+    Sans animation active, le minuteur ne se réveille que pour les tâches périodiques.
+    """
+
+    def __init__(self, root, fps: int = 60, max_dt: float = 0.1):
+        self.root = root
+        self.frame_time = 1.0 / fps
+        self.max_dt = max_dt
+        self.animations: Dict[int, Animation] = {}
+        self.next_id = 0
+        self.after_id = None
+        self.last_tick = None
+
+    def add(self, step: Callable[[float], bool], tag: Optional[str] = None,
+            on_done: Optional[Callable[[], None]] = None,
+            on_cancel: Optional[Callable[[], None]] = None) -> int:
+        """Ajoute une animation exécutée à chaque image ; retourne son identifiant"""
+        return self._register(Animation(step, tag, on_done, on_cancel))
+
+    def every(self, interval: float, callback: Callable[[], bool], tag: Optional[str] = None,
+              delay: Optional[float] = None) -> int:
+        """
+        Ajoute une tâche périodique (ex. battement du cœur de l'écran d'accueil).
+
+        callback() retourne False pour s'arrêter.
+        """
+        animation = Animation(lambda dt: callback(), tag, interval=interval)
+        animation.next_due = time.perf_counter() + (interval if delay is None else delay)
+        return self._register(animation)
+
+    def cancel(self, animation_id: int):
+        """Annule une animation par son identifiant"""
+        animation = self.animations.pop(animation_id, None)
+        if animation and animation.on_cancel:
+            animation.on_cancel()
+
+    def cancel_tag(self, tag: str):
+        """Annule toutes les animations portant ce tag"""
+        for animation_id in [i for i, a in self.animations.items() if a.tag == tag]:
+            self.cancel(animation_id)
+
+    def cancel_all(self):
+        """Annule toutes les animations"""
+        for animation_id in list(self.animations):
+            self.cancel(animation_id)
+
+    def _register(self, animation: Animation) -> int:
+        self.next_id += 1
+        self.animations[self.next_id] = animation
+        # Réveiller le minuteur au plus tôt pour prendre en compte la nouvelle animation
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self._schedule(0)
+        return self.next_id
+
+    def _schedule(self, delay: float):
+        if self.after_id is None:
+            self.after_id = self.root.after(max(1, int(delay * 1000)), self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        now = time.perf_counter()
+        dt = min(self.max_dt, now - self.last_tick) if self.last_tick is not None else self.frame_time
+        self.last_tick = now
+
+        for animation_id, animation in list(self.animations.items()):
+            if animation_id not in self.animations:
+                continue  # Annulée par une autre animation pendant ce passage
+            if animation.interval is not None:
+                if now < animation.next_due:
+                    continue
+                # Recaler sur l'horloge sans rattraper les déclenchements manqués
+                animation.next_due = max(animation.next_due + animation.interval, now)
+            try:
+                alive = animation.step(dt)
+            except Exception as e:
+                print(f"Erreur dans une animation: {e}")
+                alive = False
+            if not alive:
+                self.animations.pop(animation_id, None)
+                if animation.on_done:
+                    animation.on_done()
+
+        if not self.animations:
+            self.last_tick = None
+            return
+        if any(a.interval is None for a in self.animations.values()):
+            # Prochaine image, en tenant compte du temps passé dans ce passage
+            self._schedule(self.frame_time - (time.perf_counter() - now))
+        else:
+            # Uniquement des tâches périodiques : dormir jusqu'à la prochaine échéance
+            self.last_tick = None
+            next_due = min(a.next_due for a in self.animations.values())
+            self._schedule(next_due - time.perf_counter())
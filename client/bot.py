@@ -0,0 +1,384 @@
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+
+# Ajouter le répertoire parent au PYTHONPATH
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shared.protocol import (
+    MessageType,
+    create_join_queue_message,
+    create_play_turn_message,
+    create_chat_message,
+    send_message_async,
+    receive_message_async
+)
+from shared.game import Puissance4Game
+from shared.mcts import MCTS
+
+ROWS = 6
+COLS = 7
+
+BOT_CHAT_MESSAGES = [
+    "Bonne partie !",
+    "Bien joué",
+    "Hmm...",
+    "Je réfléchis",
+    "À toi !",
+]
+
+def landing_row(board: List[List[int]], col: int) -> int:
+    """Retourne la ligne où tomberait un jeton joué dans col, ou -1 si la colonne est pleine"""
+    for row in range(len(board) - 1, -1, -1):
+        if board[row][col] == 0:
+            return row
+    return -1
+
+class RandomPolicy:
+    """Joue une colonne non pleine au hasard"""
+
+    def choose_column(self, board: List[List[int]], player: int) -> Optional[int]:
+        columns = [col for col in range(len(board[0])) if board[0][col] == 0]
+        return random.choice(columns) if columns else None
+
+class AIPolicy:
+    """Joue le coup de Puissance4Game.play_ai_move (la même IA que le serveur)"""
+
+    # Calcul lourd : exécuté hors de la boucle asyncio (voir BotClient.play_turn)
+    cpu_bound = True
+
+    def choose_column(self, board: List[List[int]], player: int) -> Optional[int]:
+        game = Puissance4Game()
+        game.set_board([line[:] for line in board], player)
+        _, col = game.play_ai_move()
+        return col
+
+class MCTSPolicy:
+    """Joue le coup de la recherche Monte-Carlo ; l'arbre est réutilisé d'un coup à l'autre"""
+
+    cpu_bound = True
+
+    def __init__(self, playouts: int = 500):
+        self.mcts = MCTS(playouts=playouts)
+
+    def choose_column(self, board: List[List[int]], player: int) -> Optional[int]:
+        self.mcts.sync(board, player)
+        return self.mcts.search()
+
+POLICIES = {
+    "random": RandomPolicy,
+    "ai": AIPolicy,
+    "mcts": MCTSPolicy,
+}
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Percentile par rang le plus proche, ou None si la liste est vide"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+class BotStats:
+    """Mesures partagées par tous les bots d'un même processus"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.time_to_match: List[float] = []
+        self.move_rtts: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.connections = 0
+        self.active_connections = 0
+        self.matches_started = 0
+        self.matches_finished = 0
+        self.moves_played = 0
+        self.chats_sent = 0
+        self.disconnects = 0
+
+    def record_error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def snapshot(self) -> Dict:
+        """Résumé des mesures (durées en millisecondes)"""
+        elapsed = time.perf_counter() - self.started_at
+        to_ms = lambda value: round(value * 1000, 2) if value is not None else None
+        return {
+            "elapsed": round(elapsed, 2),
+            "connections": self.connections,
+            "active_connections": self.active_connections,
+            "matches_started": self.matches_started,
+            "matches_finished": self.matches_finished,
+            "matches_per_second": round(self.matches_finished / elapsed, 3) if elapsed else 0.0,
+            "moves_played": self.moves_played,
+            "chats_sent": self.chats_sent,
+            "disconnects": self.disconnects,
+            "errors": dict(self.errors),
+            "error_count": sum(self.errors.values()),
+            "time_to_match_ms": {
+                "p50": to_ms(percentile(self.time_to_match, 50)),
+                "p90": to_ms(percentile(self.time_to_match, 90)),
+                "p99": to_ms(percentile(self.time_to_match, 99)),
+            },
+            "move_rtt_ms": {
+                "p50": to_ms(percentile(self.move_rtts, 50)),
+                "p90": to_ms(percentile(self.move_rtts, 90)),
+                "p99": to_ms(percentile(self.move_rtts, 99)),
+            },
+        }
+
+class BotClient:
+    """
+    Joueur simulé sans interface graphique.
+
+    Il rejoint la file, joue ses coups selon une politique, discute et se
+    déconnecte / reconnecte aléatoirement selon les taux configurés.
+    """
+
+    def __init__(self, username: str, host: str, port: int, policy, stats: BotStats,
+                 chat_rate: float = 0.0, disconnect_rate: float = 0.0,
+                 reconnect_delay: float = 1.0, play_with_ai: bool = False):
+        self.username = username
+        self.host = host
+        self.port = port
+        self.policy = policy
+        self.stats = stats
+        self.chat_rate = chat_rate
+        self.disconnect_rate = disconnect_rate
+        self.reconnect_delay = reconnect_delay
+        self.play_with_ai = play_with_ai
+        self.reader = None
+        self.writer = None
+        self.player = None
+        self.board = None
+        self.queued_at = None
+        self.move_sent_at = None
+
+    async def run(self, stop_event: asyncio.Event):
+        """Boucle de vie du bot : connexion, parties, reconnexions"""
+        while not stop_event.is_set():
+            try:
+                await self.session(stop_event)
+            except (ConnectionError, OSError) as e:
+                self.stats.record_error(type(e).__name__)
+            except Exception as e:
+                logging.error(f"Bot {self.username}: {e}")
+                self.stats.record_error("exception")
+            finally:
+                await self.close()
+            if not stop_event.is_set():
+                await asyncio.sleep(self.reconnect_delay * (0.5 + random.random()))
+
+    async def session(self, stop_event: asyncio.Event):
+        """Une connexion au serveur, jusqu'à la déconnexion (volontaire ou non)"""
+        self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.stats.connections += 1
+        self.stats.active_connections += 1
+        await self.join_queue()
+
+        # Une seule lecture en cours à la fois, jamais annulée au milieu d'une trame
+        # (l'en-tête de taille serait perdu et les trames suivantes décalées)
+        stop_task = asyncio.ensure_future(stop_event.wait())
+        read_task = None
+        try:
+            while True:
+                if read_task is None:
+                    read_task = asyncio.ensure_future(receive_message_async(self.reader))
+                done, _ = await asyncio.wait({read_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+                if stop_task in done:
+                    return
+                message = read_task.result()
+                read_task = None
+                if message is None:
+                    self.stats.record_error("connection_lost")
+                    return
+                if not await self.handle_message(message):
+                    self.stats.disconnects += 1
+                    return
+        finally:
+            for task in (read_task, stop_task):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def close(self):
+        if self.writer:
+            self.stats.active_connections -= 1
+            try:
+                self.writer.close()
+                await self.writer.wait_closed()
+            except Exception:
+                pass
+        self.reader = None
+        self.writer = None
+        self.player = None
+        self.move_sent_at = None
+
+    async def join_queue(self):
+        message = create_join_queue_message(self.username)
+        message["play_with_ai"] = self.play_with_ai
+        self.queued_at = time.perf_counter()
+        await send_message_async(self.writer, message)
+
+    async def handle_message(self, message: Dict) -> bool:
+        """Traite un message du serveur ; retourne False pour se déconnecter"""
+        msg_type = message.get("type")
+
+        if msg_type == MessageType.START_MATCH.value:
+            self.stats.matches_started += 1
+            if self.queued_at is not None:
+                self.stats.time_to_match.append(time.perf_counter() - self.queued_at)
+                self.queued_at = None
+            self.player = message.get("player")
+            self.board = message.get("board")
+            if self.player == 1:
+                return await self.play_turn()
+
+        elif msg_type == MessageType.GAME_UPDATE.value:
+            if self.move_sent_at is not None:
+                self.stats.move_rtts.append(time.perf_counter() - self.move_sent_at)
+                self.move_sent_at = None
+            self.board = message.get("board")
+            if message.get("current_player") == self.player:
+                return await self.play_turn()
+
+        elif msg_type == MessageType.END_GAME.value:
+            self.stats.matches_finished += 1
+            self.player = None
+            self.move_sent_at = None
+            await self.join_queue()
+
+        elif msg_type == MessageType.ERROR.value:
+            error_msg = message.get("message", "")
+            self.stats.record_error(error_msg or "error")
+            # Le serveur remet le joueur dans la file si l'adversaire s'est déconnecté
+            if "déconnecté" in error_msg.lower():
+                self.player = None
+                self.move_sent_at = None
+                self.queued_at = time.perf_counter()
+
+        return True
+
+    async def play_turn(self) -> bool:
+        """Joue un coup ; retourne False si le bot décide de se déconnecter"""
+        if self.disconnect_rate and random.random() < self.disconnect_rate:
+            return False
+
+        if getattr(self.policy, "cpu_bound", False):
+            board = [line[:] for line in self.board]
+            col = await asyncio.get_running_loop().run_in_executor(
+                None, self.policy.choose_column, board, self.player
+            )
+        else:
+            col = self.policy.choose_column(self.board, self.player)
+        if col is None:
+            return True
+        self.move_sent_at = time.perf_counter()
+        if not await send_message_async(self.writer, create_play_turn_message(landing_row(self.board, col), col)):
+            raise ConnectionError("envoi du coup impossible")
+        self.stats.moves_played += 1
+
+        if self.chat_rate and random.random() < self.chat_rate:
+            await send_message_async(self.writer, create_chat_message(self.username, random.choice(BOT_CHAT_MESSAGES)))
+            self.stats.chats_sent += 1
+        return True
+
+class LoadGenerator:
+    """Lance N bots dans une même boucle asyncio et agrège leurs mesures"""
+
+    def __init__(self, host: str, port: int, players: int, policy: str = "random",
+                 chat_rate: float = 0.0, disconnect_rate: float = 0.0,
+                 reconnect_delay: float = 1.0, ramp_up: float = 1.0,
+                 play_with_ai: bool = False, name_prefix: str = "bot"):
+        self.host = host
+        self.port = port
+        self.players = players
+        self.policy = policy
+        self.chat_rate = chat_rate
+        self.disconnect_rate = disconnect_rate
+        self.reconnect_delay = reconnect_delay
+        self.ramp_up = ramp_up
+        self.play_with_ai = play_with_ai
+        self.name_prefix = name_prefix
+        self.stats = BotStats()
+
+    async def run(self, duration: float, report_interval: Optional[float] = None, report=print) -> Dict:
+        """
+        Fait tourner les bots pendant duration secondes.
+
+        Args:
+            duration: Durée du test en secondes
+            report_interval: Si défini, appelle report(snapshot) à cet intervalle
+            report: Fonction recevant les résumés intermédiaires
+
+        Returns:
+            Résumé final des mesures
+        """
+        stop_event = asyncio.Event()
+        tasks = []
+        for i in range(self.players):
+            bot = BotClient(
+                f"{self.name_prefix}-{os.getpid()}-{i:05d}",
+                self.host,
+                self.port,
+                POLICIES[self.policy](),  # Une instance par bot : certaines politiques ont un état
+                self.stats,
+                chat_rate=self.chat_rate,
+                disconnect_rate=self.disconnect_rate,
+                reconnect_delay=self.reconnect_delay,
+                play_with_ai=self.play_with_ai
+            )
+            tasks.append(asyncio.create_task(bot.run(stop_event)))
+            # Étaler les connexions sur la durée de montée en charge
+            if self.ramp_up and self.players > 1:
+                await asyncio.sleep(self.ramp_up / self.players)
+
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(min(report_interval or duration, max(0.0, deadline - time.perf_counter())))
+            if report_interval:
+                report(self.stats.snapshot())
+
+        stop_event.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        return self.stats.snapshot()
+
+def main():
+    parser = argparse.ArgumentParser(description="Générateur de charge : joueurs Puissance 4 simulés")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--players", type=int, default=100, help="Nombre de joueurs simulés")
+    parser.add_argument("--duration", type=float, default=60.0, help="Durée du test en secondes")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--chat-rate", type=float, default=0.05, help="Probabilité d'envoyer un message par coup")
+    parser.add_argument("--disconnect-rate", type=float, default=0.0, help="Probabilité de se déconnecter par coup")
+    parser.add_argument("--reconnect-delay", type=float, default=1.0, help="Délai moyen avant reconnexion (s)")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Durée de montée en charge (s)")
+    parser.add_argument("--ai", action="store_true", help="Accepter les parties contre l'IA")
+    parser.add_argument("--report-interval", type=float, default=None, help="Afficher un résumé JSON à cet intervalle (s)")
+    args = parser.parse_args()
+
+    # Les journaux par message rendraient le test illisible
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    generator = LoadGenerator(
+        args.host,
+        args.port,
+        args.players,
+        policy=args.policy,
+        chat_rate=args.chat_rate,
+        disconnect_rate=args.disconnect_rate,
+        reconnect_delay=args.reconnect_delay,
+        ramp_up=args.ramp_up,
+        play_with_ai=args.ai
+    )
+    report = lambda snapshot: print(json.dumps(snapshot), flush=True)
+    result = asyncio.run(generator.run(args.duration, args.report_interval, report))
+    print(json.dumps(result, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import time
+import tkinter as tk
+from collections import deque
+
+class ChatLog:
+    """
+    Historique de discussion affiché dans un widget Text.
+
+    Les messages sont mis en attente puis insérés ensemble au prochain flush (une
+    seule insertion et un seul défilement par intervalle de l'interface), et le
+    widget est limité à max_messages messages : les plus anciens sont retirés du haut.
+    """
+
+    def __init__(self, text_widget: tk.Text, max_messages: int = 200):
+        self.text = text_widget
+        self.max_messages = max_messages
+        # Anneau des messages affichés : (expéditeur, message, tag, heure)
+        self.history = deque(maxlen=max_messages)
+        # Nombre de lignes occupées par chaque message affiché, dans l'ordre
+        self.line_counts = deque()
+        self.pending = []
+
+    def add(self, sender: str, message: str, tag: str = "other"):
+        """Met un message en attente d'affichage"""
+        self.pending.append((sender, message, tag, time.strftime("%H:%M")))
+
+    def format_message(self, sender: str, message: str, tag: str, current_time: str):
+        """Retourne les fragments (texte, tags) d'un message et son nombre de lignes"""
+        # Un peu d'espace vertical entre les messages
+        chunks = [("\n", tag), (f"[{current_time}] ", "timestamp")]
+
+        # Différencier visuellement les types de messages
+        if tag == "system":
+            chunks.append(("SYSTÈME\n", ("bold", "system")))
+            chunks.append((f"  {message}\n", "system"))
+            # Ligne de séparation discrète
+            chunks.append(("─" * 30 + "\n", "timestamp"))
+        elif tag == "self":
+            chunks.append(("VOUS\n", ("bold", "self")))
+            chunks.append((f"  {message}\n", "self"))
+        else:
+            chunks.append((f"{sender}\n", ("bold", "other")))
+            chunks.append((f"  {message}\n", "other"))
+
+        lines = sum(text.count("\n") for text, _ in chunks)
+        return chunks, lines
+
+    def flush(self):
+        """Insère tous les messages en attente en une fois, puis retire le surplus en haut"""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending[-self.max_messages:], []
+
+        args = []
+        for entry in pending:
+            chunks, lines = self.format_message(*entry)
+            for text, tags in chunks:
+                args.extend((text, tags))
+            self.history.append(entry)
+            self.line_counts.append(lines)
+
+        self.text.config(state=tk.NORMAL)
+        self.text.insert(tk.END, *args)
+
+        # Retirer les messages les plus anciens au-delà de la limite
+        excess_lines = 0
+        while len(self.line_counts) > self.max_messages:
+            excess_lines += self.line_counts.popleft()
+        if excess_lines:
+            self.text.delete("1.0", f"{excess_lines + 1}.0")
+
+        # Faire défiler jusqu'au dernier message
+        self.text.see(tk.END)
+        self.text.config(state=tk.DISABLED)
+
+    def clear(self):
+        """Efface l'historique et le widget"""
+        self.pending = []
+        self.history.clear()
+        self.line_counts.clear()
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.config(state=tk.DISABLED)
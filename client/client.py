@@ -1,16 +1,21 @@
+import time
+
+# Début du démarrage, pour le mode --profile-startup
+_PROCESS_START = time.perf_counter()
+
 import socket
-import json
+import argparse
 import tkinter as tk
-from tkinter import messagebox, scrolledtext, ttk, font
+from tkinter import messagebox, font
 import threading
+import queue
 import logging
 import sys
 import os
-import time
-import math
 
 # Ajouter le répertoire parent au PYTHONPATH
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# (en tête de liste pour que le paquet "client" soit prioritaire sur ce script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.protocol import (
     MessageType,
@@ -20,16 +25,48 @@ from shared.protocol import (
     receive_message,
     create_chat_message
 )
+from client.animation import AnimationScheduler
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('client.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Les modules utilisés seulement une fois connecté (shared.game, client.chat,
+# tkinter.scrolledtext) sont importés à la demande pour accélérer le démarrage
+
+_IMPORTS_DONE = time.perf_counter()
+
+def setup_logging():
+    """Configure le logging (appelé au lancement, pas à l'import du module)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('client.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+# Polices par rôle : (famille, taille) par ordre de préférence, et graisse
+FONT_CHOICES = {
+    "title": ([("Montserrat", 24), ("Segoe UI", 22), ("Helvetica", 20)], "bold"),
+    "subtitle": ([("Montserrat", 16), ("Segoe UI", 16), ("Helvetica", 14)], "bold"),
+    "text": ([("Roboto", 12), ("Segoe UI", 12), ("Helvetica", 12)], "normal"),
+    "button": ([("Roboto", 12), ("Segoe UI", 12), ("Helvetica", 12)], "bold"),
+    "chat": ([("Roboto", 11), ("Segoe UI", 11), ("Helvetica", 11)], "normal"),
+}
+
+# Familles disponibles, lues une seule fois (font.families() est coûteux)
+_available_font_families = None
+
+def resolve_font(root, choices):
+    """Retourne la première (famille, taille) disponible, ou la dernière en dernier recours"""
+    global _available_font_families
+    if _available_font_families is None:
+        _available_font_families = set(font.families(root))
+    for family, size in choices:
+        if family in _available_font_families:
+            return family, size
+    return choices[-1]
+
+# Message local déposé dans la file de réception quand la connexion est perdue
+CONNECTION_LOST = "_CONNECTION_LOST"
 
 # Fonction utilitaire pour dessiner des rectangles arrondis
 def rounded_rectangle(canvas, x1, y1, x2, y2, radius=25, **kwargs):
@@ -64,6 +101,20 @@ class Puissance4Client:
         self.COLS = 7  # Nombre de colonnes pour le Puissance 4
         self.queue_size = 0  # Nombre de joueurs en attente
         
+        # Copie locale de la partie : les coups y sont appliqués sans attendre le serveur,
+        # puis confirmés ou annulés à la réception de la réponse (voir reconcile_move)
+        self.local_game = None
+        self.move_seq = 0  # Numéro du dernier coup envoyé
+        self.pending_move = None  # (numéro, état avant le coup) du coup en attente de confirmation
+        
+        # Analyse de la position dans un processus séparé (voir client/analysis.py),
+        # démarrée seulement quand le joueur active le panneau
+        self.analyzer = None
+        self.analysis_enabled = False
+        self.analysed_position = None  # Position en cours d'analyse (plateau, joueur au trait)
+        self.ANALYSIS_TICK_MS = 50  # Intervalle de lecture des résultats de l'analyse
+        self.analysis_after_id = None  # Prochaine lecture programmée (une seule à la fois)
+        
         # Couleurs pour les jetons et l'UI - Version plus moderne
         self.EMPTY_COLOR = "#f5f5f5"  # Blanc plus lumineux
         self.P1_COLOR = "#e74c3c"     # Rouge
@@ -88,36 +139,33 @@ class Puissance4Client:
         self.root.configure(bg=self.BG_COLOR)
         self.root.resizable(False, False)
         
+        # Ordonnanceur unique de toutes les animations (voir client/animation.py)
+        self.animations = AnimationScheduler(self.root)
+        
         # Essayer de définir l'icône de l'application
         try:
             self.root.iconbitmap("icon.ico")
         except:
             pass  # Ignorer si l'icône n'est pas trouvée
         
-        # Chargement des polices
-        try:
-            # Polices modernes
-            self.title_font = font.Font(family="Montserrat", size=24, weight="bold")
-            self.subtitle_font = font.Font(family="Montserrat", size=16, weight="bold")
-            self.text_font = font.Font(family="Roboto", size=12)
-            self.button_font = font.Font(family="Roboto", size=12, weight="bold")
-            self.chat_font = font.Font(family="Roboto", size=11)
-        except:
-            try:
-                # Fallback sur Segoe UI
-                self.title_font = font.Font(family="Segoe UI", size=22, weight="bold")
-                self.subtitle_font = font.Font(family="Segoe UI", size=16, weight="bold")
-                self.text_font = font.Font(family="Segoe UI", size=12)
-                self.button_font = font.Font(family="Segoe UI", size=12, weight="bold")
-                self.chat_font = font.Font(family="Segoe UI", size=11)
-            except:
-                # Fallback final sur Helvetica
-                self.title_font = font.Font(family="Helvetica", size=20, weight="bold")
-                self.subtitle_font = font.Font(family="Helvetica", size=14, weight="bold")
-                self.text_font = font.Font(family="Helvetica", size=12)
-                self.button_font = font.Font(family="Helvetica", size=12, weight="bold")
-                self.chat_font = font.Font(family="Helvetica", size=11)
+        # Polices et écran de jeu construits à la demande, après la connexion
+        self.fonts_loaded = False
+        self.game_container = None
+        
+        # Écran d'accueil
+        self.build_login_screen()
+        
+        # Thread pour recevoir les messages du serveur
+        self.receive_thread = None
+        
+        # File des messages reçus : remplie par le thread réseau, vidée par la boucle Tk
+        self.inbound_messages = queue.Queue()
+        self.INBOUND_TICK_MS = 16  # Intervalle de traitement des messages reçus
+        self.MAX_MESSAGES_PER_TICK = 32  # Nombre maximal de messages traités par intervalle
+        self.root.after(self.INBOUND_TICK_MS, self.process_inbound_messages)
         
+    def build_login_screen(self):
+        """Construit l'écran d'accueil (pseudo, option IA, bouton JOUER)"""
         # Frame principale avec ombre portée
         self.main_frame = tk.Frame(self.root, bg=self.BG_COLOR)
         self.main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
@@ -155,7 +203,7 @@ class Puissance4Client:
         
         def animate_heart():
             if not hasattr(self, 'heart_label') or not self.heart_label.winfo_exists():
-                return
+                return False
             current_size = int(self.heart_label.cget("font").split(" ")[1])
             if current_size == 14:
                 self.heart_label.config(
@@ -167,10 +215,10 @@ class Puissance4Client:
                     font=("Montserrat", 14, "bold"),
                     fg="#ff6b6b"
                 )
-            self.root.after(600, animate_heart)
+            return True
         
         # Démarrer l'animation du cœur
-        self.root.after(1000, animate_heart)
+        self.animations.every(0.6, animate_heart, tag="heart", delay=1.0)
         
         # Logo ou titre stylisé
         title_frame = tk.Frame(self.login_frame, bg=self.FRAME_COLOR)
@@ -298,6 +346,28 @@ class Puissance4Client:
         )
         self.queue_info.pack(pady=15)
         
+    def load_fonts(self):
+        """Crée les polices de l'écran de jeu (familles résolues une seule fois)"""
+        if self.fonts_loaded:
+            return
+        fonts = {}
+        for role, (choices, weight) in FONT_CHOICES.items():
+            family, size = resolve_font(self.root, choices)
+            fonts[role] = font.Font(family=family, size=size, weight=weight)
+        self.title_font = fonts["title"]
+        self.subtitle_font = fonts["subtitle"]
+        self.text_font = fonts["text"]
+        self.button_font = fonts["button"]
+        self.chat_font = fonts["chat"]
+        self.fonts_loaded = True
+        
+    def build_game_screen(self):
+        """Construit l'écran de jeu et le chat (appelé à la première connexion réussie)"""
+        from tkinter import scrolledtext
+        from client.chat import ChatLog
+        
+        self.load_fonts()
+        
         # Frame de jeu (initialement cachée)
         self.game_container = tk.Frame(self.main_frame, bg=self.BG_COLOR)
         # Elle sera affichée avec .pack() lorsque le joueur sera dans une partie
@@ -354,6 +424,22 @@ class Puissance4Client:
         )
         self.reconnect_button.pack(side=tk.RIGHT, padx=15)
         
+        # Bouton d'affichage de l'analyse (scores par colonne sous le plateau)
+        self.analysis_button = tk.Button(
+            self.game_info_frame,
+            text="ANALYSE",
+            command=self.toggle_analysis,
+            bg=self.FRAME_COLOR,
+            fg=self.TEXT_COLOR,
+            font=self.button_font,
+            relief=tk.FLAT,
+            padx=10,
+            pady=5,
+            bd=0,
+            cursor="hand2"
+        )
+        self.analysis_button.pack(side=tk.RIGHT, padx=5)
+        
         # Plateau de jeu
         self.board_frame = tk.Frame(self.game_frame, bg=self.FRAME_COLOR)
         self.board_frame.pack(expand=True, fill=tk.BOTH, padx=15, pady=(0, 15))
@@ -379,11 +465,19 @@ class Puissance4Client:
         self.board_canvas.bind("<Motion>", self.on_mouse_move)
         self.board_canvas.bind("<Button-1>", self.on_canvas_click)
         
-        # Variable pour stocker l'ID du jeton fantôme et ses composants
+        # Éléments du canvas créés une seule fois, puis recolorés (voir draw_board)
+        self.cell_items = None
+        self.rendered_board = None
+        
+        # Jeton fantôme (créé une seule fois avec le plateau, puis déplacé) et ses composants
         self.ghost_token = None
         self.ghost_components = []
+        self.ghost_color = None
         self.current_col = -1
         
+        # Nombre de jetons par colonne, tenu à jour par draw_board
+        self.column_heights = [0] * self.COLS
+        
         # Frame droite (chat)
         self.chat_container = tk.Frame(self.game_container, bg=self.FRAME_COLOR, bd=0, relief=tk.FLAT, width=320)
         self.chat_container.pack(side=tk.RIGHT, fill=tk.BOTH, padx=10, pady=10)
@@ -434,11 +528,17 @@ class Puissance4Client:
         )
         
         # Configurer les styles de texte pour les messages
-        self.chat_display.tag_configure("bold", font=font.Font(family="Roboto", size=11, weight="bold"))
+        chat_family = self.chat_font.cget("family")
+        self.chat_display.tag_configure("bold", font=font.Font(family=chat_family, size=11, weight="bold"))
         self.chat_display.tag_configure("system", foreground="#3498db")  # Messages système en bleu
         self.chat_display.tag_configure("self", foreground="#2ecc71")    # Nos messages en vert
         self.chat_display.tag_configure("other", foreground="#e74c3c")   # Messages des autres en rouge
-        self.chat_display.tag_configure("timestamp", foreground="#888888", font=font.Font(family="Roboto", size=9))
+        self.chat_display.tag_configure("timestamp", foreground="#888888", font=font.Font(family=chat_family, size=9))
+        
+        # Historique borné, rendu par lots (voir add_chat_message)
+        self.CHAT_MAX_MESSAGES = 200
+        self.chat_log = ChatLog(self.chat_display, self.CHAT_MAX_MESSAGES)
+        self.chat_flush_scheduled = False
         
         # Zone de saisie des messages
         self.input_frame = tk.Frame(self.chat_container, bg=self.FRAME_COLOR, height=80)
@@ -487,9 +587,6 @@ class Puissance4Client:
         self.send_button.bind("<Enter>", lambda e: self.send_button.config(bg=self.HIGHLIGHT_COLOR))
         self.send_button.bind("<Leave>", lambda e: self.send_button.config(bg=self.BUTTON_COLOR))
         
-        # Thread pour recevoir les messages du serveur
-        self.receive_thread = None
-        
     def connect(self):
         """Établit la connexion avec le serveur"""
         try:
@@ -521,7 +618,9 @@ class Puissance4Client:
             messagebox.showerror("Erreur", "Impossible d'envoyer le message au serveur")
             return
         
-        # Cacher l'écran de login et afficher l'écran de jeu
+        # Cacher l'écran de login et afficher l'écran de jeu (construit à la première connexion)
+        if self.game_container is None:
+            self.build_game_screen()
         self.login_frame.pack_forget()
         self.game_container.pack(expand=True, fill=tk.BOTH, padx=10, pady=10)
         
@@ -536,7 +635,7 @@ class Puissance4Client:
         self.add_chat_message("Système", "Connexion au serveur réussie. En attente d'un adversaire...", "system")
         
         # Démarrer le thread de réception
-        self.receive_thread = threading.Thread(target=self.receive_messages)
+        self.receive_thread = threading.Thread(target=self.receive_messages, args=(self.socket,))
         self.receive_thread.daemon = True
         self.receive_thread.start()
         
@@ -553,6 +652,8 @@ class Puissance4Client:
             
             # Réinitialiser l'état du jeu
             self.game = None
+            self.local_game = None
+            self.pending_move = None
             self.is_my_turn = False
             self.player = None
             
@@ -578,7 +679,7 @@ class Puissance4Client:
             self.draw_board()
             
             # Démarrer le thread de réception
-            self.receive_thread = threading.Thread(target=self.receive_messages)
+            self.receive_thread = threading.Thread(target=self.receive_messages, args=(self.socket,))
             self.receive_thread.daemon = True
             self.receive_thread.start()
             
@@ -586,25 +687,28 @@ class Puissance4Client:
             logging.error(f"Erreur lors de la reconnexion: {e}")
             messagebox.showerror("Erreur", "Une erreur est survenue lors de la reconnexion")
         
-    def receive_messages(self):
-        """Reçoit les messages du serveur"""
+    def receive_messages(self, sock: socket.socket):
+        """
+        Reçoit les messages du serveur sur le thread réseau.
+        
+        Ce thread ne touche jamais aux widgets Tk : il dépose les messages dans
+        inbound_messages, que process_inbound_messages traite sur le thread principal.
+        """
         try:
             while True:
                 try:
-                    message = receive_message(self.socket)
+                    message = receive_message(sock)
                     if not message:
                         logging.error("Connexion perdue avec le serveur")
-                        self.root.after(0, lambda: messagebox.showerror("Erreur", "Connexion perdue avec le serveur"))
-                        self.root.after(0, lambda: self.reconnect_button.config(state=tk.NORMAL))
+                        self.inbound_messages.put((sock, {"type": CONNECTION_LOST}))
                         break
                         
                     logging.info(f"Message reçu: {message}")  # Log de debug
-                    self.handle_server_message(message)
+                    self.inbound_messages.put((sock, message))
                     
                 except socket.error as e:
                     logging.error(f"Erreur de socket: {e}")
-                    self.root.after(0, lambda: messagebox.showerror("Erreur", "Connexion perdue avec le serveur"))
-                    self.root.after(0, lambda: self.reconnect_button.config(state=tk.NORMAL))
+                    self.inbound_messages.put((sock, {"type": CONNECTION_LOST}))
                     break
                     
                 except Exception as e:
@@ -615,26 +719,65 @@ class Puissance4Client:
             logging.error(f"Erreur fatale: {e}")
         finally:
             try:
-                self.socket.close()
+                sock.close()
             except:
                 pass
+                
+    def process_inbound_messages(self):
+        """
+        Traite, sur le thread principal, les messages reçus depuis le dernier passage.
+        
+        Au plus MAX_MESSAGES_PER_TICK messages sont traités par passage, et les
+        GAME_UPDATE consécutifs sont fusionnés : seul le plus récent est affiché.
+        Un GAME_UPDATE sauté qui confirme notre coup (seq) est tout de même
+        rapproché de la prédiction, sinon pending_move ne serait jamais libéré.
+        """
+        batch = []
+        try:
+            while len(batch) < self.MAX_MESSAGES_PER_TICK:
+                sock, message = self.inbound_messages.get_nowait()
+                # Ignorer les messages d'une connexion remplacée (reconnexion, nouvelle partie)
+                if sock is self.socket:
+                    batch.append(message)
+        except queue.Empty:
+            pass
+            
+        try:
+            for index, message in enumerate(batch):
+                if (message.get("type") == MessageType.GAME_UPDATE.value
+                        and index + 1 < len(batch)
+                        and batch[index + 1].get("type") == MessageType.GAME_UPDATE.value):
+                    if message.get("seq") is not None:
+                        self.reconcile_move(message["seq"], message.get("board"), message.get("current_player"))
+                    continue
+                self.handle_server_message(message)
+        finally:
+            self.root.after(self.INBOUND_TICK_MS, self.process_inbound_messages)
             
     def handle_server_message(self, message: dict):
-        """Traite les messages reçus du serveur"""
+        """Traite les messages reçus du serveur (appelé sur le thread principal)"""
         try:
             msg_type = message.get("type")
             print(f">> Message reçu de type: {msg_type}")  # Log de debug
             logging.info(f"Message reçu du serveur: {message}")
             
-            if msg_type == MessageType.QUEUE_UPDATE.value:
+            if msg_type == CONNECTION_LOST:
+                self.root.after(0, lambda: messagebox.showerror("Erreur", "Connexion perdue avec le serveur"))
+                self.reconnect_button.config(state=tk.NORMAL)
+                
+            elif msg_type == MessageType.QUEUE_UPDATE.value:
                 # Mise à jour du nombre de joueurs en attente
                 queue_size = message.get("queue_size", 0)
                 plural = "s" if queue_size > 1 else ""
                 self.queue_info.config(text=f"{queue_size} joueur{plural} en attente")
                 
             elif msg_type == MessageType.START_MATCH.value:
+                self.animations.cancel_tag("drop")
                 self.player = message.get("player")
-                self.game = message.get("board")
+                self.local_game = self.new_local_game()
+                self.local_game.set_board(message.get("board"))
+                self.game = self.local_game.board
+                self.pending_move = None
                 self.is_my_turn = self.player == 1
                 opponent = message.get("opponent", "Adversaire")
                 
@@ -648,17 +791,25 @@ class Puissance4Client:
                     self.status_label.config(text=f"Match contre {opponent} - Tour de l'adversaire", fg="white")
                 
                 # Effacer le chat au début d'une nouvelle partie
-                self.chat_display.config(state=tk.NORMAL)
-                self.chat_display.delete(1.0, tk.END)
-                self.chat_display.config(state=tk.DISABLED)
+                self.chat_log.clear()
                 
                 self.draw_board()
                 self.add_chat_message("Système", f"Match commencé contre {opponent}", "system")
                 logging.info(f"Match commencé contre {opponent} en tant que joueur {self.player}")
                 
             elif msg_type == MessageType.GAME_UPDATE.value:
-                self.game = message.get("board")
+                # L'état du serveur remplace toute animation de chute en cours, sauf s'il
+                # confirme notre coup prédit : la chute déjà lancée reste alors exacte
                 current_player = message.get("current_player")
+                confirms_prediction = (
+                    self.pending_move is not None
+                    and message.get("seq") == self.pending_move[0]
+                    and self.local_game is not None
+                    and message.get("board") == self.local_game.board
+                )
+                if not confirms_prediction:
+                    self.animations.cancel_tag("drop")
+                self.reconcile_move(message.get("seq"), message.get("board"), current_player)
                 self.is_my_turn = current_player == self.player
                 
                 # Mettre à jour l'interface
@@ -685,6 +836,10 @@ class Puissance4Client:
                     self.add_chat_message("Système", "Match nul !", "system")
                 
                 self.is_my_turn = False
+                self.pending_move = None
+                if self.local_game:
+                    self.local_game.game_over = True
+                    self.local_game.winner = winner
                 self.draw_board()
                 
                 # Proposer une nouvelle partie
@@ -705,13 +860,16 @@ class Puissance4Client:
                 print(f">> Message de chat reçu: {sender}: {msg}")  # Log de debug
                 logging.info(f"Message de chat reçu: {sender}: {msg}")
                 
-                # Traiter le message de chat sur le thread principal pour éviter les problèmes d'UI
-                self.root.after(0, lambda: self.add_chat_message(sender, msg, "other"))
+                self.add_chat_message(sender, msg, "other")
                 
             elif msg_type == MessageType.ERROR.value:
                 error_msg = message.get("message", "Erreur inconnue")
                 logging.error(f"Message d'erreur reçu: {error_msg}")
                 
+                # Coup refusé par le serveur : annuler la prédiction locale
+                if self.pending_move and message.get("seq") == self.pending_move[0]:
+                    self.rollback_move()
+                
                 # Si l'adversaire s'est déconnecté, proposer de rejouer
                 if "déconnecté" in error_msg.lower():
                     self.add_chat_message("Système", "L'adversaire s'est déconnecté", "system")
@@ -723,9 +881,9 @@ class Puissance4Client:
                         command=lambda response: self.new_game() if response else None
                     ))
                 else:
-                    # Afficher l'erreur sur le thread principal
+                    # La boîte de dialogue est modale : l'ouvrir après le traitement des messages en cours
+                    self.add_chat_message("Système", f"Erreur: {error_msg}", "system")
                     self.root.after(0, lambda: messagebox.showerror("Erreur", error_msg))
-                    self.root.after(0, lambda: self.add_chat_message("Système", f"Erreur: {error_msg}", "system"))
                 
         except Exception as e:
             print(f"Erreur dans handle_server_message: {e}")  # Log de debug
@@ -745,6 +903,8 @@ class Puissance4Client:
             
             # Réinitialiser l'état du jeu
             self.game = None
+            self.local_game = None
+            self.pending_move = None
             self.is_my_turn = False
             self.player = None
             
@@ -768,15 +928,13 @@ class Puissance4Client:
             self.add_chat_message("Système", "En attente d'un adversaire...", "system")
             
             # Effacer le chat
-            self.chat_display.config(state=tk.NORMAL)
-            self.chat_display.delete(1.0, tk.END)
-            self.chat_display.config(state=tk.DISABLED)
+            self.chat_log.clear()
             
             # Redessiner le plateau vide
             self.draw_board()
             
             # Démarrer le thread de réception
-            self.receive_thread = threading.Thread(target=self.receive_messages)
+            self.receive_thread = threading.Thread(target=self.receive_messages, args=(self.socket,))
             self.receive_thread.daemon = True
             self.receive_thread.start()
             
@@ -785,56 +943,34 @@ class Puissance4Client:
             messagebox.showerror("Erreur", "Une erreur est survenue lors du redémarrage de la partie")
             
     def add_chat_message(self, sender: str, message: str, tag="other"):
-        """Ajoute un message dans la zone de chat avec un style moderne et élégant"""
+        """
+        Ajoute un message dans la zone de chat.
+        
+        Le message est mis en attente : tous les messages ajoutés pendant le même
+        passage de la boucle Tk sont insérés ensemble par flush_chat.
+        """
         try:
             # Vérifier que les widgets existent
-            if not hasattr(self, 'chat_display'):
-                print("Erreur: chat_display n'existe pas")
+            if not hasattr(self, 'chat_log'):
+                print("Erreur: chat_log n'existe pas")
                 return
                 
-            self.chat_display.config(state=tk.NORMAL)
-            
-            # Ajouter l'horodatage
-            current_time = time.strftime("%H:%M")
-            
-            # Insérer un peu d'espace vertical entre les messages
-            self.chat_display.insert(tk.END, "\n", tag)
-            
-            # Différencier visuellement les types de messages
-            if tag == "system":
-                # Message système
-                self.chat_display.insert(tk.END, f"[{current_time}] ", "timestamp")
-                self.chat_display.insert(tk.END, f"SYSTÈME\n", ("bold", "system"))
-                
-                # Insérer le message avec une indentation
-                self.chat_display.insert(tk.END, f"  {message}\n", "system")
-                
-                # Ajouter une ligne de séparation discrète
-                self.chat_display.insert(tk.END, "─" * 30 + "\n", "timestamp")
-                
-            elif tag == "self":
-                # Message de l'utilisateur
-                self.chat_display.insert(tk.END, f"[{current_time}] ", "timestamp")
-                self.chat_display.insert(tk.END, f"VOUS\n", ("bold", "self"))
-                
-                # Créer une bulle de message
-                self.chat_display.insert(tk.END, f"  {message}\n", "self")
-                
-            else:
-                # Message d'un autre joueur
-                self.chat_display.insert(tk.END, f"[{current_time}] ", "timestamp")
-                self.chat_display.insert(tk.END, f"{sender}\n", ("bold", "other"))
-                
-                # Créer une bulle de message
-                self.chat_display.insert(tk.END, f"  {message}\n", "other")
-            
-            # Faire défiler jusqu'au dernier message
-            self.chat_display.see(tk.END)
-            self.chat_display.config(state=tk.DISABLED)
+            self.chat_log.add(sender, message, tag)
+            if not self.chat_flush_scheduled:
+                self.chat_flush_scheduled = True
+                self.root.after_idle(self.flush_chat)
             
         except Exception as e:
             print(f"Erreur dans add_chat_message: {e}")
             
+    def flush_chat(self):
+        """Affiche les messages de chat en attente"""
+        self.chat_flush_scheduled = False
+        try:
+            self.chat_log.flush()
+        except Exception as e:
+            print(f"Erreur dans flush_chat: {e}")
+            
     def send_chat_message(self):
         """Envoie un message de chat avec une interface améliorée"""
         if not self.socket or not self.username:
@@ -849,17 +985,8 @@ class Puissance4Client:
             logging.info(f"Envoi du message de chat: {message}")
             chat_msg = create_chat_message(self.username, message)
             
-            # Essayer jusqu'à 3 fois d'envoyer le message
-            max_retries = 3
-            result = False
-            
-            for attempt in range(max_retries):
-                result = send_message(self.socket, chat_msg)
-                if result:
-                    break
-                time.sleep(0.1)  # Petite pause avant de réessayer
-                
-            if result:
+            # Un seul envoi : une attente ici figerait l'interface (thread principal Tk)
+            if send_message(self.socket, chat_msg):
                 # Ajouter le message à notre propre chat
                 self.add_chat_message(self.username, message, "self")
                 # Vider la zone de saisie
@@ -872,39 +999,167 @@ class Puissance4Client:
             messagebox.showerror("Erreur", "Une erreur est survenue lors de l'envoi du message")
             
     def play_move(self, col: int):
-        """Joue un coup dans la colonne sélectionnée"""
-        if not self.is_my_turn or not self.game:
+        """
+        Joue un coup dans la colonne sélectionnée.
+        
+        Le coup est appliqué immédiatement sur la partie locale (même règle que le
+        serveur), puis envoyé avec un numéro de séquence ; la réponse du serveur le
+        confirme ou l'annule (voir reconcile_move et rollback_move).
+        """
+        if not self.is_my_turn or not self.game or not self.local_game:
             return
             
         try:
-            # Trouver la première position libre dans la colonne (de bas en haut)
-            row = -1
-            for r in range(self.ROWS - 1, -1, -1):
-                if self.game[r][col] == 0:
-                    row = r
-                    break
-                    
+            row = self.local_game.get_next_row(col)
             if row == -1:
                 # Colonne pleine
                 return
+                
+            # Mémoriser l'état avant le coup pour pouvoir l'annuler
+            snapshot = (
+                [line[:] for line in self.local_game.board],
+                self.local_game.current_player,
+                self.local_game.game_over,
+                self.local_game.winner
+            )
+            self.local_game.current_player = self.player
+            if not self.local_game.play_move(row, col):
+                return
             
             # Envoyer le message au serveur
-            message = create_play_turn_message(row, col)
+            self.move_seq += 1
+            self.pending_move = (self.move_seq, snapshot)
+            message = create_play_turn_message(row, col, self.move_seq)
             if not send_message(self.socket, message):
                 logging.error("Erreur lors de l'envoi du coup")
+                self.rollback_move()
                 messagebox.showerror("Erreur", "Impossible d'envoyer le coup au serveur")
                 return
                 
-            # Désactiver temporairement le plateau pendant l'envoi
+            # Désactiver le plateau jusqu'au coup de l'adversaire
             self.is_my_turn = False
             
-            # Animer la chute du jeton
+            # Animer la chute du jeton (le plateau prédit est affiché à l'arrivée)
             self.animate_token_drop(col, row)
             
         except Exception as e:
             logging.error(f"Erreur lors du coup: {e}")
             messagebox.showerror("Erreur", "Une erreur est survenue lors de l'envoi du coup")
             
+    def new_local_game(self):
+        """Crée la copie locale de la partie (moteur importé seulement à ce moment-là)"""
+        from shared.game import Puissance4Game
+        return Puissance4Game()
+        
+    def reconcile_move(self, seq, board, current_player):
+        """Aligne la partie locale sur l'état du serveur, qui fait toujours autorité"""
+        if self.pending_move and seq == self.pending_move[0]:
+            if board != self.local_game.board:
+                logging.warning(f"Prédiction du coup {seq} corrigée par le serveur")
+            self.pending_move = None
+            
+        if self.local_game is None:
+            self.local_game = self.new_local_game()
+        self.local_game.set_board(board, current_player)
+        self.game = self.local_game.board
+        
+    def rollback_move(self):
+        """Annule le coup prédit en attente et restaure l'état précédent"""
+        if not self.pending_move:
+            return
+        seq, (board, current_player, game_over, winner) = self.pending_move
+        logging.info(f"Annulation du coup prédit {seq}")
+        self.pending_move = None
+        self.local_game.set_board(board, current_player)
+        self.local_game.game_over = game_over
+        self.local_game.winner = winner
+        self.game = self.local_game.board
+        self.is_my_turn = current_player == self.player
+        self.draw_board()
+            
+    def toggle_analysis(self):
+        """Active ou désactive le panneau d'analyse"""
+        self.analysis_enabled = not self.analysis_enabled
+        state = tk.NORMAL if self.analysis_enabled else tk.HIDDEN
+        if self.cell_items is not None:
+            for item in self.analysis_items:
+                self.board_canvas.itemconfig(item, state=state)
+                
+        if self.analysis_enabled:
+            if self.analyzer is None:
+                from client.analysis import PositionAnalyzer
+                self.analyzer = PositionAnalyzer()
+            self.analysis_button.config(bg=self.BUTTON_COLOR)
+            self.analysed_position = None
+            self.update_analysis()
+            self.schedule_analysis_poll()
+        else:
+            if self.analysis_after_id is not None:
+                self.root.after_cancel(self.analysis_after_id)
+                self.analysis_after_id = None
+            self.analyzer.cancel()
+            self.analysed_position = None
+            self.show_analysis(None, {})
+            self.analysis_button.config(bg=self.FRAME_COLOR)
+            
+    def update_analysis(self):
+        """Relance l'analyse si la position affichée a changé (l'analyse précédente est annulée)"""
+        if not self.analysis_enabled or self.cell_items is None:
+            return
+            
+        if not self.game or not self.local_game or self.local_game.game_over:
+            if self.analysed_position is not None:
+                self.analyzer.cancel()
+                self.analysed_position = None
+                self.show_analysis(None, {})
+            return
+            
+        position = (tuple(tuple(line) for line in self.game), self.local_game.current_player)
+        if position == self.analysed_position:
+            return
+        self.analysed_position = position
+        self.show_analysis(None, {})
+        self.analyzer.analyse(self.game, self.local_game.current_player)
+        
+    def schedule_analysis_poll(self):
+        """Programme la prochaine lecture de l'analyse, en remplaçant celle déjà en attente"""
+        if self.analysis_after_id is not None:
+            self.root.after_cancel(self.analysis_after_id)
+        self.analysis_after_id = self.root.after(self.ANALYSIS_TICK_MS, self.poll_analysis)
+        
+    def poll_analysis(self):
+        """Affiche les derniers résultats de l'analyse (sur le thread principal)"""
+        self.analysis_after_id = None
+        if not self.analysis_enabled:
+            return
+        try:
+            for depth, scores, nodes, done in self.analyzer.poll():
+                if not done:
+                    self.show_analysis(depth, scores)
+        except Exception as e:
+            logging.error(f"Erreur lors de la lecture de l'analyse: {e}")
+        finally:
+            self.schedule_analysis_poll()
+            
+    def show_analysis(self, depth, scores):
+        """Affiche le score de chaque colonne, du point de vue du joueur au trait"""
+        from shared.search import WIN_SCORE
+        
+        best = max(scores.values()) if scores else None
+        for col, item in enumerate(self.analysis_items):
+            score = scores.get(col)
+            if score is None:
+                text = ""
+            elif score >= WIN_SCORE:
+                text = "gagne"
+            elif score <= -WIN_SCORE:
+                text = "perd"
+            else:
+                text = f"{score:+d}"
+            color = self.HIGHLIGHT_COLOR if score is not None and score == best else self.TEXT_COLOR
+            self.board_canvas.itemconfig(item, text=text, fill=color)
+        self.analysis_button.config(text=f"ANALYSE ({depth})" if depth else "ANALYSE")
+            
     def update_board(self):
         """Met à jour l'affichage du plateau"""
         if not self.game:
@@ -916,10 +1171,8 @@ class Puissance4Client:
         """Dessine un jeton sur le canvas"""
         canvas.config(bg=color)
                     
-    def draw_board(self):
-        """Dessine le plateau de jeu avec un style simplifié mais fonctionnel"""
-        self.board_canvas.delete("all")  # Effacer tout
-        
+    def create_board_items(self):
+        """Crée une seule fois les éléments du canvas (fond, trous et jetons de chaque case)"""
         # Dessiner le fond du plateau
         self.board_canvas.create_rectangle(
             15, 
@@ -932,7 +1185,7 @@ class Puissance4Client:
         )
         
         # Zone de sélection (partie supérieure)
-        selection_zone = self.board_canvas.create_rectangle(
+        self.board_canvas.create_rectangle(
             15, 
             15,
             15 + self.COLS * self.CELL_SIZE, 
@@ -941,15 +1194,16 @@ class Puissance4Client:
             outline="",
         )
         
-        # Dessiner les trous pour les jetons
+        # Pour chaque case : un cercle (trou ou jeton selon sa couleur) et un reflet masqué
+        self.cell_items = []
         for row in range(self.ROWS):
+            row_items = []
             for col in range(self.COLS):
                 # Calculer le centre du cercle
                 x = 15 + col * self.CELL_SIZE + self.CELL_SIZE // 2
                 y = 15 + (row + 1) * self.CELL_SIZE + self.CELL_SIZE // 2  # +1 pour l'espace de sélection
                 
-                # Dessiner le cercle (trou)
-                self.board_canvas.create_oval(
+                oval = self.board_canvas.create_oval(
                     x - self.TOKEN_RADIUS,
                     y - self.TOKEN_RADIUS,
                     x + self.TOKEN_RADIUS,
@@ -958,49 +1212,93 @@ class Puissance4Client:
                     outline="",
                     width=0
                 )
+                
+                # Reflet pour un effet 3D simple, visible seulement sur les jetons
+                highlight_radius = self.TOKEN_RADIUS * 0.5
+                highlight = self.board_canvas.create_oval(
+                    x - self.TOKEN_RADIUS * 0.6,
+                    y - self.TOKEN_RADIUS * 0.6,
+                    x - self.TOKEN_RADIUS * 0.6 + highlight_radius,
+                    y - self.TOKEN_RADIUS * 0.6 + highlight_radius,
+                    fill="white",
+                    outline="",
+                    stipple="gray50",  # Semi-transparent
+                    state=tk.HIDDEN
+                )
+                row_items.append((oval, highlight))
+            self.cell_items.append(row_items)
+            
+        # Scores de l'analyse, sous chaque colonne (masqués tant que l'analyse est désactivée)
+        self.analysis_items = []
+        for col in range(self.COLS):
+            x = 15 + col * self.CELL_SIZE + self.CELL_SIZE // 2
+            y = 15 + (self.ROWS + 1) * self.CELL_SIZE + 12
+            self.analysis_items.append(self.board_canvas.create_text(
+                x, y,
+                text="",
+                fill=self.TEXT_COLOR,
+                font=(self.chat_font.cget("family"), 9),
+                state=tk.NORMAL if self.analysis_enabled else tk.HIDDEN
+            ))
+            
+        # Contenu actuellement affiché par le canvas
+        self.rendered_board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.column_heights = [0] * self.COLS
         
-        # Dessiner les jetons si une partie est en cours
-        if self.game:
-            for row in range(self.ROWS):
-                for col in range(self.COLS):
-                    if self.game[row][col] != 0:
-                        self.draw_token(row, col, self.game[row][col])
-    
-    def draw_token(self, row, col, player):
-        """Dessine un jeton à la position spécifiée avec un style simple mais efficace"""
-        # Calculer le centre du jeton
-        x = 15 + col * self.CELL_SIZE + self.CELL_SIZE // 2
-        y = 15 + (row + 1) * self.CELL_SIZE + self.CELL_SIZE // 2  # +1 pour l'espace de sélection
-        
-        # Couleur du jeton
-        color = self.P1_COLOR if player == 1 else self.P2_COLOR
-        
-        # Créer des nuances pour l'effet 3D
-        darker = self.darken_color(color, 0.7)
-        
-        # Dessiner le cercle principal
-        token = self.board_canvas.create_oval(
-            x - self.TOKEN_RADIUS,
-            y - self.TOKEN_RADIUS,
-            x + self.TOKEN_RADIUS,
-            y + self.TOKEN_RADIUS,
-            fill=color,
-            outline=""
+        # Jeton fantôme, masqué tant que la souris ne survole pas une colonne jouable
+        self.ghost_token = self.board_canvas.create_oval(
+            0, 0, 0, 0,
+            fill=self.EMPTY_COLOR,
+            outline="",
+            stipple="gray25",  # Rend le jeton semi-transparent
+            state=tk.HIDDEN
         )
-        
-        # Ajouter un reflet pour un effet 3D simple
-        highlight_radius = self.TOKEN_RADIUS * 0.5
-        highlight = self.board_canvas.create_oval(
-            x - self.TOKEN_RADIUS * 0.6,
-            y - self.TOKEN_RADIUS * 0.6,
-            x - self.TOKEN_RADIUS * 0.6 + highlight_radius,
-            y - self.TOKEN_RADIUS * 0.6 + highlight_radius,
+        ghost_highlight = self.board_canvas.create_oval(
+            0, 0, 0, 0,
             fill="white",
             outline="",
-            stipple="gray50"  # Semi-transparent
+            stipple="gray12",  # Très transparent
+            state=tk.HIDDEN
         )
-        
-        return token
+        self.ghost_components = [self.ghost_token, ghost_highlight]
+        self.ghost_color = None
+                    
+    def draw_board(self):
+        """Met à jour le plateau affiché en ne modifiant que les cases qui ont changé"""
+        if self.cell_items is None:
+            self.create_board_items()
+            
+        for row in range(self.ROWS):
+            rendered_row = self.rendered_board[row]
+            board_row = self.game[row] if self.game else None
+            for col in range(self.COLS):
+                player = board_row[col] if board_row else 0
+                previous = rendered_row[col]
+                if player != previous:
+                    self.render_cell(row, col, player)
+                    rendered_row[col] = player
+                    # Avec la gravité, une case qui se remplit (ou se vide) change la hauteur de 1
+                    if previous == 0:
+                        self.column_heights[col] += 1
+                    elif player == 0:
+                        self.column_heights[col] -= 1
+                        
+        if not self.is_my_turn:
+            self.hide_ghost_token()
+            self.current_col = -1
+            
+        self.update_analysis()
+    
+    def render_cell(self, row, col, player):
+        """Recolore une case : trou vide (0) ou jeton du joueur 1 / 2"""
+        oval, highlight = self.cell_items[row][col]
+        if player == 0:
+            self.board_canvas.itemconfig(oval, fill=self.EMPTY_COLOR)
+            self.board_canvas.itemconfig(highlight, state=tk.HIDDEN)
+        else:
+            color = self.P1_COLOR if player == 1 else self.P2_COLOR
+            self.board_canvas.itemconfig(oval, fill=color)
+            self.board_canvas.itemconfig(highlight, state=tk.NORMAL)
         
     def darken_color(self, hex_color, factor=0.7):
         """Assombrit une couleur hexadécimale"""
@@ -1031,58 +1329,49 @@ class Puissance4Client:
         return f"#{rgb_lightened[0]:02x}{rgb_lightened[1]:02x}{rgb_lightened[2]:02x}"
         
     def show_ghost_token(self, col):
-        """Affiche un jeton fantôme simplifié au-dessus de la colonne où la souris se trouve"""
-        if not self.is_my_turn or col == -1 or col >= self.COLS:
+        """Place le jeton fantôme au-dessus de la colonne où la souris se trouve"""
+        if not self.is_my_turn or col == -1 or col >= self.COLS or self.cell_items is None:
             return
         
-        # Vérifier si la colonne est pleine
-        is_full = True
-        for row in range(self.ROWS):
-            if self.game and self.game[row][col] == 0:
-                is_full = False
-                break
-        
-        if is_full:
+        # Colonne pleine : pas de jeton fantôme
+        if self.column_heights[col] >= self.ROWS:
+            self.hide_ghost_token()
             return
-        
-        # Supprimer l'ancien jeton fantôme et ses composants
-        if self.ghost_token:
-            self.board_canvas.delete(self.ghost_token)
-            for item in self.ghost_components:
-                self.board_canvas.delete(item)
-            self.ghost_components = []
             
         # Calculer la position du jeton fantôme
         x = 15 + col * self.CELL_SIZE + self.CELL_SIZE // 2
         y = 15 + self.CELL_SIZE // 2  # Première ligne (zone de sélection)
+        ghost_highlight = self.ghost_components[1]
         
-        # Déterminer la couleur (celle du joueur actuel)
-        color = self.P1_COLOR if self.player == 1 else self.P2_COLOR
-        
-        # Dessiner le jeton fantôme principal (semi-transparent)
-        self.ghost_token = self.board_canvas.create_oval(
+        self.board_canvas.coords(
+            self.ghost_token,
             x - self.TOKEN_RADIUS,
             y - self.TOKEN_RADIUS,
             x + self.TOKEN_RADIUS,
-            y + self.TOKEN_RADIUS,
-            fill=color,
-            outline="",
-            stipple="gray25"  # Rend le jeton semi-transparent
+            y + self.TOKEN_RADIUS
         )
-        self.ghost_components.append(self.ghost_token)
-        
-        # Ajouter un reflet pour un effet 3D simple
         highlight_radius = self.TOKEN_RADIUS * 0.5
-        ghost_highlight = self.board_canvas.create_oval(
+        self.board_canvas.coords(
+            ghost_highlight,
             x - self.TOKEN_RADIUS * 0.6,
             y - self.TOKEN_RADIUS * 0.6,
             x - self.TOKEN_RADIUS * 0.6 + highlight_radius,
-            y - self.TOKEN_RADIUS * 0.6 + highlight_radius,
-            fill="white",
-            outline="",
-            stipple="gray12"  # Très transparent
+            y - self.TOKEN_RADIUS * 0.6 + highlight_radius
         )
-        self.ghost_components.append(ghost_highlight)
+        
+        # Déterminer la couleur (celle du joueur actuel)
+        color = self.P1_COLOR if self.player == 1 else self.P2_COLOR
+        if color != self.ghost_color:
+            self.board_canvas.itemconfig(self.ghost_token, fill=color)
+            self.ghost_color = color
+            
+        for item in self.ghost_components:
+            self.board_canvas.itemconfig(item, state=tk.NORMAL)
+            
+    def hide_ghost_token(self):
+        """Masque le jeton fantôme"""
+        for item in self.ghost_components:
+            self.board_canvas.itemconfig(item, state=tk.HIDDEN)
         
     def on_mouse_move(self, event):
         """Gère le mouvement de la souris sur le plateau de jeu"""
@@ -1098,10 +1387,8 @@ class Puissance4Client:
                 self.current_col = col
                 self.show_ghost_token(col)
         else:
-            # Hors du plateau, supprimer le jeton fantôme
-            if self.ghost_token:
-                self.board_canvas.delete(self.ghost_token)
-                self.ghost_token = None
+            # Hors du plateau, masquer le jeton fantôme
+            self.hide_ghost_token()
             self.current_col = -1
     
     def on_canvas_click(self, event):
@@ -1121,13 +1408,9 @@ class Puissance4Client:
         if not self.game:
             return
             
-        # Supprimer le jeton fantôme et ses composants
-        if self.ghost_token:
-            self.board_canvas.delete(self.ghost_token)
-            for item in self.ghost_components:
-                self.board_canvas.delete(item)
-            self.ghost_components = []
-            self.ghost_token = None
+        # Masquer le jeton fantôme
+        self.hide_ghost_token()
+        self.current_col = -1
             
         # Position finale du jeton
         final_y = 15 + (row + 1) * self.CELL_SIZE + self.CELL_SIZE // 2
@@ -1162,43 +1445,104 @@ class Puissance4Client:
         )
         
         # Animer la chute avec un effet simple
-        self.animate_drop(token, highlight, initial_y, final_y, 0)
+        self.animate_drop(token, highlight, initial_y, final_y)
         
-    def animate_drop(self, token, highlight, current_y, final_y, velocity):
-        """Anime la chute d'un jeton avec une animation simplifiée mais fonctionnelle"""
-        # Paramètres physiques
-        gravity = 0.8
+    def animate_drop(self, token, highlight, initial_y, final_y):
+        """Anime la chute d'un jeton (gravité et rebonds amortis), pilotée par l'ordonnanceur"""
+        # Paramètres physiques, en pixels et secondes
+        gravity = 3000.0
         bounce_damping = 0.6  # Facteur d'amortissement des rebonds
-        velocity += gravity  # Augmenter la vitesse avec la gravité
-        
-        # Calculer la nouvelle position
-        new_y = current_y + velocity
-        
-        # Si le jeton a atteint ou dépassé sa position finale
-        if new_y >= final_y:
-            # Rebond
-            new_y = final_y
-            velocity = -velocity * bounce_damping
+        min_bounce_speed = 60.0  # En dessous, le jeton s'arrête
+        substep = 1 / 120  # Pas d'intégration maximal, pour rester stable si des images sont sautées
+        state = {"y": initial_y, "velocity": 0.0}
+        
+        def step(dt):
+            y, velocity = state["y"], state["velocity"]
+            while dt > 0:
+                h = min(dt, substep)
+                dt -= h
+                velocity += gravity * h
+                y += velocity * h
+                # Si le jeton a atteint ou dépassé sa position finale : rebond
+                if y >= final_y:
+                    y = final_y
+                    velocity = -velocity * bounce_damping
+                    if abs(velocity) < min_bounce_speed:
+                        return False
+            # Déplacer le jeton et son reflet
+            dy = y - state["y"]
+            self.board_canvas.move(token, 0, dy)
+            self.board_canvas.move(highlight, 0, dy)
+            state["y"], state["velocity"] = y, velocity
+            return True
             
-            # Si la vitesse est très faible, arrêter l'animation
-            if abs(velocity) < 1:
-                self.board_canvas.delete(token)
-                self.board_canvas.delete(highlight)
-                self.update_board()  # Mettre à jour le plateau pour afficher le jeton final
-                return
-                
-        # Déplacer le jeton et son reflet
-        dy = new_y - current_y
-        self.board_canvas.move(token, 0, dy)
-        self.board_canvas.move(highlight, 0, dy)
-        
-        # Continuer l'animation
-        self.root.after(16, lambda: self.animate_drop(token, highlight, new_y, final_y, velocity))
+        def remove_items():
+            self.board_canvas.delete(token)
+            self.board_canvas.delete(highlight)
+            
+        def finish():
+            remove_items()
+            self.update_board()  # Mettre à jour le plateau pour afficher le jeton final
+            
+        self.animations.add(step, tag="drop", on_done=finish, on_cancel=remove_items)
 
     def run(self):
         """Lance l'interface"""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            if self.analyzer:
+                self.analyzer.stop()
 
-if __name__ == "__main__":
+def profile_startup():
+    """Mesure les étapes du démarrage jusqu'au premier affichage, puis quitte"""
+    import cProfile
+    import io
+    import pstats
+    
+    profiler = cProfile.Profile()
+    construct_start = time.perf_counter()
+    profiler.enable()
     client = Puissance4Client()
-    client.run() 
\ No newline at end of file
+    profiler.disable()
+    construct_end = time.perf_counter()
+    
+    # Premier affichage de l'écran d'accueil
+    client.root.update()
+    first_frame = time.perf_counter()
+    
+    # Coût de l'écran de jeu, différé jusqu'à la connexion
+    client.build_game_screen()
+    client.root.update_idletasks()
+    game_screen = time.perf_counter()
+    
+    print("Profil de démarrage (ms)")
+    print(f"  imports             {(_IMPORTS_DONE - _PROCESS_START) * 1000:8.1f}")
+    print(f"  construction        {(construct_end - construct_start) * 1000:8.1f}")
+    print(f"  premier affichage   {(first_frame - construct_end) * 1000:8.1f}")
+    print(f"  total               {(first_frame - _PROCESS_START) * 1000:8.1f}")
+    print(f"  écran de jeu (différé) {(game_screen - first_frame) * 1000:5.1f}")
+    
+    stats_output = io.StringIO()
+    pstats.Stats(profiler, stream=stats_output).sort_stats("cumulative").print_stats(15)
+    print(stats_output.getvalue())
+    client.root.destroy()
+
+def main():
+    parser = argparse.ArgumentParser(description="Client Puissance 4")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse du serveur")
+    parser.add_argument("--port", type=int, default=5000, help="Port du serveur")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Affiche le profil du démarrage puis quitte")
+    args = parser.parse_args()
+    
+    if args.profile_startup:
+        profile_startup()
+        return
+        
+    setup_logging()
+    client = Puissance4Client(args.host, args.port)
+    client.run()
+
+if __name__ == "__main__":
+    main() 
\ No newline at end of file
@@ -1,15 +1,27 @@
 import subprocess
 import time
+import json
 import os
 import sys
+import socket
+import logging
+import logging.handlers
 import tkinter as tk
 from tkinter import messagebox
 import threading
+from collections import deque
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LOG_DIR = os.path.join(BASE_DIR, "logs")
+CLUSTER_DIR = os.path.join(BASE_DIR, "cluster")
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 5000
+CLUSTER_BASE_PORT = 5100  # Ports des serveurs du mode cluster (distincts du jeu normal)
 
 def check_python_version():
     """Vérifie que la version de Python est compatible"""
-    if sys.version_info < (3, 6):
-        messagebox.showerror("Erreur", "Python 3.6 ou supérieur est requis pour exécuter ce jeu.")
+    if sys.version_info < (3, 10):
+        messagebox.showerror("Erreur", "Python 3.10 ou supérieur est requis pour exécuter ce jeu.")
         return False
     return True
 
@@ -34,48 +46,209 @@ def install_required_modules():
                 return False
     return True
 
-def start_server():
-    """Démarre le serveur en arrière-plan"""
+def port_in_use(host: str, port: int, timeout: float = 0.2) -> bool:
+    """True si un processus accepte déjà les connexions sur (host, port)"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+def wait_for_port(host: str, port: int, timeout: float = 10.0, interval: float = 0.05, process=None) -> bool:
+    """
+    Attend qu'un serveur accepte les connexions sur (host, port).
+    
+    Retourne False si le délai expire ou si process (optionnel) s'arrête avant ;
+    une connexion acceptée ne compte que si process tourne encore après (sinon,
+    c'est un autre processus qui écoute sur ce port).
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        if port_in_use(host, port, timeout=interval):
+            return process is None or process.poll() is None
+        time.sleep(interval)
+    return False
+
+def get_process_logger(name: str, log_dir: str = LOG_DIR) -> logging.Logger:
+    """Journal à rotation (logs/<name>.log) recevant la sortie d'un processus enfant"""
+    logger = logging.getLogger(f"launcher.{name}")
+    if not logger.handlers:
+        os.makedirs(log_dir, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            os.path.join(log_dir, f"{name}.log"),
+            maxBytes=1_000_000,
+            backupCount=3,
+            encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+def drain_output(stream, logger: logging.Logger, level: int, tail: deque, on_line=None):
+    """Lit la sortie d'un processus jusqu'à sa fermeture, pour que le tube ne se remplisse jamais"""
+    try:
+        for line in iter(stream.readline, b""):
+            text = line.decode("utf-8", errors="ignore").rstrip()
+            tail.append(text)
+            logger.log(level, text)
+            if on_line:
+                on_line(text)
+    except (OSError, ValueError):
+        pass
+    finally:
+        stream.close()
+
+class ProcessSupervisor:
+    """
+    Lance un processus enfant et journalise sa sortie sur des threads de lecture.
+    
+    Si restart est vrai, un processus qui s'arrête sans qu'on l'ait demandé est
+    relancé après un délai qui double à chaque échec (jusqu'à max_backoff) ; après
+    max_restarts échecs rapprochés, la supervision abandonne.
+    """
+    
+    def __init__(self, name: str, args: list, ready_check=None, restart: bool = True,
+                 max_restarts: int = 5, backoff: float = 0.5, max_backoff: float = 30.0,
+                 stable_after: float = 60.0, on_event=None, on_line=None, cwd=None):
+        self.name = name
+        self.args = args
+        self.cwd = cwd
+        self.on_line = on_line  # Appelé avec chaque ligne de la sortie standard (thread de lecture)
+        self.ready_check = ready_check  # ready_check(process) -> bool
+        self.restart = restart
+        self.max_restarts = max_restarts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.stable_after = stable_after  # Durée de fonctionnement qui remet le compteur d'échecs à zéro
+        self.on_event = on_event or (lambda message: None)
+        self.logger = get_process_logger(name)
+        self.tail = deque(maxlen=20)  # Dernières lignes de sortie, pour les messages d'erreur
+        self.process = None
+        self.failures = 0
+        self.stopping = threading.Event()
+        self.supervisor_thread = None
+        
+    @property
+    def pid(self):
+        return self.process.pid if self.process else None
+        
+    def launch(self) -> bool:
+        """Démarre le processus et attend qu'il soit prêt"""
+        self.process = subprocess.Popen(self.args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=self.cwd)
+        self.logger.info(f"Processus {self.name} démarré (PID {self.process.pid})")
+        for stream, level, on_line in ((self.process.stdout, logging.INFO, self.on_line),
+                                       (self.process.stderr, logging.ERROR, None)):
+            threading.Thread(
+                target=drain_output,
+                args=(stream, self.logger, level, self.tail, on_line),
+                daemon=True
+            ).start()
+        if self.ready_check and not self.ready_check(self.process):
+            return False
+        return self.process.poll() is None
+        
+    def start(self) -> bool:
+        """Démarre le processus puis sa supervision ; retourne False s'il n'a pas démarré"""
+        if not self.launch():
+            self.terminate()
+            return False
+        if self.restart:
+            self.supervisor_thread = threading.Thread(target=self.supervise, daemon=True)
+            self.supervisor_thread.start()
+        return True
+        
+    def supervise(self):
+        """Relance le processus à chaque arrêt inattendu (thread de supervision)"""
+        while not self.stopping.is_set():
+            started_at = time.monotonic()
+            returncode = self.process.wait()
+            if self.stopping.is_set():
+                return
+            if time.monotonic() - started_at >= self.stable_after:
+                self.failures = 0
+            self.failures += 1
+            self.logger.error(f"Processus {self.name} arrêté (code {returncode})")
+            if self.failures > self.max_restarts:
+                self.on_event(f"{self.name} : arrêté, abandon après {self.max_restarts} relances")
+                return
+            delay = min(self.max_backoff, self.backoff * 2 ** (self.failures - 1))
+            self.on_event(f"{self.name} : arrêté, relance dans {delay:.1f} s")
+            if self.stopping.wait(delay):
+                return
+            if self.launch():
+                self.on_event(f"{self.name} : relancé (PID {self.process.pid})")
+            else:
+                self.logger.error(f"Échec de la relance de {self.name}")
+                
+    def error_message(self) -> str:
+        """Dernières lignes de sortie du processus, et son code de sortie s'il s'est terminé"""
+        lines = list(self.tail)
+        if self.process and self.process.returncode is not None:
+            lines.append(f"Processus terminé (code {self.process.returncode})")
+        return "\n".join(lines) or "Inconnu"
+        
+    def terminate(self, timeout: float = 3.0):
+        """Termine le processus (sans relance)"""
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                
+    def stop(self, timeout: float = 3.0):
+        """Arrête la supervision puis le processus"""
+        self.stopping.set()
+        self.terminate(timeout)
+
+def start_server(on_event=None, host: str = SERVER_HOST, port: int = SERVER_PORT, timeout: float = 10.0):
+    """Démarre le serveur en arrière-plan, supervisé, et attend qu'il accepte les connexions"""
     try:
         # Utiliser le chemin absolu pour le script du serveur
-        server_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server", "server.py")
+        server_path = os.path.join(BASE_DIR, "server", "server.py")
         print(f"Démarrage du serveur à partir de: {server_path}")
         
         if not os.path.exists(server_path):
             print(f"ERREUR: Le fichier serveur n'existe pas à l'emplacement: {server_path}")
             messagebox.showerror("Erreur", f"Le fichier serveur n'existe pas: {server_path}")
             return None
+            
+        # Un serveur déjà à l'écoute (ancienne instance) ferait croire que le nôtre est prêt
+        if port_in_use(host, port):
+            print(f"ERREUR: Le port {port} est déjà utilisé")
+            messagebox.showerror("Erreur", f"Le port {port} est déjà utilisé par un autre processus")
+            return None
         
-        # Démarrer le serveur
-        server_process = subprocess.Popen([sys.executable, server_path], 
-                                         stdout=subprocess.PIPE, 
-                                         stderr=subprocess.PIPE)
-        
-        print(f"Processus serveur démarré avec PID: {server_process.pid}")
-        
-        # Attendre que le serveur soit prêt
-        time.sleep(2)
-        
-        # Vérifier si le processus est toujours en cours d'exécution
-        if server_process.poll() is not None:
-            # Le processus s'est terminé prématurément
-            stdout, stderr = server_process.communicate()
-            error_msg = stderr.decode('utf-8', errors='ignore') if stderr else "Inconnu"
-            print(f"ERREUR: Le serveur s'est arrêté prématurément: {error_msg}")
-            messagebox.showerror("Erreur", f"Le serveur s'est arrêté: {error_msg}")
+        # Démarrer le serveur ; il est prêt dès que son port accepte les connexions
+        server = ProcessSupervisor(
+            "server",
+            [sys.executable, server_path],
+            ready_check=lambda process: wait_for_port(host, port, timeout, process=process),
+            on_event=on_event
+        )
+        if not server.start():
+            # Le processus s'est terminé prématurément ou n'écoute pas
+            error_msg = server.error_message()
+            print(f"ERREUR: Le serveur n'a pas démarré: {error_msg}")
+            messagebox.showerror("Erreur", f"Le serveur n'a pas démarré: {error_msg}")
             return None
         
-        return server_process
+        print(f"Processus serveur démarré avec PID: {server.pid}")
+        return server
     except Exception as e:
         print(f"ERREUR lors du démarrage du serveur: {str(e)}")
         messagebox.showerror("Erreur", f"Impossible de démarrer le serveur: {str(e)}")
         return None
 
-def start_client():
+def start_client(index: int = 0):
     """Démarre un client en arrière-plan"""
     try:
         # Utiliser le chemin absolu pour le script du client
-        client_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "client", "client.py")
+        client_path = os.path.join(BASE_DIR, "client", "client.py")
         print(f"Démarrage du client à partir de: {client_path}")
         
         if not os.path.exists(client_path):
@@ -83,29 +256,152 @@ def start_client():
             messagebox.showerror("Erreur", f"Le fichier client n'existe pas: {client_path}")
             return None
         
-        # Démarrer le client
-        client_process = subprocess.Popen([sys.executable, client_path],
-                                         stdout=subprocess.PIPE,
-                                         stderr=subprocess.PIPE)
+        # Démarrer le client (sortie journalisée ; un client fermé par le joueur n'est pas relancé)
+        client = ProcessSupervisor(f"client-{index}", [sys.executable, client_path], restart=False)
+        client.start()
         
-        print(f"Processus client démarré avec PID: {client_process.pid}")
+        print(f"Processus client démarré avec PID: {client.pid}")
         
         # Vérifier si le processus est toujours en cours d'exécution après un court délai
-        time.sleep(0.5)
-        if client_process.poll() is not None:
+        try:
+            client.process.wait(0.5)
             # Le processus s'est terminé prématurément
-            stdout, stderr = client_process.communicate()
-            error_msg = stderr.decode('utf-8', errors='ignore') if stderr else "Inconnu"
+            error_msg = client.error_message()
             print(f"ERREUR: Le client s'est arrêté prématurément: {error_msg}")
             messagebox.showerror("Erreur", f"Le client s'est arrêté: {error_msg}")
             return None
+        except subprocess.TimeoutExpired:
+            pass
         
-        return client_process
+        return client
     except Exception as e:
         print(f"ERREUR lors du démarrage du client: {str(e)}")
         messagebox.showerror("Erreur", f"Impossible de démarrer le client: {str(e)}")
         return None
 
+class LocalCluster:
+    """
+    Laboratoire de performance local : N serveurs et des bots sans interface.
+    
+    Le serveur i écoute sur base_port + i, avec son propre répertoire de travail
+    (cluster/worker-i : base et journaux). Un processus client/bot.py par serveur fait
+    jouer sa part des bots et publie un résumé JSON par seconde, agrégé par stats().
+    """
+    
+    def __init__(self, workers: int = 2, bots: int = 100, host: str = SERVER_HOST,
+                 base_port: int = CLUSTER_BASE_PORT, report_interval: float = 1.0, on_event=None):
+        self.workers = workers
+        self.bots = bots
+        self.host = host
+        self.base_port = base_port
+        self.report_interval = report_interval
+        self.on_event = on_event or (lambda message: None)
+        self.servers = []
+        self.bot_processes = []
+        self.snapshots = {}  # Nom du processus de bots -> dernier résumé reçu
+        self.samples = deque(maxlen=10)  # (instant, parties terminées) pour le débit
+        self.lock = threading.Lock()
+        self.stopping = threading.Event()
+        
+    def start(self) -> bool:
+        """Démarre les serveurs, attend qu'ils soient prêts, puis les bots"""
+        server_path = os.path.join(BASE_DIR, "server", "server.py")
+        bot_path = os.path.join(BASE_DIR, "client", "bot.py")
+        
+        for i in range(self.workers):
+            if self.stopping.is_set():
+                return False
+            port = self.base_port + i
+            if port_in_use(self.host, port):
+                self.on_event(f"Échec du démarrage du serveur {i}: port {port} déjà utilisé")
+                self.stop()
+                return False
+            worker_dir = os.path.join(CLUSTER_DIR, f"worker-{i}")
+            os.makedirs(worker_dir, exist_ok=True)
+            server = ProcessSupervisor(
+                f"cluster-server-{i}",
+                [sys.executable, server_path, "--host", self.host, "--port", str(port)],
+                ready_check=lambda process, port=port: wait_for_port(self.host, port, process=process),
+                on_event=self.on_event,
+                cwd=worker_dir
+            )
+            self.servers.append(server)
+            if not server.start():
+                self.on_event(f"Échec du démarrage du serveur {i}: {server.error_message()}")
+                self.stop()
+                return False
+                
+        # Répartir les bots entre les serveurs (un processus de bots par serveur)
+        for i in range(self.workers):
+            players = self.bots // self.workers + (1 if i < self.bots % self.workers else 0)
+            if players == 0 or self.stopping.is_set():
+                continue
+            name = f"cluster-bots-{i}"
+            bots = ProcessSupervisor(
+                name,
+                [sys.executable, bot_path,
+                 "--host", self.host,
+                 "--port", str(self.base_port + i),
+                 "--players", str(players),
+                 "--duration", str(365 * 24 * 3600),
+                 "--report-interval", str(self.report_interval)],
+                on_event=self.on_event,
+                on_line=lambda line, name=name: self.record_report(name, line)
+            )
+            bots.start()
+            self.bot_processes.append(bots)
+        return True
+        
+    def record_report(self, name: str, line: str):
+        """Enregistre un résumé JSON émis par un processus de bots (thread de lecture)"""
+        if not line.startswith("{"):
+            return
+        try:
+            snapshot = json.loads(line)
+        except ValueError:
+            return
+        with self.lock:
+            self.snapshots[name] = snapshot
+            
+    def stats(self) -> dict:
+        """
+        Mesures agrégées de tous les processus de bots.
+        
+        Le p99 global n'est pas calculable à partir des p99 de chaque processus :
+        on affiche le plus grand, qui le majore.
+        """
+        with self.lock:
+            snapshots = list(self.snapshots.values())
+        finished = sum(s["matches_finished"] for s in snapshots)
+        now = time.monotonic()
+        self.samples.append((now, finished))
+        first_time, first_finished = self.samples[0]
+        p99_values = [s["move_rtt_ms"]["p99"] for s in snapshots if s["move_rtt_ms"]["p99"] is not None]
+        return {
+            "servers": sum(1 for server in self.servers if server.process and server.process.poll() is None),
+            "connections": sum(s["active_connections"] for s in snapshots),
+            "matches_finished": finished,
+            "matches_per_second": (finished - first_finished) / (now - first_time) if now > first_time else 0.0,
+            "move_p99_ms": max(p99_values) if p99_values else None,
+            "errors": sum(s["error_count"] for s in snapshots),
+        }
+        
+    def stop(self):
+        """Arrête les bots puis les serveurs"""
+        self.stopping.set()
+        for process in self.bot_processes + self.servers:
+            process.stopping.set()
+        for process in self.bot_processes + self.servers:
+            try:
+                process.terminate()
+            except Exception:
+                pass
+        self.bot_processes = []
+        self.servers = []
+        with self.lock:
+            self.snapshots.clear()
+        self.samples.clear()
+
 def create_executable():
     """Crée un fichier exécutable pour le lanceur"""
     try:
@@ -148,14 +444,17 @@ class LauncherGUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Puissance 4 - Lanceur")
-        self.root.geometry("400x300")
+        self.root.geometry("400x520")
         self.root.configure(bg="#1a1a2e")
         self.root.resizable(False, False)
         
         self.server_process = None
         self.client_processes = []
+        self.cluster = None
+        self.STATS_INTERVAL_MS = 1000  # Rafraîchissement des mesures du cluster
         
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
         
     def setup_ui(self):
         """Configure l'interface utilisateur"""
@@ -224,6 +523,42 @@ class LauncherGUI:
         )
         quit_button.pack(pady=10)
         
+        # Mode cluster local : plusieurs serveurs et des bots, avec mesures agrégées
+        cluster_frame = tk.Frame(self.root, bg="#1a1a2e")
+        cluster_frame.pack(pady=(10, 0))
+        
+        tk.Label(cluster_frame, text="Serveurs", font=("Segoe UI", 10), bg="#1a1a2e", fg="#ecf0f1").pack(side=tk.LEFT)
+        self.workers_var = tk.IntVar(value=2)
+        tk.Spinbox(cluster_frame, from_=1, to=16, width=3, textvariable=self.workers_var).pack(side=tk.LEFT, padx=(5, 15))
+        
+        tk.Label(cluster_frame, text="Bots", font=("Segoe UI", 10), bg="#1a1a2e", fg="#ecf0f1").pack(side=tk.LEFT)
+        self.bots_var = tk.IntVar(value=100)
+        tk.Spinbox(cluster_frame, from_=0, to=5000, increment=50, width=5, textvariable=self.bots_var).pack(side=tk.LEFT, padx=5)
+        
+        self.cluster_button = tk.Button(
+            self.root,
+            text="CLUSTER LOCAL",
+            command=self.toggle_cluster,
+            bg="#0f3460",
+            fg="#ecf0f1",
+            font=("Segoe UI", 12),
+            relief=tk.FLAT,
+            padx=20,
+            pady=10,
+            cursor="hand2"
+        )
+        self.cluster_button.pack(pady=10)
+        
+        self.cluster_stats_label = tk.Label(
+            self.root,
+            text="",
+            font=("Consolas", 9),
+            justify=tk.LEFT,
+            bg="#1a1a2e",
+            fg="#ecf0f1"
+        )
+        self.cluster_stats_label.pack()
+        
         # Label d'état
         self.status_label = tk.Label(
             self.root,
@@ -244,8 +579,10 @@ class LauncherGUI:
         self.status_label.config(text="Démarrage du serveur...")
         self.root.update()
         
-        # Démarrer le serveur
-        self.server_process = start_server()
+        # Démarrer le serveur (les événements de supervision arrivent d'un autre thread)
+        self.server_process = start_server(
+            on_event=lambda message: self.root.after(0, lambda: self.status_label.config(text=message))
+        )
         if not self.server_process:
             self.status_label.config(text="Échec du démarrage du serveur")
             return
@@ -255,8 +592,8 @@ class LauncherGUI:
         self.root.update()
         
         # Démarrer deux clients
-        for _ in range(2):
-            client = start_client()
+        for index in range(2):
+            client = start_client(index)
             if client:
                 self.client_processes.append(client)
             time.sleep(1)  # Petite pause entre les démarrages
@@ -267,6 +604,68 @@ class LauncherGUI:
         else:
             self.status_label.config(text=f"Jeu démarré partiellement ({len(self.client_processes)} client(s))")
     
+    def set_status(self, message):
+        """Met à jour le label d'état (appelable depuis un autre thread)"""
+        self.root.after(0, lambda: self.status_label.config(text=message))
+        
+    def toggle_cluster(self):
+        """Démarre ou arrête le cluster local"""
+        if self.cluster:
+            self.stop_cluster()
+            return
+            
+        try:
+            workers = self.workers_var.get()
+            bots = self.bots_var.get()
+        except tk.TclError:
+            messagebox.showerror("Erreur", "Nombre de serveurs ou de bots invalide")
+            return
+            
+        self.cluster = LocalCluster(workers, bots, on_event=self.set_status)
+        self.cluster_button.config(text="ARRÊTER LE CLUSTER", state=tk.DISABLED)
+        self.status_label.config(text=f"Démarrage de {workers} serveur(s) et {bots} bots...")
+        
+        # Démarrer dans un thread séparé pour ne pas bloquer l'interface
+        cluster = self.cluster
+        threading.Thread(target=lambda: self.root.after(0, self.on_cluster_started, cluster, cluster.start()),
+                         daemon=True).start()
+        
+    def on_cluster_started(self, cluster, success):
+        """Fin du démarrage du cluster (thread principal)"""
+        if cluster is not self.cluster:
+            return  # Arrêté entre-temps
+        self.cluster_button.config(state=tk.NORMAL)
+        if not success:
+            self.cluster = None
+            self.cluster_button.config(text="CLUSTER LOCAL")
+            return
+        self.status_label.config(text=f"Cluster démarré (ports {cluster.base_port}-{cluster.base_port + cluster.workers - 1})")
+        self.root.after(self.STATS_INTERVAL_MS, self.update_cluster_stats)
+        
+    def update_cluster_stats(self):
+        """Affiche les mesures agrégées du cluster, chaque seconde"""
+        if not self.cluster:
+            return
+        stats = self.cluster.stats()
+        p99 = f"{stats['move_p99_ms']:.1f} ms" if stats["move_p99_ms"] is not None else "-"
+        self.cluster_stats_label.config(text=(
+            f"Serveurs actifs   {stats['servers']}\n"
+            f"Connexions        {stats['connections']}\n"
+            f"Parties/s         {stats['matches_per_second']:.2f}  ({stats['matches_finished']} terminées)\n"
+            f"Latence coup p99  {p99}\n"
+            f"Erreurs           {stats['errors']}"
+        ))
+        self.root.after(self.STATS_INTERVAL_MS, self.update_cluster_stats)
+        
+    def stop_cluster(self):
+        """Arrête tous les processus du cluster"""
+        cluster, self.cluster = self.cluster, None
+        if cluster:
+            cluster.stop()
+        self.cluster_button.config(text="CLUSTER LOCAL", state=tk.NORMAL)
+        self.cluster_stats_label.config(text="")
+        self.status_label.config(text="Cluster arrêté")
+        
     def create_exe(self):
         """Crée un exécutable pour le lanceur"""
         # Vérifier les prérequis
@@ -295,17 +694,21 @@ class LauncherGUI:
     
     def quit_app(self):
         """Quitte l'application et termine tous les processus"""
+        # Arrêter le cluster local
+        if self.cluster:
+            self.stop_cluster()
+            
         # Terminer les clients
         for client in self.client_processes:
             try:
-                client.terminate()
+                client.stop()
             except:
                 pass
                 
-        # Terminer le serveur
+        # Terminer le serveur (et sa supervision, pour qu'il ne soit pas relancé)
         if self.server_process:
             try:
-                self.server_process.terminate()
+                self.server_process.stop()
             except:
                 pass
                 
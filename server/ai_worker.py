@@ -0,0 +1,106 @@
+import threading
+import time
+import logging
+from typing import Dict, Optional
+
+from shared.game import Puissance4Game
+from shared.search import COLUMN_ORDER, Search, SearchCancelled
+
+class AIWorker:
+    """
+    IA d'une partie contre l'IA : recherche alpha-bêta, avec réflexion facultative
+    pendant le temps de l'adversaire (pondering, désactivé par défaut).
+
+    Avec ponder=True, après chaque coup de l'IA ponder() lance un thread qui cherche
+    à l'avance les réponses probables de l'humain, par profondeurs croissantes, dans la table de
+    transposition partagée avec choose_move(). Quand le vrai coup arrive, la
+    réflexion est annulée (Event consulté tous les check_every nœuds) et la
+    recherche du coup repart d'une table déjà chaude. Un humain qui ne joue pas
+    n'occupe pas un cœur indéfiniment : la réflexion s'arrête d'elle-même après
+    ponder_time secondes.
+    """
+
+    def __init__(self, think_time: float = 1.0, max_depth: int = 12, ponder: bool = False,
+                 max_tt_entries: int = 1_000_000, check_every: int = 256, ponder_time: float = 10.0):
+        self.think_time = think_time
+        self.max_depth = max_depth
+        self.ponder_enabled = ponder
+        self.ponder_time = ponder_time
+        self.max_tt_entries = max_tt_entries
+        self.check_every = check_every
+        self.logger = logging.getLogger(__name__)
+        self.tt: Dict[int, tuple] = {}
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def choose_move(self, game: Puissance4Game) -> Optional[int]:
+        """
+        Colonne jouée par l'IA pour le joueur au trait, ou None si aucun coup.
+
+        Annule la réflexion en cours puis approfondit jusqu'à max_depth ou think_time
+        secondes ; le résultat de la dernière profondeur terminée est retenu.
+        """
+        self.stop_pondering()
+        if len(self.tt) > self.max_tt_entries:
+            self.tt.clear()
+
+        deadline = time.perf_counter() + self.think_time
+        search = Search(game, should_stop=lambda: time.perf_counter() >= deadline,
+                        check_every=self.check_every, tt=self.tt)
+        scores, reached = {}, 0
+        try:
+            for depth, depth_scores in search.iterate(self.max_depth):
+                scores, reached = depth_scores, depth
+        except SearchCancelled:
+            pass
+        if not scores:
+            return None
+        best = max(scores.values())
+        col = next(col for col in COLUMN_ORDER if scores.get(col) == best)
+        self.logger.info(f"IA : colonne {col} (profondeur {reached}, {search.nodes} nœuds, score {best})")
+        return col
+
+    def ponder(self, game: Puissance4Game):
+        """Réfléchit en arrière-plan aux réponses de l'adversaire (joueur au trait de game)"""
+        if not self.ponder_enabled or game.is_game_over():
+            return
+        self.stop_pondering()
+        # Copie prise sur le thread appelant : la partie continue d'évoluer pendant la réflexion
+        position = Puissance4Game()
+        position.set_board([line[:] for line in game.board], game.current_player)
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._ponder, args=(position, self._cancel), daemon=True)
+        self._thread.start()
+
+    def stop_pondering(self):
+        """Annule la réflexion en cours et attend la fin du thread (quelques centaines de nœuds)"""
+        self._cancel.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _ponder(self, position: Puissance4Game, cancel: threading.Event):
+        deadline = time.perf_counter() + self.ponder_time
+
+        def should_stop() -> bool:
+            return cancel.is_set() or time.perf_counter() >= deadline
+
+        try:
+            # Réponses probables d'abord : celles que l'adversaire jugerait les meilleures
+            first = Search(position, should_stop=should_stop, check_every=self.check_every, tt=self.tt)
+            replies = first.score_moves(2)
+            searches = []
+            for col in sorted(replies, key=replies.get, reverse=True):
+                position.make_move(col)
+                if not position.is_game_over():
+                    searches.append(Search(position, should_stop=should_stop,
+                                           check_every=self.check_every, tt=self.tt))
+                position.unmake_move()
+            # Profondeurs croissantes sur toutes les réponses, pour qu'aucune ne reste froide
+            for depth in range(1, self.max_depth + 1):
+                for search in searches:
+                    search.score_moves(depth)
+        except SearchCancelled:
+            pass
+        except Exception as e:
+            self.logger.error(f"Erreur pendant la réflexion de l'IA: {e}")
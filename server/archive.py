@@ -0,0 +1,152 @@
+import threading
+import logging
+import time
+from typing import Optional
+
+from server.database import Database
+from shared.models import GameState
+
+class MatchArchiver:
+    """
+    Archive les matchs terminés pour garder la table matches (la table "chaude") petite.
+
+    Les matchs FINISHED plus anciens que max_age sont déplacés par petits lots dans
+    matches_archive, qui ne conserve que la suite de coups compactée. Chaque lot est
+    une transaction courte : le verrou d'écriture n'est jamais conservé longtemps.
+    Les pages libérées sont rendues au système de fichiers par incremental_vacuum.
+    """
+
+    def __init__(self, database: Database, archive_path: Optional[str] = None,
+                 max_age: float = 7 * 24 * 3600, batch_size: int = 200,
+                 batch_pause: float = 0.05, interval: float = 3600.0,
+                 vacuum_pages: int = 500):
+        self.database = database
+        self.archive_path = archive_path
+        self.max_age = max_age
+        self.batch_size = batch_size
+        self.batch_pause = batch_pause
+        self.interval = interval
+        self.vacuum_pages = vacuum_pages
+        self.logger = logging.getLogger(__name__)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.schema = "archive" if archive_path else "main"
+        self.create_archive_table()
+
+    def create_archive_table(self):
+        """Crée la table d'archive, dans un fichier SQLite séparé si archive_path est défini"""
+        with self.database.lock:
+            cursor = self.database.conn.cursor()
+            if self.archive_path:
+                cursor.execute("PRAGMA database_list")
+                if "archive" not in {row['name'] for row in cursor.fetchall()}:
+                    cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {self.schema}.matches_archive (
+                    id TEXT PRIMARY KEY,
+                    player1_id TEXT NOT NULL,
+                    player2_id TEXT NOT NULL,
+                    winner_id TEXT,
+                    finished_at REAL,
+                    moves BLOB,
+                    board BLOB
+                )
+            """)
+            self.database.conn.commit()
+
+    def start(self):
+        """Démarre le thread d'archivage périodique"""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._archive_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le thread d'archivage"""
+        self._stop_event.set()
+
+    def _archive_loop(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                self.logger.error(f"Erreur lors de l'archivage des matchs: {e}")
+
+    def archive_batch(self, cutoff: float) -> int:
+        """
+        Déplace un lot de matchs terminés avant cutoff vers l'archive.
+
+        Returns:
+            Nombre de matchs archivés
+        """
+        with self.database.lock:
+            conn = self.database.conn
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT id FROM matches
+                WHERE state = ? AND finished_at < ?
+                LIMIT ?
+                """,
+                (GameState.FINISHED.value, cutoff, self.batch_size)
+            )
+            ids = [row['id'] for row in cursor.fetchall()]
+            if not ids:
+                return 0
+
+            placeholders = ", ".join("?" for _ in ids)
+            try:
+                # Le plateau n'est conservé que pour les anciens matchs sans suite de coups
+                cursor.execute(
+                    f"""
+                    INSERT OR REPLACE INTO {self.schema}.matches_archive
+                    (id, player1_id, player2_id, winner_id, finished_at, moves, board)
+                    SELECT id, player1_id, player2_id, winner_id, finished_at, moves,
+                           CASE WHEN moves IS NULL THEN board END
+                    FROM matches WHERE id IN ({placeholders})
+                    """,
+                    ids
+                )
+                cursor.execute(f"DELETE FROM matches WHERE id IN ({placeholders})", ids)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            return len(ids)
+
+    def run_once(self) -> int:
+        """
+        Archive tous les matchs éligibles par lots, puis libère les pages inutilisées.
+
+        Returns:
+            Nombre total de matchs archivés
+        """
+        cutoff = time.time() - self.max_age
+        total = 0
+        while not self._stop_event.is_set():
+            archived = self.archive_batch(cutoff)
+            total += archived
+            if archived < self.batch_size:
+                break
+            # Laisser les autres threads accéder à la base entre deux lots
+            time.sleep(self.batch_pause)
+
+        if total:
+            self.logger.info(f"{total} match(s) archivé(s)")
+            self.incremental_vacuum()
+        return total
+
+    def incremental_vacuum(self):
+        """
+        Rend au plus vacuum_pages pages libres au système de fichiers.
+
+        Jamais de VACUUM complet ici : une base pas encore en mode incrémental est
+        convertie au démarrage (Database.enable_incremental_vacuum), pas pendant le service.
+        """
+        with self.database.lock:
+            cursor = self.database.conn.cursor()
+            cursor.execute("PRAGMA auto_vacuum")
+            if cursor.fetchone()[0] != 2:  # 2 = INCREMENTAL
+                self.logger.debug("auto_vacuum non incrémental : pages libres conservées")
+                return
+            cursor.execute(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})")
+            cursor.fetchall()
@@ -0,0 +1,108 @@
+import socket
+import threading
+import logging
+import time
+from collections import deque
+from typing import Callable, Dict, Any, Hashable, Optional
+
+class ChatRateLimiter:
+    """
+    Limite de débit par utilisateur (seau à jetons) : rafale de burst messages,
+    puis rate messages par seconde.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[Hashable, list] = {}  # clé -> [jetons, dernière mise à jour]
+        self._lock = threading.Lock()
+
+    def allow(self, key: Hashable) -> bool:
+        """Consomme un jeton pour key ; retourne False si la limite est atteinte"""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(self.burst), now]
+            tokens = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return False
+            bucket[0] = tokens - 1
+            return True
+
+    def forget(self, key: Hashable):
+        """Oublie un utilisateur (déconnexion)"""
+        with self._lock:
+            self._buckets.pop(key, None)
+
+class ChatRelay:
+    """
+    Relaie les messages de chat, avec une file par destinataire.
+
+    Le thread qui traite les messages d'un client se contente de mettre le message
+    dans la file du destinataire ; chaque file est vidée par son propre thread,
+    lancé au premier message et arrêté quand elle est vide. Un destinataire lent
+    ne bloque donc ni l'expéditeur ni les autres destinataires.
+    """
+
+    def __init__(self, send: Callable[[socket.socket, Dict[str, Any]], bool], max_pending: int = 100):
+        self.send = send
+        self.max_pending = max_pending  # Messages en attente au plus, par destinataire
+        self.logger = logging.getLogger(__name__)
+        self._queues: Dict[socket.socket, deque] = {}
+        self._lock = threading.Lock()
+        self._running = False
+
+    def start(self):
+        """Accepte les messages à relayer"""
+        with self._lock:
+            self._running = True
+
+    def stop(self):
+        """Arrête le relais ; les messages encore en file sont abandonnés"""
+        with self._lock:
+            self._running = False
+            self._queues.clear()
+
+    def relay(self, recipient: socket.socket, message: Dict[str, Any],
+              on_failure: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Met un message dans la file de recipient.
+
+        Returns:
+            False si le relais est arrêté ou la file du destinataire pleine (message abandonné)
+        """
+        with self._lock:
+            if not self._running:
+                return False
+            pending = self._queues.get(recipient)
+            if pending is None:
+                pending = self._queues[recipient] = deque()
+                threading.Thread(target=self._drain, args=(recipient, pending), daemon=True).start()
+            elif len(pending) >= self.max_pending:
+                self.logger.warning("File de chat du destinataire pleine, message abandonné")
+                return False
+            pending.append((message, on_failure))
+            return True
+
+    def _drain(self, recipient: socket.socket, pending: deque):
+        """Envoie les messages de la file de recipient, jusqu'à ce qu'elle soit vide"""
+        while True:
+            with self._lock:
+                if not pending or not self._running:
+                    if self._queues.get(recipient) is pending:
+                        del self._queues[recipient]
+                    return
+                message, on_failure = pending.popleft()
+            try:
+                success = self.send(recipient, message)
+            except Exception as e:
+                self.logger.error(f"Erreur lors du relais d'un message de chat: {e}")
+                success = False
+            if not success and on_failure:
+                try:
+                    on_failure()
+                except Exception:
+                    pass
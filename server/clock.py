@@ -0,0 +1,176 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+class MatchClock:
+    """
+    Pendule d'un match : temps de base par joueur et incrément ajouté après chaque coup.
+
+    Seul le joueur au trait consomme son temps ; press() arrête sa pendule,
+    lui ajoute l'incrément et démarre celle de l'adversaire.
+    """
+
+    def __init__(self, base_time: float, increment: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        self.increment = increment
+        self.clock = clock
+        self.remaining = [0.0, base_time, base_time]  # Indices 1 et 2 : temps des joueurs
+        self.running: Optional[int] = None
+        self.started_at = 0.0
+        self.timer = None  # Minuterie de chute du drapeau du joueur au trait (TimerScheduler)
+
+    def start(self, player: int):
+        """Démarre la pendule de player"""
+        self.running = player
+        self.started_at = self.clock()
+
+    def stop(self):
+        """Arrête la pendule en cours (temps écoulé décompté)"""
+        if self.running is not None:
+            self.remaining[self.running] -= self.clock() - self.started_at
+            self.running = None
+
+    def press(self, player: int) -> float:
+        """
+        player vient de jouer : sa pendule s'arrête, il reçoit l'incrément et celle
+        de l'adversaire démarre. Retourne le temps qu'il lui restait avant l'incrément
+        (négatif ou nul : le drapeau était tombé).
+        """
+        if self.running == player:
+            self.stop()
+        left = self.remaining[player]
+        if left > 0:
+            self.remaining[player] += self.increment
+        self.start(3 - player)
+        return left
+
+    def time_left(self, player: int) -> float:
+        """Temps restant de player, pendule en cours comprise"""
+        left = self.remaining[player]
+        if self.running == player:
+            left -= self.clock() - self.started_at
+        return left
+
+    def flag_fallen(self) -> bool:
+        """True si le joueur au trait n'a plus de temps"""
+        return self.running is not None and self.time_left(self.running) <= 0
+
+    def deadline(self) -> Optional[float]:
+        """Instant (horloge de la pendule) où tombe le drapeau du joueur au trait"""
+        if self.running is None:
+            return None
+        return self.started_at + self.remaining[self.running]
+
+    def snapshot(self) -> List[float]:
+        """Temps restants [joueur 1, joueur 2], arrondis au dixième (pour les messages)"""
+        return [round(max(0.0, self.time_left(player)), 1) for player in (1, 2)]
+
+class Timer:
+    """Minuterie planifiée par TimerScheduler ; cancel() l'annule sans toucher au tas"""
+
+    __slots__ = ("deadline", "callback", "args", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable, args: tuple):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+class TimerScheduler:
+    """
+    Minuteries de tous les matchs dans un seul tas, servi par un seul thread.
+
+    schedule() et Timer.cancel() sont en O(log n) et O(1) ; le thread dort jusqu'à
+    l'échéance la plus proche (ou jusqu'à l'ajout d'une minuterie plus proche)
+    et appelle les callbacks hors du verrou. Les minuteries annulées restent dans
+    le tas jusqu'à leur échéance, sauf si elles deviennent majoritaires : le tas
+    est alors reconstruit.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self.logger = logging.getLogger(__name__)
+        self._heap = []
+        self._counter = itertools.count()  # Départage les échéances égales
+        self._cancelled = 0
+        self._condition = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Démarre le thread des minuteries"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le thread ; les minuteries en attente ne sont pas déclenchées"""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def schedule_at(self, deadline: float, callback: Callable, *args) -> Timer:
+        """Appelle callback(*args) à l'instant deadline (horloge du planificateur)"""
+        timer = Timer(deadline, callback, args)
+        with self._condition:
+            heapq.heappush(self._heap, (deadline, next(self._counter), timer))
+            # Réveiller le thread seulement si cette échéance passe en tête
+            if self._heap[0][2] is timer:
+                self._condition.notify()
+        return timer
+
+    def schedule(self, delay: float, callback: Callable, *args) -> Timer:
+        """Appelle callback(*args) dans delay secondes"""
+        return self.schedule_at(self.clock() + delay, callback, *args)
+
+    def cancel(self, timer: Optional[Timer]):
+        """Annule une minuterie (sans effet si elle est déjà partie)"""
+        if timer is None or timer.cancelled:
+            return
+        timer.cancel()
+        with self._condition:
+            self._cancelled += 1
+            if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+                self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def __len__(self) -> int:
+        """Nombre de minuteries en attente (annulées comprises)"""
+        return len(self._heap)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    delay = self._heap[0][0] - self.clock()
+                    if delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if not self._running:
+                    return
+                _, _, timer = heapq.heappop(self._heap)
+                if timer.cancelled:
+                    self._cancelled = max(0, self._cancelled - 1)
+                    continue
+                # Une minuterie ne part qu'une fois
+                timer.cancelled = True
+            try:
+                timer.callback(*timer.args)
+            except Exception as e:
+                self.logger.error(f"Erreur dans une minuterie: {e}")
@@ -1,24 +1,54 @@
+import logging
 import sqlite3
-import json
-from typing import List, Optional, Tuple
-from shared.models import Player, Match, GameState, PlayerState
+import threading
+import time
+import uuid
+from typing import List, Optional, Tuple, Union
+from shared.models import Player, Match, Board, GameState, PlayerState, PlayerStats, pack_moves
+
+# Facteur K du classement Elo
+ELO_K_FACTOR = 32
+
+def compute_elo(rating_a: int, rating_b: int, score_a: float, k: int = ELO_K_FACTOR) -> Tuple[int, int]:
+    """
+    Calcule les nouveaux classements Elo de deux joueurs.
+
+    Args:
+        rating_a: Classement du joueur A
+        rating_b: Classement du joueur B
+        score_a: Score du joueur A (1 victoire, 0.5 nul, 0 défaite)
+        k: Facteur K
+
+    Returns:
+        Tuple (nouveau classement de A, nouveau classement de B)
+    """
+    expected_a = 1 / (1 + 10 ** ((rating_b - rating_a) / 400))
+    delta = round(k * (score_a - expected_a))
+    return rating_a + delta, rating_b - delta
 
 class Database:
     def __init__(self, db_path: str = "matchmaking.db"):
         self.db_path = db_path
         self.conn = None
+        # La connexion est partagée entre les threads du serveur
+        self.lock = threading.RLock()
         self.connect()
         self.create_tables()
+        self.enable_incremental_vacuum()
 
     def connect(self):
         """Établit la connexion à la base de données"""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
 
     def create_tables(self):
         """Crée les tables nécessaires"""
         cursor = self.conn.cursor()
         
+        # Permet de rendre les pages libérées par l'archivage au système de fichiers
+        # (une base existante est convertie par enable_incremental_vacuum)
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        
         # Table des joueurs
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS players (
@@ -39,6 +69,8 @@ class Database:
                 board TEXT NOT NULL,
                 current_player_id TEXT,
                 winner_id TEXT,
+                moves BLOB,
+                finished_at REAL,
                 FOREIGN KEY (player1_id) REFERENCES players(id),
                 FOREIGN KEY (player2_id) REFERENCES players(id),
                 FOREIGN KEY (current_player_id) REFERENCES players(id),
@@ -46,129 +78,300 @@ class Database:
             )
         """)
         
+        # Ajouter les colonnes manquantes aux bases créées avant l'archivage
+        cursor.execute("PRAGMA table_info(matches)")
+        columns = {row['name'] for row in cursor.fetchall()}
+        if "moves" not in columns:
+            cursor.execute("ALTER TABLE matches ADD COLUMN moves BLOB")
+        if "finished_at" not in columns:
+            cursor.execute("ALTER TABLE matches ADD COLUMN finished_at REAL")
+        
+        # Index pour retrouver rapidement les matchs terminés à archiver
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_matches_state_finished
+            ON matches (state, finished_at)
+        """)
+        
+        # Statistiques des joueurs, mises à jour à la fin de chaque match
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS player_stats (
+                player_id TEXT PRIMARY KEY,
+                wins INTEGER NOT NULL DEFAULT 0,
+                losses INTEGER NOT NULL DEFAULT 0,
+                draws INTEGER NOT NULL DEFAULT 0,
+                games_played INTEGER NOT NULL DEFAULT 0,
+                rating INTEGER NOT NULL DEFAULT 1000,
+                FOREIGN KEY (player_id) REFERENCES players(id)
+            )
+        """)
+        
+        # Index pour le classement (top N et rang d'un joueur)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_stats_rating
+            ON player_stats (rating DESC)
+        """)
+        
         self.conn.commit()
 
+    def enable_incremental_vacuum(self):
+        """
+        Convertit une base créée sans auto_vacuum incrémental (VACUUM complet, une seule fois).
+
+        Appelé au démarrage, avant que le serveur n'accepte des joueurs : le VACUUM
+        ne bloque ainsi aucune écriture de résultat.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA auto_vacuum")
+        if cursor.fetchone()[0] == 2:  # 2 = INCREMENTAL
+            return
+        logging.getLogger(__name__).info("Conversion de la base en auto_vacuum incrémental (VACUUM complet)")
+        cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        cursor.execute("VACUUM")
+
     def add_player(self, player: Player) -> None:
         """Ajoute un joueur à la base de données"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "INSERT INTO players (id, username, state, rating) VALUES (?, ?, ?, ?)",
-            (player.id, player.username, player.state.value, player.rating)
-        )
-        self.conn.commit()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT INTO players (id, username, state, rating) VALUES (?, ?, ?, ?)",
+                player.to_row()
+            )
+            self.conn.commit()
 
     def get_player(self, player_id: str) -> Optional[Player]:
         """Récupère un joueur par son ID"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
-        row = cursor.fetchone()
-        if row:
-            return Player(
-                id=row['id'],
-                username=row['username'],
-                state=PlayerState(row['state']),
-                rating=row['rating']
-            )
-        return None
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM players WHERE id = ?", (player_id,))
+            row = cursor.fetchone()
+            if row:
+                return Player.from_row(row)
+            return None
 
     def update_player_state(self, player_id: str, state: PlayerState) -> None:
         """Met à jour l'état d'un joueur"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE players SET state = ? WHERE id = ?",
-            (state.value, player_id)
-        )
-        self.conn.commit()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "UPDATE players SET state = ? WHERE id = ?",
+                (state.value, player_id)
+            )
+            self.conn.commit()
 
     def create_match(self, match: Match) -> None:
         """Crée un nouveau match"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO matches 
-            (id, player1_id, player2_id, state, board, current_player_id, winner_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                match.id,
-                match.player1.id,
-                match.player2.id,
-                match.state.value,
-                json.dumps(match.board),
-                match.current_player.id if match.current_player else None,
-                match.winner.id if match.winner else None
-            )
-        )
-        self.conn.commit()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO matches 
+                (id, player1_id, player2_id, state, board, current_player_id, winner_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                match.to_row()
+            )
+            self.conn.commit()
 
     def get_match(self, match_id: str) -> Optional[Match]:
         """Récupère un match par son ID"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM matches WHERE id = ?", (match_id,))
-        row = cursor.fetchone()
-        if row:
-            player1 = self.get_player(row['player1_id'])
-            player2 = self.get_player(row['player2_id'])
-            current_player = self.get_player(row['current_player_id']) if row['current_player_id'] else None
-            winner = self.get_player(row['winner_id']) if row['winner_id'] else None
-            
-            if player1 and player2:
-                return Match(
-                    id=row['id'],
-                    player1=player1,
-                    player2=player2,
-                    state=GameState(row['state']),
-                    board=json.loads(row['board']),
-                    current_player=current_player,
-                    winner=winner
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM matches WHERE id = ?", (match_id,))
+            row = cursor.fetchone()
+            if row:
+                # Le joueur courant et le gagnant sont forcément l'un des deux joueurs
+                cursor.execute(
+                    "SELECT * FROM players WHERE id IN (?, ?)",
+                    (row['player1_id'], row['player2_id'])
                 )
-        return None
+                players = {player.id: player for player in map(Player.from_row, cursor.fetchall())}
+            
+                if row['player1_id'] in players and row['player2_id'] in players:
+                    return Match.from_row(row, players)
+            return None
 
     def update_match_state(self, match_id: str, state: GameState) -> None:
         """Met à jour l'état d'un match"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE matches SET state = ? WHERE id = ?",
-            (state.value, match_id)
-        )
-        self.conn.commit()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                UPDATE matches SET
+                    state = ?,
+                    finished_at = CASE WHEN ? THEN ? ELSE finished_at END
+                WHERE id = ?
+                """,
+                (state.value, state == GameState.FINISHED, time.time(), match_id)
+            )
+            self.conn.commit()
 
-    def update_match_board(self, match_id: str, board: List[List[int]]) -> None:
+    def update_match_board(self, match_id: str, board: Union[Board, List[List[int]]]) -> None:
         """Met à jour le plateau de jeu d'un match"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE matches SET board = ? WHERE id = ?",
-            (json.dumps(board), match_id)
-        )
-        self.conn.commit()
+        if not isinstance(board, Board):
+            board = Board.from_lists(board)
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "UPDATE matches SET board = ? WHERE id = ?",
+                (board.to_bytes(), match_id)
+            )
+            self.conn.commit()
 
     def set_match_winner(self, match_id: str, winner_id: str) -> None:
         """Définit le gagnant d'un match"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "UPDATE matches SET winner_id = ? WHERE id = ?",
-            (winner_id, match_id)
-        )
-        self.conn.commit()
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "UPDATE matches SET winner_id = ? WHERE id = ?",
+                (winner_id, match_id)
+            )
+            self.conn.commit()
+
+    def save_finished_match(self, player1_id: str, player2_id: str, winner_id: Optional[str],
+                            board: List[List[int]], moves: List[int]) -> str:
+        """
+        Enregistre un match terminé avec sa suite de coups compactée.
+        
+        Returns:
+            ID du match créé
+        """
+        match_id = str(uuid.uuid4())
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO matches
+                (id, player1_id, player2_id, state, board, winner_id, moves, finished_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    match_id,
+                    player1_id,
+                    player2_id,
+                    GameState.FINISHED.value,
+                    Board.from_lists(board).to_bytes(),
+                    winner_id,
+                    pack_moves(moves),
+                    time.time()
+                )
+            )
+            self.conn.commit()
+        return match_id
 
     def get_queued_players(self) -> List[Player]:
         """Récupère la liste des joueurs en attente"""
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM players WHERE state = ?",
-            (PlayerState.QUEUED.value,)
-        )
-        return [
-            Player(
-                id=row['id'],
-                username=row['username'],
-                state=PlayerState(row['state']),
-                rating=row['rating']
-            )
-            for row in cursor.fetchall()
-        ]
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT * FROM players WHERE state = ?",
+                (PlayerState.QUEUED.value,)
+            )
+            return [Player.from_row(row) for row in cursor.fetchall()]
+
+    def get_or_create_player(self, username: str) -> Player:
+        """Récupère un joueur par son pseudo, ou le crée s'il n'existe pas"""
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT * FROM players WHERE username = ?", (username,))
+            row = cursor.fetchone()
+            if row:
+                return Player.from_row(row)
+                
+            player = Player(id=str(uuid.uuid4()), username=username, state=PlayerState.IDLE)
+            cursor.execute(
+                "INSERT INTO players (id, username, state, rating) VALUES (?, ?, ?, ?)",
+                player.to_row()
+            )
+            cursor.execute(
+                "INSERT INTO player_stats (player_id, rating) VALUES (?, ?)",
+                (player.id, player.rating)
+            )
+            self.conn.commit()
+            return player
+
+    def record_match_result(self, player1_id: str, player2_id: str, winner_id: Optional[str]) -> None:
+        """
+        Met à jour incrémentalement les statistiques des deux joueurs d'un match terminé.
+        
+        Args:
+            player1_id: ID du joueur 1
+            player2_id: ID du joueur 2
+            winner_id: ID du gagnant, ou None en cas de match nul
+        """
+        with self.lock:
+            cursor = self.conn.cursor()
+            for player_id in (player1_id, player2_id):
+                cursor.execute(
+                    "INSERT OR IGNORE INTO player_stats (player_id) VALUES (?)",
+                    (player_id,)
+                )
+            cursor.execute(
+                "SELECT player_id, rating FROM player_stats WHERE player_id IN (?, ?)",
+                (player1_id, player2_id)
+            )
+            ratings = {row['player_id']: row['rating'] for row in cursor.fetchall()}
+            
+            if winner_id is None:
+                score1 = 0.5
+            else:
+                score1 = 1.0 if winner_id == player1_id else 0.0
+            rating1, rating2 = compute_elo(ratings[player1_id], ratings[player2_id], score1)
+            
+            for player_id, score, rating in ((player1_id, score1, rating1), (player2_id, 1.0 - score1, rating2)):
+                cursor.execute(
+                    """
+                    UPDATE player_stats SET
+                        wins = wins + ?,
+                        losses = losses + ?,
+                        draws = draws + ?,
+                        games_played = games_played + 1,
+                        rating = ?
+                    WHERE player_id = ?
+                    """,
+                    (int(score == 1.0), int(score == 0.0), int(score == 0.5), rating, player_id)
+                )
+                cursor.execute(
+                    "UPDATE players SET rating = ? WHERE id = ?",
+                    (rating, player_id)
+                )
+            self.conn.commit()
+
+    def get_top_players(self, limit: int = 10) -> List[PlayerStats]:
+        """Récupère les meilleurs joueurs par classement"""
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                SELECT s.*, p.username FROM player_stats s
+                JOIN players p ON p.id = s.player_id
+                WHERE s.games_played > 0
+                ORDER BY s.rating DESC
+                LIMIT ?
+                """,
+                (limit,)
+            )
+            return [PlayerStats.from_row(row) for row in cursor.fetchall()]
+
+    def get_player_rank(self, player_id: str) -> Optional[int]:
+        """Récupère le rang d'un joueur (1 = meilleur), ou None s'il n'a pas de statistiques"""
+        with self.lock:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "SELECT rating FROM player_stats WHERE player_id = ? AND games_played > 0",
+                (player_id,)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            cursor.execute(
+                "SELECT COUNT(*) FROM player_stats WHERE games_played > 0 AND rating > ?",
+                (row['rating'],)
+            )
+            return cursor.fetchone()[0] + 1
 
     def close(self):
         """Ferme la connexion à la base de données"""
-        if self.conn:
-            self.conn.close() 
\ No newline at end of file
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None 
\ No newline at end of file
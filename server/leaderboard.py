@@ -0,0 +1,95 @@
+import threading
+import logging
+from typing import Dict, Any, Optional
+
+from server.database import Database
+from shared.protocol import create_leaderboard_message
+
+class Leaderboard:
+    """
+    Classement des joueurs construit sur la table player_stats.
+
+    Les statistiques sont mises à jour incrémentalement à la fin de chaque match ;
+    la réponse envoyée aux clients est mise en cache et rafraîchie à intervalle régulier
+    par un thread dédié, pour ne jamais interroger la base à chaque demande. Le rang
+    d'un joueur est lu à sa première demande (requête indexée, voir
+    Database.get_player_rank) puis gardé jusqu'au rafraîchissement suivant.
+    """
+
+    def __init__(self, database: Database, size: int = 10, refresh_interval: float = 5.0):
+        self.database = database
+        self.size = size
+        self.refresh_interval = refresh_interval
+        self.logger = logging.getLogger(__name__)
+        self._cached_players = []
+        self._cached_ranks: Dict[str, Optional[int]] = {}  # Rangs déjà demandés depuis le dernier rafraîchissement
+        self._cache_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Calcule le classement initial et démarre le thread de rafraîchissement"""
+        self.refresh()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arrête le thread de rafraîchissement"""
+        self._stop_event.set()
+
+    def _refresh_loop(self):
+        while not self._stop_event.wait(self.refresh_interval):
+            self.refresh()
+
+    def refresh(self):
+        """Recharge le top N et les rangs depuis la base de données"""
+        try:
+            players = [
+                {
+                    "rank": position,
+                    "username": stats.username,
+                    "rating": stats.rating,
+                    "wins": stats.wins,
+                    "losses": stats.losses,
+                    "draws": stats.draws,
+                    "games_played": stats.games_played
+                }
+                for position, stats in enumerate(self.database.get_top_players(self.size), start=1)
+            ]
+            with self._cache_lock:
+                self._cached_players = players
+                self._cached_ranks = {}
+        except Exception as e:
+            self.logger.error(f"Erreur lors du rafraîchissement du classement: {e}")
+
+    def record_result(self, player1_id: str, player2_id: str, winner_id: Optional[str]):
+        """Enregistre le résultat d'un match terminé"""
+        self.database.record_match_result(player1_id, player2_id, winner_id)
+
+    def get_message(self, player_id: Optional[str] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Construit la réponse LEADERBOARD à partir du cache.
+
+        Args:
+            player_id: ID du joueur demandeur, pour lui indiquer son rang (optionnel)
+            limit: Nombre maximal de joueurs à renvoyer (optionnel)
+
+        Returns:
+            Message LEADERBOARD prêt à être envoyé
+        """
+        with self._cache_lock:
+            players = self._cached_players
+            ranks = self._cached_ranks
+        rank = None
+        if player_id:
+            if player_id in ranks:
+                rank = ranks[player_id]
+            else:
+                try:
+                    rank = ranks[player_id] = self.database.get_player_rank(player_id)
+                except Exception as e:
+                    self.logger.error(f"Erreur lors de la lecture du rang de {player_id}: {e}")
+        if limit is not None:
+            players = players[:max(0, limit)]
+        return create_leaderboard_message(players, rank)
@@ -10,7 +10,8 @@ import random
 from typing import Dict, Optional, List, Tuple
 
 # Ajouter le répertoire parent au PYTHONPATH
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# (en tête de liste pour que le paquet "server" soit prioritaire sur ce script)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared.models import Player, Match, GameState, PlayerState, Move
 from shared.protocol import (
@@ -26,19 +27,31 @@ from shared.protocol import (
     create_queue_update_message
 )
 from shared.game import Puissance4Game
+from server.database import Database
+from server.leaderboard import Leaderboard
+from server.archive import MatchArchiver
+from server.chat import ChatRateLimiter, ChatRelay
+from server.ai_worker import AIWorker
+from server.clock import MatchClock, TimerScheduler
 
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('server.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+def setup_logging():
+    """Configure le logging (appelé au lancement, pas à l'import du module)"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('server.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+# Niveaux de l'IA (voir Puissance4Server)
+AI_LEVELS = ("heuristic", "search")
 
 class Puissance4Server:
-    def __init__(self, host: str = "0.0.0.0", port: int = 5000):
+    def __init__(self, host: str = "0.0.0.0", port: int = 5000, db_path: str = "matchmaking.db",
+                 ai_level: str = "heuristic", ai_ponder: bool = False, time_control: Optional[Tuple[float, float]] = None,
+                 pairing_interval: float = 1.0):
         self.host = host
         self.port = port
         self.server_socket = None
@@ -49,6 +62,29 @@ class Puissance4Server:
         self.match_counter = 0
         self.logger = logging.getLogger(__name__)
         self.ai_preferences: Dict[socket.socket, bool] = {}  # Préférence des joueurs concernant l'IA
+        # Délai entre deux passages du gestionnaire de file : laisse à un humain le temps
+        # d'arriver avant qu'un joueur seul soit apparié à l'IA
+        self.pairing_interval = pairing_interval
+        # Niveau de l'IA : "heuristic" (l'IA d'origine du jeu) ou "search" (recherche
+        # alpha-bêta d'AIWorker, plus forte) ; la réflexion pendant le temps de
+        # l'adversaire (ai_ponder, niveau "search" seulement) est à activer explicitement
+        if ai_level not in AI_LEVELS:
+            raise ValueError(f"Niveau d'IA inconnu: {ai_level}")
+        self.ai_level = ai_level
+        self.ai_ponder = ai_ponder
+        self.ai_workers: Dict[int, AIWorker] = {}  # IA de chaque partie contre l'IA (niveau "search"), par match
+        # Pendules : (temps de base, incrément) en secondes, ou None pour des matchs sans pendule.
+        # Toutes les chutes de drapeau passent par un seul planificateur (un tas, un thread)
+        self.time_control = time_control
+        self.clocks: Dict[int, MatchClock] = {}
+        self.clock_lock = threading.RLock()
+        self.timers = TimerScheduler()
+        self.players: Dict[socket.socket, Player] = {}  # Joueurs enregistrés en base, par socket
+        self.database = Database(db_path)
+        self.leaderboard = Leaderboard(self.database)
+        self.archiver = MatchArchiver(self.database)
+        self.chat_limiter = ChatRateLimiter(rate=1.0, burst=5)
+        self.chat_relay = ChatRelay(send_message)
 
     def start(self):
         try:
@@ -59,6 +95,10 @@ class Puissance4Server:
             self.running = True
             self.logger.info(f"Serveur démarré sur {self.host}:{self.port}")
             threading.Thread(target=self.queue_manager, daemon=True).start()
+            self.leaderboard.start()
+            self.archiver.start()
+            self.timers.start()
+            self.chat_relay.start()
 
             while self.running:
                 try:
@@ -80,6 +120,12 @@ class Puissance4Server:
 
     def stop(self):
         self.running = False
+        self.leaderboard.stop()
+        self.archiver.stop()
+        self.chat_relay.stop()
+        self.timers.stop()
+        for match_id in list(self.ai_workers):
+            self.release_ai_worker(match_id)
         if self.server_socket:
             self.server_socket.close()
         for client in list(self.clients.keys()):
@@ -161,7 +207,7 @@ class Puissance4Server:
                         
                         if not send_result1 or not send_result2:
                             logging.error(f"Échec de l'envoi des messages de début: joueur1: {send_result1}, joueur2: {send_result2}")
-                            del self.matches[match_id]
+                            self.matches.pop(match_id, None)
                             # Remettre les joueurs dans la file si l'envoi échoue
                             if send_result1:
                                 self.queue.append(player1)
@@ -170,9 +216,10 @@ class Puissance4Server:
                             continue
                             
                         self.logger.info(f"Match {match_id} créé entre {self.clients[player1]} et {self.clients[player2]}")
+                        self.start_clock(match_id)
                     except Exception as e:
                         self.logger.error(f"Erreur lors de l'envoi des messages de début de match: {e}")
-                        del self.matches[match_id]
+                        self.matches.pop(match_id, None)
                         # Remettre les joueurs dans la file en cas d'erreur
                         self.queue.append(player1)
                         self.queue.append(player2)
@@ -191,6 +238,8 @@ class Puissance4Server:
                             match_id = self.match_counter
                             self.match_counter += 1
                             self.matches[match_id] = (player, None, game)
+                            if self.ai_level == "search":
+                                self.ai_workers[match_id] = AIWorker(ponder=self.ai_ponder)
                             try:
                                 start_msg = create_start_match_message(
                                     self.clients[player],
@@ -199,13 +248,16 @@ class Puissance4Server:
                                 )
                                 send_message(player, start_msg)
                                 self.logger.info(f"Match {match_id} créé entre {self.clients[player]} et l'IA")
+                                self.start_clock(match_id)
                                 if game.current_player == 2:
                                     self.play_ai_move(match_id)
                             except Exception as e:
                                 self.logger.error(f"Erreur lors de l'envoi du message de début de match avec l'IA: {e}")
-                                del self.matches[match_id]
+                                self.matches.pop(match_id, None)
+                                self.release_ai_worker(match_id)
+                                self.release_clock(match_id)
                                 self.queue.append(player)  # Remettre le joueur dans la file
-                time.sleep(1)  # Attendre plus longtemps pour donner une chance aux joueurs humains de se connecter
+                time.sleep(self.pairing_interval)  # Donner une chance aux joueurs humains de se connecter
             except Exception as e:
                 self.logger.error(f"Erreur dans le gestionnaire de file d'attente: {e}")
 
@@ -216,11 +268,16 @@ class Puissance4Server:
         if game.is_game_over():
             return
             
-        # Ajouter un court délai pour simuler la réflexion de l'IA
-        time.sleep(1)
-        
-        # Faire jouer l'IA
-        row, col = game.play_ai_move()
+        # Faire jouer l'IA : au niveau "search", recherche limitée à think_time ;
+        # sinon l'IA heuristique du jeu, après un court délai simulant la réflexion
+        worker = self.ai_workers.get(match_id)
+        col = worker.choose_move(game) if worker else None
+        if col is not None:
+            row = game.get_next_row(col)
+        else:
+            if not worker:
+                time.sleep(1)
+            row, col = game.play_ai_move()
         if row is not None:
             logging.info(f"L'IA joue en (ligne {row}, colonne {col})")
             # Jouer le coup sans spécifier le joueur, laisser le jeu gérer
@@ -228,11 +285,13 @@ class Puissance4Server:
             logging.info(f"Résultat du coup de l'IA: {success}")
             
             if success:
+                clock = self.press_clock(match_id, 2)
                 try:
                     # Envoyer la mise à jour au joueur humain
                     update_msg = create_game_update_message(
                         game.board,
-                        game.current_player
+                        game.current_player,
+                        clock=clock
                     )
                     logging.info(f"Envoi de la mise à jour après le coup de l'IA: {update_msg}")
                     send_message(player, update_msg)
@@ -243,12 +302,120 @@ class Puissance4Server:
                         end_msg = create_end_game_message(winner)
                         logging.info(f"Partie terminée, envoi du message de fin: {end_msg}")
                         send_message(player, end_msg)
-                        del self.matches[match_id]
+                        self.matches.pop(match_id, None)
+                        self.release_ai_worker(match_id)
+                        self.release_clock(match_id)
+                    elif worker:
+                        # Réfléchir pendant que l'humain joue
+                        worker.ponder(game)
                 except Exception as e:
                     self.logger.error(f"Erreur lors de l'envoi du coup de l'IA: {e}")
         else:
             logging.error("L'IA n'a pas pu jouer de coup valide")
 
+    def start_clock(self, match_id: int):
+        """Démarre la pendule d'un nouveau match (joueur 1 au trait)"""
+        if not self.time_control:
+            return
+        with self.clock_lock:
+            clock = MatchClock(*self.time_control)
+            clock.start(1)
+            self.clocks[match_id] = clock
+            self.schedule_flag(match_id, clock)
+
+    def schedule_flag(self, match_id: int, clock: MatchClock):
+        """(Re)programme la chute du drapeau du joueur au trait"""
+        self.timers.cancel(clock.timer)
+        clock.timer = self.timers.schedule_at(clock.deadline(), self.on_flag_fall, match_id, clock)
+
+    def press_clock(self, match_id: int, player: int) -> Optional[List[float]]:
+        """
+        player a joué : sa pendule s'arrête et celle de l'adversaire démarre
+        (ou la pendule est libérée si la partie est finie).
+        Retourne les temps restants pour la mise à jour, ou None sans pendule.
+        """
+        with self.clock_lock:
+            clock = self.clocks.get(match_id)
+            if not clock:
+                return None
+            entry = self.matches.get(match_id)
+            if entry is None or entry[2].is_game_over():
+                clock.stop()
+                snapshot = clock.snapshot()
+                self.release_clock(match_id)
+                return snapshot
+            clock.press(player)
+            self.schedule_flag(match_id, clock)
+            return clock.snapshot()
+
+    def check_flag(self, match_id: int, player: int) -> bool:
+        """True (et fin du match) si le drapeau de player est tombé avant son coup"""
+        with self.clock_lock:
+            clock = self.clocks.get(match_id)
+            if not (clock and clock.running == player and clock.flag_fallen()):
+                return False
+            entry = self.pop_match_on_time(match_id, player)
+        self.end_match_on_time(match_id, entry, player)
+        return True
+
+    def on_flag_fall(self, match_id: int, clock: MatchClock):
+        """Minuterie du planificateur : le joueur au trait n'a plus de temps"""
+        with self.clock_lock:
+            if self.clocks.get(match_id) is not clock:
+                return  # Match terminé entre-temps
+            if not clock.flag_fallen():
+                self.schedule_flag(match_id, clock)
+                return
+            loser = clock.running
+            entry = self.pop_match_on_time(match_id, loser)
+        self.end_match_on_time(match_id, entry, loser)
+
+    def pop_match_on_time(self, match_id: int, loser: int):
+        """
+        Retire la pendule et le match perdu au temps par loser (appelé sous clock_lock :
+        rien de bloquant ici). Retourne l'entrée du match, ou None s'il était déjà terminé.
+        """
+        self.release_clock(match_id)
+        entry = self.matches.pop(match_id, None)
+        if entry is not None:
+            game = entry[2]
+            game.game_over = True
+            game.winner = 3 - loser
+        return entry
+
+    def end_match_on_time(self, match_id: int, entry, loser: int):
+        """Fin d'un match perdu au temps, hors du verrou des pendules : IA, résultat et END_GAME"""
+        self.release_ai_worker(match_id)
+        if entry is None:
+            return
+        player1, player2, game = entry
+        winner = 3 - loser
+        self.logger.info(f"Match {match_id} : temps écoulé pour le joueur {loser}")
+        if player2:
+            self.record_match_result(
+                {"id": match_id, "player1": player1, "player2": player2, "game": game}, winner
+            )
+        end_msg = create_end_game_message(winner, reason="timeout")
+        for recipient in (player1, player2):
+            if recipient:
+                try:
+                    send_message(recipient, end_msg)
+                except Exception as e:
+                    self.logger.error(f"Erreur lors de l'envoi de la fin au temps: {e}")
+
+    def release_clock(self, match_id: int):
+        """Arrête la pendule d'un match terminé ou abandonné"""
+        with self.clock_lock:
+            clock = self.clocks.pop(match_id, None)
+            if clock:
+                self.timers.cancel(clock.timer)
+
+    def release_ai_worker(self, match_id: int):
+        """Arrête la réflexion de l'IA d'un match terminé ou abandonné"""
+        worker = self.ai_workers.pop(match_id, None)
+        if worker:
+            worker.stop_pondering()
+
     def handle_client(self, client_socket: socket.socket):
         try:
             while self.running:
@@ -295,10 +462,16 @@ class Puissance4Server:
                         # Nettoyer les anciens matchs
                         for match_id, (p1, p2, _) in list(self.matches.items()):
                             if client_socket in (p1, p2):
-                                del self.matches[match_id]
+                                self.matches.pop(match_id, None)
+                                self.release_ai_worker(match_id)
+                                self.release_clock(match_id)
                 
                 # Mettre à jour les informations du client
                 self.clients[client_socket] = username
+                try:
+                    self.players[client_socket] = self.database.get_or_create_player(username)
+                except Exception as e:
+                    self.logger.error(f"Erreur lors de l'enregistrement du joueur {username}: {e}")
                 self.ai_preferences[client_socket] = play_with_ai
                 
                 # Ajouter à la file d'attente si pas déjà dedans
@@ -316,20 +489,29 @@ class Puissance4Server:
                         pass
                 
             elif msg_type == MessageType.PLAY_TURN.value:
+                seq = message.get("seq")
                 match = self.get_match_by_client(client_socket)
                 if not match:
-                    error_msg = create_error_message("Vous n'êtes pas dans une partie")
+                    error_msg = create_error_message("Vous n'êtes pas dans une partie", seq)
                     send_message(client_socket, error_msg)
                     return
                     
                 row = message.get("row")
                 col = message.get("col")
                 if not self.is_valid_move(match, row, col):
-                    error_msg = create_error_message("Coup invalide")
+                    error_msg = create_error_message("Coup invalide", seq)
                     send_message(client_socket, error_msg)
                     return
                     
-                self.update_game_state(match, row, col, client_socket)
+                self.update_game_state(match, row, col, client_socket, seq)
+                
+            elif msg_type == MessageType.LEADERBOARD.value:
+                player = self.players.get(client_socket)
+                leaderboard_msg = self.leaderboard.get_message(
+                    player.id if player else None,
+                    message.get("limit")
+                )
+                send_message(client_socket, leaderboard_msg)
                 
             elif msg_type == MessageType.CHAT_MESSAGE.value:
                 sender = message.get("sender")
@@ -345,6 +527,12 @@ class Puissance4Server:
                     send_message(client_socket, error_msg)
                     return
                     
+                # Limiter le débit de chaque utilisateur
+                if not self.chat_limiter.allow(client_socket):
+                    logging.warning(f"Limite de messages atteinte pour {sender}")
+                    send_message(client_socket, create_error_message("Trop de messages, veuillez patienter"))
+                    return
+                    
                 # Vérifier les sockets des joueurs
                 p1_info = f"{match['player1'].getpeername()} ({self.clients.get(match['player1'], 'inconnu')})"
                 p2_info = "None" if not match['player2'] else f"{match['player2'].getpeername()} ({self.clients.get(match['player2'], 'inconnu')})"
@@ -367,27 +555,14 @@ class Puissance4Server:
                     chat_msg = create_chat_message(sender, msg)
                     logging.info(f"Message formaté: {chat_msg}")
                     
-                    # Essayer d'envoyer le message avec 3 tentatives
-                    success = False
-                    max_retries = 3
-                    
-                    for attempt in range(max_retries):
-                        try:
-                            success = send_message(other_client, chat_msg)
-                            if success:
-                                logging.info(f"Message envoyé avec succès à {other_player_name} (tentative {attempt+1})")
-                                break
-                            else:
-                                logging.warning(f"Échec de l'envoi du message à {other_player_name} (tentative {attempt+1})")
-                                time.sleep(0.1)  # Petite pause avant de réessayer
-                        except Exception as e:
-                            logging.error(f"Erreur lors de l'envoi du message (tentative {attempt+1}): {e}")
-                            time.sleep(0.1)
-                    
-                    if not success:
-                        logging.error(f"Impossible d'envoyer le message de chat à {other_player_name} après {max_retries} tentatives")
-                        error_msg = create_error_message("Impossible d'envoyer le message")
-                        send_message(client_socket, error_msg)
+                    # Le relais envoie le message depuis son propre thread : un destinataire
+                    # lent ne bloque pas le traitement des messages de l'expéditeur
+                    def notify_failure(sender_socket=client_socket, recipient_name=other_player_name):
+                        logging.error(f"Impossible d'envoyer le message de chat à {recipient_name}")
+                        send_message(sender_socket, create_error_message("Impossible d'envoyer le message"))
+                        
+                    if not self.chat_relay.relay(other_client, chat_msg, notify_failure):
+                        send_message(client_socket, create_error_message("Impossible d'envoyer le message"))
                 else:
                     # Si c'est une partie contre l'IA, on peut simuler une réponse
                     if match["player2"] is None:
@@ -419,6 +594,9 @@ class Puissance4Server:
             # Gérer les matchs en cours
             for match_id, (p1, p2, game) in list(self.matches.items()):
                 if client_socket in (p1, p2):
+                    # Le match a pu être terminé entre-temps (fin au temps, sur le thread des minuteries)
+                    if self.matches.pop(match_id, None) is None:
+                        continue
                     other_player = p2 if client_socket == p1 else p1
                     if other_player:
                         try:
@@ -428,10 +606,13 @@ class Puissance4Server:
                                 self.queue.append(other_player)
                         except:
                             pass
-                    del self.matches[match_id]
+                    self.release_ai_worker(match_id)
+                    self.release_clock(match_id)
             
             # Nettoyer les préférences et le client
             del self.clients[client_socket]
+            self.players.pop(client_socket, None)
+            self.chat_limiter.forget(client_socket)
             if client_socket in self.ai_preferences:
                 del self.ai_preferences[client_socket]
         
@@ -440,6 +621,27 @@ class Puissance4Server:
         except:
             pass
 
+    def record_match_result(self, match: Dict, winner: Optional[int]):
+        """Enregistre le résultat d'un match entre deux joueurs humains (classement et historique)"""
+        player1 = self.players.get(match["player1"])
+        player2 = self.players.get(match["player2"])
+        if not player1 or not player2:
+            return
+            
+        if winner == 1:
+            winner_id = player1.id
+        elif winner == 2:
+            winner_id = player2.id
+        else:
+            winner_id = None
+            
+        try:
+            self.leaderboard.record_result(player1.id, player2.id, winner_id)
+            game = match["game"]
+            self.database.save_finished_match(player1.id, player2.id, winner_id, game.board, game.moves)
+        except Exception as e:
+            self.logger.error(f"Erreur lors de l'enregistrement du résultat du match {match['id']}: {e}")
+
     def get_match_by_client(self, client_socket: socket.socket) -> Optional[Dict]:
         """Trouve le match d'un client"""
         for match_id, (p1, p2, game) in self.matches.items():
@@ -470,8 +672,14 @@ class Puissance4Server:
                 
         return False
 
-    def update_game_state(self, match: Dict, row: int, col: int, client_socket: socket.socket):
-        """Met à jour l'état du jeu après un coup"""
+    def update_game_state(self, match: Dict, row: int, col: int, client_socket: socket.socket,
+                          seq: Optional[int] = None):
+        """
+        Met à jour l'état du jeu après un coup.
+        
+        seq est le numéro du coup prédit par le client : il est renvoyé à l'auteur du coup
+        (dans la mise à jour ou l'erreur) pour qu'il confirme ou annule sa prédiction.
+        """
         if not match or not match["game"]:
             return
 
@@ -489,20 +697,31 @@ class Puissance4Server:
         # Vérifier si c'est bien le tour du joueur
         if game.current_player != player:
             logging.error(f"Ce n'est pas le tour du joueur {player}, tour actuel: {game.current_player}")
-            error_msg = create_error_message("Ce n'est pas votre tour")
+            error_msg = create_error_message("Ce n'est pas votre tour", seq)
             send_message(client_socket, error_msg)
             return
         
+        # Pendule : un coup arrivé après la chute du drapeau perd la partie
+        if self.check_flag(match["id"], player):
+            return
+        
+        # Le vrai coup est arrivé : la réflexion de l'IA sur le temps de l'humain s'arrête
+        worker = self.ai_workers.get(match["id"])
+        if worker:
+            worker.stop_pondering()
+        
         # Pour Puissance 4, on n'utilise pas la ligne passée par le client
         # Mais plutôt celle calculée par le jeu
         logging.info(f"Joueur {player} joue en colonne {col}")
         if game.play_move(None, col):
-            # Envoyer la mise à jour aux deux joueurs
-            update_msg = create_game_update_message(game.board, game.current_player)
+            clock = self.press_clock(match["id"], player)
+            # Envoyer la mise à jour aux deux joueurs (avec le numéro du coup pour son auteur)
+            update_msg = create_game_update_message(game.board, game.current_player, clock=clock)
+            author_msg = create_game_update_message(game.board, game.current_player, seq, clock)
             try:
-                send_message(match["player1"], update_msg)
-                if match["player2"]:
-                    send_message(match["player2"], update_msg)
+                for recipient in (match["player1"], match["player2"]):
+                    if recipient:
+                        send_message(recipient, author_msg if recipient is client_socket else update_msg)
             except Exception as e:
                 logging.error(f"Erreur lors de l'envoi de la mise à jour: {e}")
 
@@ -510,12 +729,16 @@ class Puissance4Server:
             if game.is_game_over():
                 winner = game.get_winner()
                 end_msg = create_end_game_message(winner)
+                if match["player2"]:
+                    self.record_match_result(match, winner)
                 try:
                     send_message(match["player1"], end_msg)
                     if match["player2"]:
                         send_message(match["player2"], end_msg)
                     # Supprimer le match
-                    del self.matches[match["id"]]
+                    self.matches.pop(match["id"], None)
+                    self.release_ai_worker(match["id"])
+                    self.release_clock(match["id"])
                 except Exception as e:
                     logging.error(f"Erreur lors de l'envoi du message de fin: {e}")
             # Si c'est une partie contre l'IA et que c'est au tour de l'IA
@@ -523,9 +746,30 @@ class Puissance4Server:
                 # Faire jouer l'IA
                 self.play_ai_move(match["id"])
 
-if __name__ == "__main__":
-    server = Puissance4Server()
+def main():
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Serveur Puissance 4")
+    parser.add_argument("--host", default="0.0.0.0", help="Adresse d'écoute")
+    parser.add_argument("--port", type=int, default=5000, help="Port d'écoute")
+    parser.add_argument("--db", default="matchmaking.db", help="Chemin de la base SQLite")
+    parser.add_argument("--ai-level", choices=AI_LEVELS, default="heuristic",
+                        help="IA heuristique d'origine, ou recherche alpha-bêta (plus forte)")
+    parser.add_argument("--ponder", action="store_true",
+                        help="Niveau search : l'IA réfléchit aussi pendant le temps de l'adversaire")
+    parser.add_argument("--base-time", type=float, default=0.0, help="Temps de réflexion par joueur (s) ; 0 (défaut) : sans pendule")
+    parser.add_argument("--increment", type=float, default=5.0, help="Temps ajouté après chaque coup (s)")
+    parser.add_argument("--pairing-interval", type=float, default=1.0, help="Délai entre deux passages de la file d'attente (s)")
+    args = parser.parse_args()
+    
+    setup_logging()
+    time_control = (args.base_time, args.increment) if args.base_time > 0 else None
+    server = Puissance4Server(args.host, args.port, db_path=args.db, ai_level=args.ai_level, ai_ponder=args.ponder,
+                              time_control=time_control, pairing_interval=args.pairing_interval)
     try:
         server.start()
     except KeyboardInterrupt:
         server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+from typing import List, Optional
+
+import numpy as np
+
+from shared.game import Puissance4Game
+
+def build_cell_windows(rows: int, cols: int, length: int = 4) -> np.ndarray:
+    """
+    Pour chaque case, les fenêtres de length cases alignées qui la contiennent.
+
+    Retourne un tableau (rows * cols, max_fenêtres, length) d'indices de cases à plat ;
+    les fenêtres manquantes sont complétées par l'indice rows * cols, une case
+    supplémentaire toujours vide.
+    """
+    padding = rows * cols
+    per_cell = [[] for _ in range(rows * cols)]
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_row = row + d_row * (length - 1)
+                end_col = col + d_col * (length - 1)
+                if 0 <= end_row < rows and 0 <= end_col < cols:
+                    window = [(row + d_row * i) * cols + col + d_col * i for i in range(length)]
+                    for cell in window:
+                        per_cell[cell].append(window)
+    max_windows = max(len(windows) for windows in per_cell)
+    table = np.full((rows * cols, max_windows, length), padding, dtype=np.intp)
+    for cell, windows in enumerate(per_cell):
+        if windows:
+            table[cell, :len(windows)] = windows
+    return table
+
+class BatchGame:
+    """
+    K parties de Puissance 4 simulées ensemble dans des tableaux NumPy.
+
+    Mêmes conventions que Puissance4Game : ligne 0 en haut, 0 vide, 1 et 2 les
+    joueurs. play() applique un coup à chaque partie en une fois et détecte les
+    victoires de toutes les parties avec des tests d'alignement vectorisés.
+    """
+
+    def __init__(self, count: int, rows: int = 6, cols: int = 7):
+        self.count = count
+        self.ROWS = rows
+        self.COLS = cols
+        self.cell_windows = build_cell_windows(rows, cols)
+        self.index = np.arange(count)
+        # Plateaux à plat, avec une case supplémentaire toujours vide (voir build_cell_windows)
+        self.cells = np.zeros((count, rows * cols + 1), dtype=np.int8)
+        self.heights = np.zeros((count, cols), dtype=np.int8)
+        self.current_player = np.ones(count, dtype=np.int8)
+        self.done = np.zeros(count, dtype=bool)
+        self.winner = np.zeros(count, dtype=np.int8)  # 0 : pas de gagnant (en cours ou match nul)
+        self.move_count = np.zeros(count, dtype=np.int16)
+
+    @property
+    def boards(self) -> np.ndarray:
+        """Vue (K, rows, cols) des plateaux"""
+        return self.cells[:, :-1].reshape(self.count, self.ROWS, self.COLS)
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """Réinitialise toutes les parties, ou seulement celles de mask"""
+        if mask is None:
+            mask = slice(None)
+        self.cells[mask] = 0
+        self.heights[mask] = 0
+        self.current_player[mask] = 1
+        self.done[mask] = False
+        self.winner[mask] = 0
+        self.move_count[mask] = 0
+
+    def legal_moves(self) -> np.ndarray:
+        """Masque (K, cols) des colonnes jouables (aucune pour une partie terminée)"""
+        return (self.heights < self.ROWS) & ~self.done[:, None]
+
+    def play(self, columns: np.ndarray) -> np.ndarray:
+        """
+        Joue columns[i] dans la partie i, pour toutes les parties à la fois.
+
+        Les parties terminées et les coups illégaux sont ignorés.
+
+        Returns:
+            Masque des parties où le coup a été joué
+        """
+        columns = np.asarray(columns, dtype=np.intp)
+        in_range = (columns >= 0) & (columns < self.COLS)
+        safe_columns = np.where(in_range, columns, 0)
+        heights = self.heights[self.index, safe_columns]
+        played = in_range & ~self.done & (heights < self.ROWS)
+
+        games = self.index[played]
+        cols = safe_columns[played]
+        rows = self.ROWS - 1 - heights[played]
+        cells = rows * self.COLS + cols
+        players = self.current_player[played]
+
+        self.cells[games, cells] = players
+        self.heights[games, cols] += 1
+        self.move_count[games] += 1
+
+        # Victoire : une des fenêtres contenant la case jouée est entièrement au joueur
+        windows = self.cells[games[:, None, None], self.cell_windows[cells]]
+        won = (windows == players[:, None, None]).all(axis=2).any(axis=1)
+        full = self.move_count[games] == self.ROWS * self.COLS
+
+        self.winner[games[won]] = players[won]
+        self.done[games[won | full]] = True
+        ongoing = games[~(won | full)]
+        self.current_player[ongoing] = 3 - self.current_player[ongoing]
+        return played
+
+    def random_moves(self, rng: np.random.Generator) -> np.ndarray:
+        """Une colonne jouable tirée au hasard pour chaque partie (-1 si aucune)"""
+        legal = self.legal_moves()
+        weights = rng.random(legal.shape) * legal
+        columns = weights.argmax(axis=1)
+        return np.where(legal.any(axis=1), columns, -1)
+
+    def play_random(self, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """Termine toutes les parties en cours par des coups aléatoires ; retourne les gagnants"""
+        rng = rng or np.random.default_rng()
+        while not self.done.all():
+            self.play(self.random_moves(rng))
+        return self.winner.copy()
+
+    def load(self, i: int, game: Puissance4Game):
+        """Copie une partie Puissance4Game dans la partie i"""
+        board = np.asarray(game.board, dtype=np.int8)
+        self.cells[i, :-1] = board.ravel()
+        self.cells[i, -1] = 0
+        self.heights[i] = (board != 0).sum(axis=0)
+        self.current_player[i] = game.current_player
+        self.done[i] = game.game_over
+        self.winner[i] = game.winner or 0
+        self.move_count[i] = int((board != 0).sum())
+
+    def to_game(self, i: int) -> Puissance4Game:
+        """Copie la partie i dans un Puissance4Game"""
+        game = Puissance4Game()
+        game.set_board(self.boards[i].tolist(), int(self.current_player[i]))
+        game.game_over = bool(self.done[i])
+        game.winner = int(self.winner[i]) or None
+        return game
+
+def self_play(count: int, seed: Optional[int] = None) -> List[int]:
+    """Joue count parties aléatoires ; retourne le nombre de victoires [nuls, joueur 1, joueur 2]"""
+    batch = BatchGame(count)
+    winners = batch.play_random(np.random.default_rng(seed))
+    return np.bincount(winners, minlength=3).tolist()
@@ -0,0 +1,163 @@
+from typing import Dict, List, Optional, Tuple
+
+# Variantes prédéfinies : nom -> (lignes, colonnes, alignement, gravité)
+VARIANTS: Dict[str, Tuple[int, int, int, bool]] = {
+    "morpion": (3, 3, 3, False),
+    "puissance4": (6, 7, 4, True),
+    "puissance5": (8, 9, 5, True),
+    "gomoku": (15, 15, 5, False),
+}
+
+def build_line_masks(rows: int, cols: int, connect: int) -> List[List[int]]:
+    """
+    Pour chaque case (indice row * cols + col), les lignes gagnantes qui la contiennent.
+
+    Chaque ligne est un masque de bits des connect cases alignées (horizontale,
+    verticale ou diagonale) ; une ligne est complète pour un joueur quand
+    jetons & masque == masque. Ces tables servent aussi à la détection de victoire
+    de Puissance4Game et MorpionGame (shared/game.py).
+    """
+    per_cell: List[List[int]] = [[] for _ in range(rows * cols)]
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_row = row + d_row * (connect - 1)
+                end_col = col + d_col * (connect - 1)
+                if not (0 <= end_row < rows and 0 <= end_col < cols):
+                    continue
+                cells = [(row + d_row * i) * cols + col + d_col * i for i in range(connect)]
+                mask = 0
+                for cell in cells:
+                    mask |= 1 << cell
+                for cell in cells:
+                    per_cell[cell].append(mask)
+    return per_cell
+
+class ConnectEngine:
+    """
+    Jeu d'alignement générique : rows x cols, connect jetons alignés pour gagner,
+    avec ou sans gravité (Puissance 4 ou morpion / gomoku).
+
+    Mêmes conventions que Puissance4Game : ligne 0 en haut, 0 vide, 1 et 2 les
+    joueurs. En plus du plateau, les jetons de chaque joueur sont tenus dans un
+    entier (un bit par case) : les lignes gagnantes de chaque case sont calculées
+    une fois à la construction, et check_winner ne fait plus que quelques tests
+    de masques, quelle que soit la taille du plateau.
+    """
+
+    def __init__(self, rows: int = 6, cols: int = 7, connect: int = 4, gravity: bool = True):
+        if connect > max(rows, cols):
+            raise ValueError(f"Alignement de {connect} impossible sur un plateau {rows}x{cols}")
+        self.ROWS = rows
+        self.COLS = cols
+        self.connect = connect
+        self.gravity = gravity
+        self.cell_lines = build_line_masks(rows, cols, connect)
+        self.reset()
+
+    @classmethod
+    def from_variant(cls, name: str) -> "ConnectEngine":
+        """Crée une partie d'une variante de VARIANTS"""
+        if name not in VARIANTS:
+            raise ValueError(f"Variante inconnue: {name}")
+        return cls(*VARIANTS[name])
+
+    def reset(self):
+        """Réinitialise le jeu à son état initial"""
+        self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        self.bits = [0, 0, 0]  # Jetons de chaque joueur (indice 1 et 2), un bit par case
+        self.heights = [0] * self.COLS
+        self.current_player = 1
+        self.game_over = False
+        self.winner = None
+        self.move_stack = []  # (ligne, colonne, joueur au trait avant le coup)
+
+    def get_next_row(self, col: int) -> int:
+        """Avec gravité : ligne où tomberait un jeton joué dans col, ou -1 si la colonne est pleine"""
+        return self.ROWS - 1 - self.heights[col]
+
+    def target_cell(self, row: Optional[int], col: int) -> Optional[Tuple[int, int]]:
+        """
+        Case réellement jouée pour (row, col), ou None si le coup est invalide.
+        Avec gravité, row est ignorée (compatibilité avec le protocole, comme Puissance4Game).
+        """
+        if not (0 <= col < self.COLS):
+            return None
+        if self.gravity:
+            row = self.get_next_row(col)
+            return (row, col) if row != -1 else None
+        if row is None or not (0 <= row < self.ROWS) or self.board[row][col] != 0:
+            return None
+        return row, col
+
+    def legal_moves(self) -> List[Tuple[int, int]]:
+        """Cases jouables (ligne, colonne) ; aucune si la partie est terminée"""
+        if self.game_over:
+            return []
+        if self.gravity:
+            return [(self.get_next_row(col), col) for col in range(self.COLS) if self.heights[col] < self.ROWS]
+        return [(row, col) for row in range(self.ROWS) for col in range(self.COLS) if self.board[row][col] == 0]
+
+    def make_move(self, row: Optional[int], col: int) -> bool:
+        """
+        Joue (row, col) pour le joueur au trait.
+        Retourne False si la partie est terminée ou le coup invalide ;
+        unmake_move restaure exactement l'état précédent.
+        """
+        if self.game_over:
+            return False
+        cell = self.target_cell(row, col)
+        if cell is None:
+            return False
+        row, col = cell
+        player = self.current_player
+        self.move_stack.append((row, col, player))
+        self.board[row][col] = player
+        self.bits[player] |= 1 << (row * self.COLS + col)
+        self.heights[col] += 1
+        if self.check_winner(row, col):
+            self.game_over = True
+            self.winner = player
+        elif self.is_draw():
+            self.game_over = True
+        else:
+            self.current_player = 3 - player
+        return True
+
+    def play_move(self, row: Optional[int], col: int) -> bool:
+        """Joue un coup ; retourne True si le coup est valide et joué, False sinon"""
+        return self.make_move(row, col)
+
+    def unmake_move(self) -> bool:
+        """Retire le dernier coup joué ; retourne False s'il n'y en a aucun"""
+        if not self.move_stack:
+            return False
+        row, col, player = self.move_stack.pop()
+        self.board[row][col] = 0
+        self.bits[player] &= ~(1 << (row * self.COLS + col))
+        self.heights[col] -= 1
+        self.current_player = player
+        self.game_over = False
+        self.winner = None
+        return True
+
+    def check_winner(self, row: int, col: int) -> bool:
+        """True si le jeton en (row, col) complète une ligne gagnante de son joueur"""
+        player = self.board[row][col]
+        if not player:
+            return False
+        bits = self.bits[player]
+        for mask in self.cell_lines[row * self.COLS + col]:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def is_draw(self) -> bool:
+        """True si le plateau est plein"""
+        return len(self.move_stack) == self.ROWS * self.COLS
+
+    def is_game_over(self) -> bool:
+        return self.game_over
+
+    def get_winner(self) -> Optional[int]:
+        return self.winner
@@ -0,0 +1,151 @@
+from typing import List, Tuple
+
+# Poids d'une ligne occupée par un seul joueur, selon son nombre de jetons
+# (3 jetons : compté comme menace, voir THREAT_*)
+LINE_WEIGHTS = [0, 1, 4, 0, 0]
+CENTER_WEIGHT = 3
+
+# Menace : ligne à 3 jetons d'un joueur dont la 4e case est vide. Au Puissance 4,
+# les menaces du premier joueur sur une rangée impaire (comptée depuis le bas) et
+# celles du second sur une rangée paire décident des fins de partie (zugzwang)
+THREAT_GOOD = 16
+THREAT_WEAK = 6
+
+def build_windows(rows: int = 6, cols: int = 7, length: int = 4) -> List[Tuple[Tuple[int, int], ...]]:
+    """Liste toutes les fenêtres de length cases alignées (lignes, colonnes, diagonales)"""
+    windows = []
+    for row in range(rows):
+        for col in range(cols):
+            for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_row = row + d_row * (length - 1)
+                end_col = col + d_col * (length - 1)
+                if 0 <= end_row < rows and 0 <= end_col < cols:
+                    windows.append(tuple((row + d_row * i, col + d_col * i) for i in range(length)))
+    return windows
+
+def line_value(player1: int, player2: int) -> int:
+    """Valeur d'une ligne pour le joueur 1, d'après le nombre de jetons de chaque joueur"""
+    if player1 and player2:
+        return 0
+    return LINE_WEIGHTS[player1] - LINE_WEIGHTS[player2]
+
+class ThreatEvaluator:
+    """
+    Évaluation statique incrémentale d'une partie de Puissance 4.
+
+    Pour chaque ligne gagnante, le nombre de jetons de chaque joueur est tenu à jour
+    par add() et remove(), appelés par Puissance4Game à chaque coup joué ou retiré
+    (make_move / unmake_move). Les menaces (cases vides qui compléteraient une
+    ligne) sont suivies case par case avec leur parité de rangée : evaluate() ne
+    parcourt plus le plateau, quelle que soit la profondeur de la recherche.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.ROWS = game.ROWS
+        self.COLS = game.COLS
+        self.center_col = self.COLS // 2
+        self.lines = build_windows(self.ROWS, self.COLS)
+        self.cell_lines = [[[] for _ in range(self.COLS)] for _ in range(self.ROWS)]
+        for index, line in enumerate(self.lines):
+            for row, col in line:
+                self.cell_lines[row][col].append(index)
+        # Rangée impaire en comptant depuis le bas (la rangée du bas est la 1re)
+        self.odd_row = [(self.ROWS - row) % 2 == 1 for row in range(self.ROWS)]
+        self.reset()
+        game.evaluator = self
+
+    def reset(self):
+        """Recalcule tout l'état depuis le plateau de la partie (ex. après set_board)"""
+        board = self.game.board
+        self.counts = [[0, 0, 0] for _ in self.lines]  # Jetons des joueurs 1 et 2 par ligne
+        self.threat_cells = [None] + [[[0] * self.COLS for _ in range(self.ROWS)] for _ in range(2)]
+        self.odd_threats = [0, 0, 0]  # Cases menacées par joueur, sur rangée impaire / paire
+        self.even_threats = [0, 0, 0]
+        self.line_score = 0
+        self.center = 0
+        for row in range(self.ROWS):
+            cell = board[row][self.center_col]
+            if cell:
+                self.center += 1 if cell == 1 else -1
+        for index, line in enumerate(self.lines):
+            counts = self.counts[index]
+            for row, col in line:
+                cell = board[row][col]
+                if cell:
+                    counts[cell] += 1
+            self.line_score += line_value(counts[1], counts[2])
+            for player in (1, 2):
+                if counts[player] == 3 and counts[3 - player] == 0:
+                    self.add_threat(player, *self.empty_cell(index))
+
+    def empty_cell(self, index: int) -> Tuple[int, int]:
+        for row, col in self.lines[index]:
+            if self.game.board[row][col] == 0:
+                return row, col
+        raise ValueError(f"Ligne {index} pleine")
+
+    def add_threat(self, player: int, row: int, col: int):
+        cells = self.threat_cells[player]
+        if cells[row][col] == 0:
+            if self.odd_row[row]:
+                self.odd_threats[player] += 1
+            else:
+                self.even_threats[player] += 1
+        cells[row][col] += 1
+
+    def drop_threat(self, player: int, row: int, col: int):
+        cells = self.threat_cells[player]
+        cells[row][col] -= 1
+        if cells[row][col] == 0:
+            if self.odd_row[row]:
+                self.odd_threats[player] -= 1
+            else:
+                self.even_threats[player] -= 1
+
+    def add(self, row: int, col: int, player: int):
+        """Jeton de player posé en (row, col) ; appelé après la mise à jour du plateau"""
+        other = 3 - player
+        if col == self.center_col:
+            self.center += 1 if player == 1 else -1
+        for index in self.cell_lines[row][col]:
+            counts = self.counts[index]
+            mine, theirs = counts[player], counts[other]
+            self.line_score -= line_value(counts[1], counts[2])
+            if theirs == 3 and mine == 0:
+                self.drop_threat(other, row, col)  # Menace adverse bloquée
+            elif mine == 3 and theirs == 0:
+                self.drop_threat(player, row, col)  # Ligne complétée
+            counts[player] = mine + 1
+            if mine == 2 and theirs == 0:
+                self.add_threat(player, *self.empty_cell(index))
+            self.line_score += line_value(counts[1], counts[2])
+
+    def remove(self, row: int, col: int, player: int):
+        """Jeton de player retiré de (row, col) ; appelé avant que la case soit vidée"""
+        other = 3 - player
+        if col == self.center_col:
+            self.center -= 1 if player == 1 else -1
+        for index in self.cell_lines[row][col]:
+            counts = self.counts[index]
+            mine, theirs = counts[player], counts[other]
+            self.line_score -= line_value(counts[1], counts[2])
+            if mine == 3 and theirs == 0:
+                self.drop_threat(player, *self.empty_cell(index))
+            counts[player] = mine - 1
+            if mine == 4:
+                self.add_threat(player, row, col)
+            elif mine == 1 and theirs == 3:
+                self.add_threat(other, row, col)
+            self.line_score += line_value(counts[1], counts[2])
+
+    def threats(self, player: int) -> Tuple[int, int]:
+        """(cases menacées sur rangée impaire, sur rangée paire) par player"""
+        return self.odd_threats[player], self.even_threats[player]
+
+    def evaluate(self, player: int) -> int:
+        """Score de la position pour player"""
+        score = self.line_score + CENTER_WEIGHT * self.center
+        score += THREAT_GOOD * self.odd_threats[1] + THREAT_WEAK * self.even_threats[1]
+        score -= THREAT_GOOD * self.even_threats[2] + THREAT_WEAK * self.odd_threats[2]
+        return score if player == 1 else -score
@@ -1,6 +1,29 @@
+import random
+
+from shared.connect_engine import build_line_masks
+from shared.morpion_solver import best_move as morpion_best_move
+
+def build_zobrist_table(rows: int, cols: int, seed: int = 0x5034) -> list:
+    """
+    Table de Zobrist : une clé aléatoire de 64 bits par (ligne, colonne, joueur).
+
+    La graine est fixe pour que les clés soient stables d'un processus et d'une
+    exécution à l'autre (tables de cache, bibliothèques d'ouvertures, index).
+    """
+    rng = random.Random(seed)
+    return [[[0, rng.getrandbits(64), rng.getrandbits(64)] for _ in range(cols)] for _ in range(rows)]
+
+ZOBRIST = build_zobrist_table(6, 7)
+
+# Lignes gagnantes de chaque case (indice row * cols + col), en masques de bits
+P4_CELL_LINES = build_line_masks(6, 7, 4)
+MORPION_CELL_LINES = build_line_masks(3, 3, 3)
+MORPION_LINES = sorted({mask for masks in MORPION_CELL_LINES for mask in masks})
+
 class MorpionGame:
     def __init__(self):
         self.board = [[0 for _ in range(3)] for _ in range(3)]  # 0: vide, 1: X, 2: O
+        self.bits = [0, 0, 0]  # Jetons de chaque joueur (indices 1 et 2), un bit par case
         self.current_player = 1  # 1: X, 2: O
         self.game_over = False
         self.winner = None
@@ -20,9 +43,10 @@ class MorpionGame:
             return False
             
         self.board[row][col] = self.current_player
+        self.bits[self.current_player] |= 1 << (row * 3 + col)
         
         # Vérifier si le coup gagne la partie
-        if self.check_winner():
+        if self.check_winner(row, col):
             self.game_over = True
             self.winner = self.current_player
         # Vérifier si c'est une égalité
@@ -34,33 +58,23 @@ class MorpionGame:
             
         return True
 
-    def check_winner(self) -> bool:
+    def check_winner(self, row: int = None, col: int = None) -> bool:
         """
-        Vérifie s'il y a un gagnant.
-        Retourne True si un joueur a gagné, False sinon.
+        Vérifie s'il y a un gagnant (seulement parmi les lignes de (row, col) si la
+        case est donnée). Retourne True si un joueur a gagné, False sinon.
+        
+        Chaque ligne gagnante est un masque de bits (voir shared.connect_engine) :
+        une ligne est complète quand jetons & masque == masque.
         """
-        # Vérifier les lignes
-        for row in range(3):
-            if (self.board[row][0] != 0 and 
-                self.board[row][0] == self.board[row][1] == self.board[row][2]):
-                return True
-                
-        # Vérifier les colonnes
-        for col in range(3):
-            if (self.board[0][col] != 0 and 
-                self.board[0][col] == self.board[1][col] == self.board[2][col]):
+        if row is not None:
+            player = self.board[row][col]
+            if not player:
+                return False
+            bits = self.bits[player]
+            return any(bits & mask == mask for mask in MORPION_CELL_LINES[row * 3 + col])
+        for bits in self.bits[1:]:
+            if any(bits & mask == mask for mask in MORPION_LINES):
                 return True
-                
-        # Vérifier la diagonale principale
-        if (self.board[0][0] != 0 and 
-            self.board[0][0] == self.board[1][1] == self.board[2][2]):
-            return True
-            
-        # Vérifier la diagonale secondaire
-        if (self.board[0][2] != 0 and 
-            self.board[0][2] == self.board[1][1] == self.board[2][0]):
-            return True
-            
         return False
 
     def is_draw(self) -> bool:
@@ -74,11 +88,24 @@ class MorpionGame:
                     return False
         return True
 
+    def play_ai_move(self):
+        """
+        Coup parfait de l'IA pour le joueur au trait.
+        Retourne la ligne et la colonne du coup (None si la partie est terminée).
+        
+        Le coup est lu dans la table précalculée shared/morpion_table.py (toutes
+        les positions à une symétrie près) : aucune recherche pendant la partie.
+        """
+        if self.game_over:
+            return None
+        return morpion_best_move(self.board)
+
     def reset(self):
         """
         Réinitialise le jeu à son état initial.
         """
         self.board = [[0 for _ in range(3)] for _ in range(3)]
+        self.bits = [0, 0, 0]
         self.current_player = 1
         self.game_over = False
         self.winner = None
@@ -93,6 +120,18 @@ class Puissance4Game:
         self.current_player = 1  # 1: Rouge, 2: Jaune
         self.game_over = False
         self.winner = None
+        self.moves = []  # Colonnes jouées, dans l'ordre
+        # Pile des coups pour make_move / unmake_move : (colonne, joueur au trait avant le coup)
+        self.move_stack = []
+        self.redo_stack = []  # Colonnes annulées par undo_move, rejouables par redo_move
+        self.heights = [0] * self.COLS  # Nombre de jetons par colonne
+        self.bits = [0, 0, 0]  # Jetons de chaque joueur (indices 1 et 2), un bit par case (voir check_winner)
+        # Clés de Zobrist de la position et de son reflet gauche-droite, tenues à jour
+        # à chaque coup (voir position_key)
+        self.hash = 0
+        self.mirror_hash = 0
+        # Évaluation incrémentale attachée à la partie, prévenue de chaque coup (voir shared.evaluation)
+        self.evaluator = None
         
     def play_move(self, row: int, col: int, player=None) -> bool:
         """
@@ -117,11 +156,7 @@ class Puissance4Game:
         print(f"Joueur actuel: {current}, player passé: {player}")
         
         # Trouver la position la plus basse disponible dans la colonne
-        row_to_play = -1
-        for r in range(self.ROWS - 1, -1, -1):
-            if self.board[r][col] == 0:
-                row_to_play = r
-                break
+        row_to_play = self.get_next_row(col)
                 
         # Si la colonne est pleine, le coup est invalide
         if row_to_play == -1:
@@ -129,7 +164,8 @@ class Puissance4Game:
             return False
             
         # Jouer le coup
-        self.board[row_to_play][col] = current
+        self.redo_stack.clear()
+        self.place(row_to_play, col, current)
         
         # Vérifier si le coup gagne la partie
         if self.check_winner(row_to_play, col):
@@ -149,63 +185,143 @@ class Puissance4Game:
             
         return True
         
+    def place(self, row: int, col: int, player: int):
+        """Pose le jeton de player et empile le coup (plateau, hauteurs, clés, historique)"""
+        self.move_stack.append((col, self.current_player))
+        self.board[row][col] = player
+        self.bits[player] |= 1 << (row * self.COLS + col)
+        self.heights[col] += 1
+        self.toggle_hash(row, col, player)
+        self.moves.append(col)
+        if self.evaluator:
+            self.evaluator.add(row, col, player)
+        
+    def make_move(self, col: int) -> bool:
+        """
+        Joue col pour le joueur au trait, sans copie ni affichage (chemin de la recherche).
+        Retourne False si la partie est terminée ou la colonne pleine ou invalide.
+        
+        La victoire et le match nul sont détectés comme dans play_move ;
+        unmake_move restaure exactement l'état précédent.
+        """
+        if self.game_over or not (0 <= col < self.COLS) or self.heights[col] >= self.ROWS:
+            return False
+        row = self.ROWS - 1 - self.heights[col]
+        player = self.current_player
+        self.place(row, col, player)
+        if self.check_winner(row, col):
+            self.game_over = True
+            self.winner = player
+        elif self.is_draw():
+            self.game_over = True
+        else:
+            self.current_player = 3 - player
+        return True
+        
+    def unmake_move(self) -> bool:
+        """
+        Retire le dernier coup joué et restaure le joueur au trait et l'état de fin de partie.
+        Retourne False s'il n'y a aucun coup à retirer.
+        """
+        if not self.move_stack:
+            return False
+        col, previous_player = self.move_stack.pop()
+        self.moves.pop()
+        self.heights[col] -= 1
+        row = self.ROWS - 1 - self.heights[col]
+        player = self.board[row][col]
+        self.toggle_hash(row, col, player)
+        self.bits[player] &= ~(1 << (row * self.COLS + col))
+        if self.evaluator:
+            self.evaluator.remove(row, col, player)
+        self.board[row][col] = 0
+        self.current_player = previous_player
+        # Un coup n'est possible que si la partie n'était pas terminée
+        self.game_over = False
+        self.winner = None
+        return True
+        
+    def undo_move(self) -> bool:
+        """
+        Annule le dernier coup (reprise de coup) ; il peut être rejoué avec redo_move.
+        Retourne False s'il n'y a aucun coup à annuler.
+        """
+        if not self.move_stack:
+            return False
+        self.redo_stack.append(self.move_stack[-1][0])
+        return self.unmake_move()
+        
+    def redo_move(self) -> bool:
+        """
+        Rejoue le dernier coup annulé par undo_move.
+        Retourne False s'il n'y a aucun coup à rejouer.
+        """
+        if not self.redo_stack:
+            return False
+        return self.make_move(self.redo_stack.pop())
+        
+    def toggle_hash(self, row: int, col: int, player: int):
+        """Ajoute ou retire (XOR) le jeton de player en (row, col) des clés de Zobrist"""
+        self.hash ^= ZOBRIST[row][col][player]
+        self.mirror_hash ^= ZOBRIST[row][self.COLS - 1 - col][player]
+        
+    def rehash(self):
+        """Recalcule les clés de Zobrist à partir de self.board"""
+        self.hash = 0
+        self.mirror_hash = 0
+        for row in range(self.ROWS):
+            for col in range(self.COLS):
+                if self.board[row][col]:
+                    self.toggle_hash(row, col, self.board[row][col])
+                    
+    def set_board(self, board: list, current_player: int = None):
+        """
+        Remplace le plateau (ex. état reçu du serveur) et recalcule les clés, hauteurs et masques.
+        L'historique des coups n'est pas connu : self.moves et les piles sont vidés.
+        """
+        self.board = board
+        self.moves = []
+        self.move_stack = []
+        self.redo_stack = []
+        self.heights = [sum(1 for row in board if row[col]) for col in range(self.COLS)]
+        self.bits = [0, 0, 0]
+        for row in range(self.ROWS):
+            for col in range(self.COLS):
+                if board[row][col]:
+                    self.bits[board[row][col]] |= 1 << (row * self.COLS + col)
+        if current_player is not None:
+            self.current_player = current_player
+        self.rehash()
+        if self.evaluator:
+            self.evaluator.reset()
+        
+    def position_key(self) -> int:
+        """
+        Clé canonique de 64 bits de la position : identique pour une position et
+        son reflet gauche-droite, qui ont la même valeur.
+        """
+        return min(self.hash, self.mirror_hash)
+        
+    def get_next_row(self, col: int) -> int:
+        """Retourne la ligne où tomberait un jeton joué dans col, ou -1 si la colonne est pleine"""
+        return self.ROWS - 1 - self.heights[col]
+        
     def check_winner(self, row: int, col: int) -> bool:
         """
         Vérifie s'il y a un gagnant à partir de la dernière pièce jouée.
         Retourne True si un joueur a gagné, False sinon.
+        
+        Les lignes gagnantes passant par chaque case sont des masques de bits
+        précalculés (P4_CELL_LINES) : quelques tests de masques au lieu d'un
+        parcours du plateau dans les quatre directions.
         """
         player = self.board[row][col]
-        
-        # Vérifier horizontalement
-        count = 0
-        for c in range(max(0, col - 3), min(self.COLS, col + 4)):
-            if self.board[row][c] == player:
-                count += 1
-                if count >= 4:
-                    return True
-            else:
-                count = 0
-                
-        # Vérifier verticalement
-        count = 0
-        for r in range(max(0, row - 3), min(self.ROWS, row + 4)):
-            if self.board[r][col] == player:
-                count += 1
-                if count >= 4:
-                    return True
-            else:
-                count = 0
-                
-        # Vérifier diagonale (haut gauche à bas droite)
-        count = 0
-        r_start = row - min(row, col, 3)
-        c_start = col - min(row, col, 3)
-        for i in range(7):  # Max 7 positions à vérifier
-            r = r_start + i
-            c = c_start + i
-            if 0 <= r < self.ROWS and 0 <= c < self.COLS:
-                if self.board[r][c] == player:
-                    count += 1
-                    if count >= 4:
-                        return True
-                else:
-                    count = 0
-                    
-        # Vérifier diagonale (haut droite à bas gauche)
-        count = 0
-        r_start = row - min(row, self.COLS - 1 - col, 3)
-        c_start = col + min(row, self.COLS - 1 - col, 3)
-        for i in range(7):  # Max 7 positions à vérifier
-            r = r_start + i
-            c = c_start - i
-            if 0 <= r < self.ROWS and 0 <= c < self.COLS:
-                if self.board[r][c] == player:
-                    count += 1
-                    if count >= 4:
-                        return True
-                else:
-                    count = 0
-                    
+        if not player:
+            return False
+        bits = self.bits[player]
+        for mask in P4_CELL_LINES[row * self.COLS + col]:
+            if bits & mask == mask:
+                return True
         return False
         
     def is_draw(self) -> bool:
@@ -232,8 +348,6 @@ class Puissance4Game:
         Fonction intelligente pour que l'IA joue un coup.
         Retourne la ligne et la colonne du coup joué.
         """
-        import random
-        
         print(f"IA réfléchit au coup (joueur {self.current_player})")
         
         # Stratégie prioritaire:
@@ -243,73 +357,44 @@ class Puissance4Game:
         # 4. Jouer au centre si possible
         # 5. Sinon, coup aléatoire
         
+        # Les coups sont simulés avec make_move / unmake_move (pas de copie du plateau) :
+        # hauteurs, clés de Zobrist et évaluation incrémentale restent cohérentes
+        
         # 1. Vérifier d'abord s'il y a un coup gagnant
         for col in range(self.COLS):
-            # Trouver la position la plus basse disponible dans la colonne
-            for row in range(self.ROWS - 1, -1, -1):
-                if self.board[row][col] == 0:
-                    # Simuler le coup
-                    self.board[row][col] = self.current_player
-                    # Vérifier si c'est un coup gagnant
-                    if self.check_winner(row, col):
-                        # Annuler le coup simulé
-                        self.board[row][col] = 0
-                        print(f"IA joue un coup gagnant en colonne {col}")
-                        return row, col
-                    # Annuler le coup simulé
-                    self.board[row][col] = 0
-                    break
+            if self.wins_with(col, self.current_player):
+                print(f"IA joue un coup gagnant en colonne {col}")
+                return self.get_next_row(col), col
         
         # 2. Ensuite, vérifier s'il faut bloquer un coup gagnant de l'adversaire
         opponent = 3 - self.current_player
         for col in range(self.COLS):
-            # Trouver la position la plus basse disponible dans la colonne
-            for row in range(self.ROWS - 1, -1, -1):
-                if self.board[row][col] == 0:
-                    # Simuler le coup de l'adversaire
-                    self.board[row][col] = opponent
-                    # Vérifier si c'est un coup gagnant pour l'adversaire
-                    if self.check_winner(row, col):
-                        # Annuler le coup simulé
-                        self.board[row][col] = 0
-                        print(f"IA bloque un coup gagnant en colonne {col}")
-                        return row, col
-                    # Annuler le coup simulé
-                    self.board[row][col] = 0
-                    break
+            if self.wins_with(col, opponent):
+                print(f"IA bloque un coup gagnant en colonne {col}")
+                return self.get_next_row(col), col
                     
         # 3. Éviter les coups qui permettraient à l'adversaire de gagner au tour suivant
         bad_columns = []
         for col in range(self.COLS):
-            # Vérifier si la colonne est jouable
-            if self.board[0][col] != 0:
-                continue  # Colonne pleine
+            # Jouer notre coup (colonne pleine : rien à vérifier)
+            if not self.make_move(col):
+                continue
                 
-            # Trouver où notre jeton atterrirait
-            for row in range(self.ROWS - 1, -1, -1):
-                if self.board[row][col] == 0:
-                    our_row = row
-                    break
-                    
-            # Jouer notre coup
-            self.board[our_row][col] = self.current_player
-            
             # Vérifier si ça donne un coup gagnant à l'adversaire au-dessus
-            if our_row > 0:  # S'il y a de la place au-dessus
-                self.board[our_row - 1][col] = opponent
-                if self.check_winner(our_row - 1, col):
+            if self.make_move(col):
+                if self.winner == opponent:
                     bad_columns.append(col)
-                self.board[our_row - 1][col] = 0  # Annuler le coup simulé
+                self.unmake_move()  # Annuler le coup simulé
             
             # Annuler notre coup
-            self.board[our_row][col] = 0
+            self.unmake_move()
         
         # 4. Préférer jouer au centre
         center_col = self.COLS // 2
-        for row in range(self.ROWS - 1, -1, -1):
-            if self.board[row][center_col] == 0 and center_col not in bad_columns:
-                print(f"IA joue au centre (colonne {center_col})")
-                return row, center_col
+        row = self.get_next_row(center_col)
+        if row != -1 and center_col not in bad_columns:
+            print(f"IA joue au centre (colonne {center_col})")
+            return row, center_col
         
         # 5. Sinon, jouer un coup aléatoire parmi les colonnes non pleines et non désavantageuses
         valid_cols = []
@@ -319,28 +404,46 @@ class Puissance4Game:
                 
         if valid_cols:
             col = random.choice(valid_cols)
-            # Trouver la position la plus basse disponible dans la colonne
-            for row in range(self.ROWS - 1, -1, -1):
-                if self.board[row][col] == 0:
-                    print(f"IA joue un coup aléatoire en colonne {col}")
-                    return row, col
+            print(f"IA joue un coup aléatoire en colonne {col}")
+            return self.get_next_row(col), col
         
         # Si toutes les colonnes sont désavantageuses ou pleines, jouer dans n'importe quelle colonne non pleine
         if bad_columns:
             for col in range(self.COLS):
                 if self.board[0][col] == 0:  # Si la colonne n'est pas pleine
-                    for row in range(self.ROWS - 1, -1, -1):
-                        if self.board[row][col] == 0:
-                            print(f"IA joue un coup non optimal en colonne {col}")
-                            return row, col
+                    print(f"IA joue un coup non optimal en colonne {col}")
+                    return self.get_next_row(col), col
                     
         # Aucun coup valide trouvé (ne devrait pas arriver si is_draw() est vérifié)
         print("IA ne trouve aucun coup valide")
         return None, None
         
+    def wins_with(self, col: int, player: int) -> bool:
+        """
+        True si un jeton de player joué dans col gagnerait la partie, que player soit
+        au trait ou non. Le coup est joué puis retiré (make_move / unmake_move).
+        """
+        current = self.current_player
+        self.current_player = player
+        played = self.make_move(col)
+        won = played and self.winner == player
+        if played:
+            self.unmake_move()
+        self.current_player = current
+        return won
+        
     def reset(self):
         """Réinitialise le jeu à son état initial."""
         self.board = [[0 for _ in range(self.COLS)] for _ in range(self.ROWS)]
         self.current_player = 1
         self.game_over = False
-        self.winner = None 
\ No newline at end of file
+        self.winner = None
+        self.moves = []
+        self.move_stack = []
+        self.redo_stack = []
+        self.heights = [0] * self.COLS
+        self.bits = [0, 0, 0]
+        self.hash = 0
+        self.mirror_hash = 0
+        if self.evaluator:
+            self.evaluator.reset()
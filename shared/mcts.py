@@ -0,0 +1,297 @@
+import math
+import random
+import time
+from array import array
+from collections import deque
+from typing import List, Optional, Tuple
+
+ROWS = 6
+COLS = 7
+HEIGHT = ROWS + 1  # Une case sentinelle au-dessus de chaque colonne
+
+# Plateau compact (bitboard) : la colonne c occupe les bits c*HEIGHT .. c*HEIGHT+ROWS-1,
+# du bas vers le haut. Une position est (current, mask) : jetons du joueur au trait
+# et ensemble des jetons posés.
+BOTTOM_MASKS = [1 << (col * HEIGHT) for col in range(COLS)]
+TOP_MASKS = [1 << (col * HEIGHT + ROWS - 1) for col in range(COLS)]
+FULL_MASK = sum(((1 << ROWS) - 1) << (col * HEIGHT) for col in range(COLS))
+CENTER_FIRST = [3, 2, 4, 1, 5, 0, 6]
+
+# Valeurs de terminal[] pour un nœud
+NOT_TERMINAL = 0
+TERMINAL_WIN = 1  # Le joueur qui vient de jouer a gagné
+TERMINAL_DRAW = 2
+
+def is_alignment(bits: int) -> bool:
+    """True si bits contient 4 jetons alignés (vertical, horizontal ou diagonales)"""
+    for shift in (1, HEIGHT, HEIGHT - 1, HEIGHT + 1):
+        pairs = bits & (bits >> shift)
+        if pairs & (pairs >> (2 * shift)):
+            return True
+    return False
+
+def can_play(mask: int, col: int) -> bool:
+    return not mask & TOP_MASKS[col]
+
+def play(current: int, mask: int, col: int) -> Tuple[int, int, bool]:
+    """
+    Joue col pour le joueur au trait.
+
+    Returns:
+        (current, mask) de la position suivante (du point de vue de l'adversaire),
+        et True si le coup est gagnant
+    """
+    new_mask = mask | (mask + BOTTOM_MASKS[col])
+    mover = current | (new_mask ^ mask)
+    return mover ^ new_mask, new_mask, is_alignment(mover)
+
+def position_from_board(board: List[List[int]], player: int) -> Tuple[int, int]:
+    """Convertit un plateau en listes (ligne 0 en haut) en (current, mask) pour player au trait"""
+    current = mask = 0
+    for row in range(ROWS):
+        for col in range(COLS):
+            cell = board[row][col]
+            if cell:
+                bit = 1 << (col * HEIGHT + ROWS - 1 - row)
+                mask |= bit
+                if cell == player:
+                    current |= bit
+    return current, mask
+
+def random_playout(current: int, mask: int, rng: random.Random) -> int:
+    """
+    Termine la partie au hasard depuis la position.
+
+    Returns:
+        1 si le joueur au trait gagne, -1 s'il perd, 0 en cas de match nul
+    """
+    sign = 1
+    while mask != FULL_MASK:
+        col = rng.randrange(COLS)
+        while mask & TOP_MASKS[col]:
+            col = rng.randrange(COLS)
+        current, mask, won = play(current, mask, col)
+        if won:
+            return sign
+        sign = -sign
+    return 0
+
+class MCTS:
+    """
+    Recherche arborescente Monte-Carlo (UCT) avec parties aléatoires rapides.
+
+    Les nœuds sont stockés dans des tableaux parallèles (coup, premier enfant,
+    nombre d'enfants, état terminal, visites, gains) : les enfants d'un nœud sont contigus.
+    L'arbre est conservé d'un coup à l'autre : advance() (ou sync()) en fait
+    remonter la racine sur le coup joué au lieu de tout recommencer.
+
+    Utilisée par la politique "mcts" des bots (client/bot.py --policy mcts) ;
+    l'IA du serveur reste la recherche alpha-bêta (server/ai_worker.py).
+    """
+
+    def __init__(self, playouts: int = 2000, exploration: float = 1.41,
+                 max_nodes: int = 1_000_000, seed: Optional[int] = None):
+        self.playouts = playouts
+        self.exploration = exploration
+        self.max_nodes = max_nodes
+        self.rng = random.Random(seed)
+        self.set_position(0, 0)
+
+    def set_position(self, current: int, mask: int):
+        """Repart d'un arbre vide sur la position (current, mask)"""
+        self.root_current = current
+        self.root_mask = mask
+        self.move = array("b", [-1])
+        self.first_child = array("i", [0])
+        self.child_count = array("b", [0])
+        self.terminal = array("b", [NOT_TERMINAL])
+        self.visits = array("i", [0])
+        self.wins = array("d", [0.0])  # Du point de vue du joueur qui a joué le coup menant au nœud
+
+    def set_board(self, board: List[List[int]], player: int):
+        """Repart d'un arbre vide sur un plateau en listes, player au trait"""
+        self.set_position(*position_from_board(board, player))
+
+    @property
+    def node_count(self) -> int:
+        return len(self.visits)
+
+    def expand(self, node: int, current: int, mask: int):
+        """Crée d'un coup tous les enfants de node (contigus dans les tableaux)"""
+        self.first_child[node] = len(self.visits)
+        count = 0
+        for col in CENTER_FIRST:
+            if not can_play(mask, col):
+                continue
+            _, new_mask, won = play(current, mask, col)
+            self.move.append(col)
+            self.first_child.append(0)
+            self.child_count.append(0)
+            self.terminal.append(TERMINAL_WIN if won else TERMINAL_DRAW if new_mask == FULL_MASK else NOT_TERMINAL)
+            self.visits.append(0)
+            self.wins.append(0.0)
+            count += 1
+        self.child_count[node] = count
+
+    def select_child(self, node: int) -> int:
+        """Enfant de node qui maximise UCB1 (un enfant jamais visité est choisi d'abord)"""
+        first = self.first_child[node]
+        log_visits = math.log(max(1, self.visits[node]))
+        exploration = self.exploration
+        visits = self.visits
+        wins = self.wins
+        best, best_value = first, -1.0
+        for child in range(first, first + self.child_count[node]):
+            child_visits = visits[child]
+            if child_visits == 0:
+                return child
+            value = wins[child] / child_visits + exploration * math.sqrt(log_visits / child_visits)
+            if value > best_value:
+                best, best_value = child, value
+        return best
+
+    def iterate(self):
+        """Une itération : sélection, expansion, partie aléatoire, rétropropagation"""
+        node = 0
+        current, mask = self.root_current, self.root_mask
+        path = [0]
+
+        # Sélection
+        while self.child_count[node] and self.terminal[node] == NOT_TERMINAL:
+            node = self.select_child(node)
+            current, mask, _ = play(current, mask, self.move[node])
+            path.append(node)
+
+        # Expansion (d'un nœud déjà visité, tant que la mémoire le permet)
+        if (self.terminal[node] == NOT_TERMINAL and (self.visits[node] or node == 0)
+                and self.node_count + COLS <= self.max_nodes):
+            self.expand(node, current, mask)
+            if self.child_count[node]:
+                node = self.select_child(node)
+                current, mask, _ = play(current, mask, self.move[node])
+                path.append(node)
+
+        # Évaluation, du point de vue du joueur qui a joué le coup menant au nœud
+        terminal = self.terminal[node]
+        if terminal == TERMINAL_WIN:
+            result = 1.0
+        elif terminal == TERMINAL_DRAW:
+            result = 0.5
+        else:
+            outcome = random_playout(current, mask, self.rng)
+            result = 0.5 - outcome / 2  # Le joueur au trait est l'adversaire de celui qui a joué
+
+        # Rétropropagation, en alternant le point de vue à chaque niveau
+        visits = self.visits
+        wins = self.wins
+        for index in reversed(path):
+            visits[index] += 1
+            wins[index] += result
+            result = 1.0 - result
+
+    def search(self, playouts: Optional[int] = None, time_limit: Optional[float] = None) -> Optional[int]:
+        """
+        Lance playouts itérations (ou s'arrête à time_limit secondes) puis retourne la
+        colonne la plus visitée, ou None si la position n'a aucun coup.
+        """
+        if self.root_mask == FULL_MASK:
+            return None
+        budget = playouts or self.playouts
+        deadline = time.perf_counter() + time_limit if time_limit else None
+        for i in range(budget):
+            self.iterate()
+            if deadline and i % 64 == 0 and time.perf_counter() >= deadline:
+                break
+        return self.best_move()
+
+    def best_move(self) -> Optional[int]:
+        """Colonne de l'enfant de la racine le plus visité (coup gagnant immédiat d'abord)"""
+        if not self.child_count[0]:
+            return None
+        first = self.first_child[0]
+        children = range(first, first + self.child_count[0])
+        for child in children:
+            if self.terminal[child] == TERMINAL_WIN:
+                return self.move[child]
+        return self.move[max(children, key=lambda child: self.visits[child])]
+
+    def move_stats(self) -> List[Tuple[int, int, float]]:
+        """(colonne, visites, taux de gain) de chaque coup de la racine"""
+        first = self.first_child[0]
+        return [
+            (self.move[child], self.visits[child],
+             self.wins[child] / self.visits[child] if self.visits[child] else 0.0)
+            for child in range(first, first + self.child_count[0])
+        ]
+
+    def advance(self, col: int):
+        """
+        Fait remonter la racine sur le coup col (le nôtre ou celui de l'adversaire).
+
+        Le sous-arbre du coup est recopié en tête de nouveaux tableaux ; le reste
+        de l'arbre est abandonné.
+        """
+        current, mask, _ = play(self.root_current, self.root_mask, col)
+        child = -1
+        first = self.first_child[0]
+        for index in range(first, first + self.child_count[0]):
+            if self.move[index] == col:
+                child = index
+                break
+        if child == -1:
+            self.set_position(current, mask)
+            return
+
+        move = array("b", [-1])
+        first_child = array("i", [0])
+        child_count = array("b", [self.child_count[child]])
+        terminal = array("b", [self.terminal[child]])
+        visits = array("i", [self.visits[child]])
+        wins = array("d", [self.wins[child]])
+
+        # Parcours en largeur (file) : chaque fratrie reste contiguë et les nœuds
+        # proches de la racine, les plus visités, restent en tête des tableaux
+        pending = deque([(child, 0)])
+        while pending:
+            old, new = pending.popleft()
+            count = self.child_count[old]
+            if not count:
+                continue
+            old_first = self.first_child[old]
+            first_child[new] = len(visits)
+            for old_child in range(old_first, old_first + count):
+                pending.append((old_child, len(visits)))
+                move.append(self.move[old_child])
+                first_child.append(0)
+                child_count.append(self.child_count[old_child])
+                terminal.append(self.terminal[old_child])
+                visits.append(self.visits[old_child])
+                wins.append(self.wins[old_child])
+
+        self.root_current, self.root_mask = current, mask
+        self.move, self.first_child = move, first_child
+        self.child_count, self.terminal, self.visits, self.wins = child_count, terminal, visits, wins
+
+    def sync(self, board: List[List[int]], player: int):
+        """
+        Place la racine sur le plateau donné (player au trait).
+
+        Si la position est atteinte en un ou deux coups depuis la racine (notre coup
+        puis la réponse de l'adversaire), l'arbre est réutilisé ; sinon il est reconstruit.
+        """
+        target = position_from_board(board, player)
+        if target == (self.root_current, self.root_mask):
+            return
+        for first in range(COLS):
+            if not can_play(self.root_mask, first):
+                continue
+            current, mask, _ = play(self.root_current, self.root_mask, first)
+            if (current, mask) == target:
+                self.advance(first)
+                return
+            for second in range(COLS):
+                if can_play(mask, second) and play(current, mask, second)[:2] == target:
+                    self.advance(first)
+                    self.advance(second)
+                    return
+        self.set_position(*target)
@@ -1,6 +1,10 @@
+import json
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# Les modèles utilisent slots=True (Python 3.10+) : pas de __dict__ par instance,
+# ce qui compte quand le serveur suit des dizaines de milliers de joueurs et de matchs.
 
 class GameState(Enum):
     WAITING = "waiting"
@@ -12,25 +16,211 @@ class PlayerState(Enum):
     QUEUED = "queued"
     PLAYING = "playing"
 
-@dataclass
+# Tables de correspondance valeur -> membre unique de l'énumération (plus rapides qu'Enum.__call__)
+_GAME_STATES = {state.value: state for state in GameState}
+_PLAYER_STATES = {state.value: state for state in PlayerState}
+
+class Board:
+    """
+    Plateau compact : une case par octet dans un bytearray (42 octets pour 6x7),
+    au lieu d'une liste de listes d'entiers.
+    """
+    __slots__ = ("rows", "cols", "cells")
+
+    # Dimensions par défaut (celles de Puissance4Game)
+    ROWS = 6
+    COLS = 7
+
+    def __init__(self, rows: Optional[int] = None, cols: Optional[int] = None, cells: Optional[bytearray] = None):
+        self.rows = rows = self.ROWS if rows is None else rows
+        self.cols = cols = self.COLS if cols is None else cols
+        self.cells = cells if cells is not None else bytearray(rows * cols)
+
+    def get(self, row: int, col: int) -> int:
+        """Retourne le contenu d'une case (0: vide, 1 ou 2: joueur)"""
+        return self.cells[row * self.cols + col]
+
+    def set(self, row: int, col: int, value: int) -> None:
+        """Modifie le contenu d'une case"""
+        self.cells[row * self.cols + col] = value
+
+    def to_lists(self) -> List[List[int]]:
+        """Convertit en liste de listes (format des messages du protocole)"""
+        cols = self.cols
+        return [list(self.cells[r * cols:(r + 1) * cols]) for r in range(self.rows)]
+
+    @classmethod
+    def from_lists(cls, board: List[List[int]]) -> "Board":
+        """Construit un plateau compact à partir d'une liste de listes"""
+        rows = len(board)
+        cols = len(board[0]) if rows else 0
+        return cls(rows, cols, bytearray(cell for line in board for cell in line))
+
+    def to_bytes(self) -> bytes:
+        """Sérialise le plateau (pour la base de données)"""
+        return bytes(self.cells)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, rows: Optional[int] = None, cols: Optional[int] = None) -> "Board":
+        """Désérialise un plateau produit par to_bytes (dimensions par défaut : ROWS x COLS)"""
+        return cls(rows, cols, bytearray(data))
+
+    @classmethod
+    def from_column(cls, value: Union[bytes, str], rows: Optional[int] = None, cols: Optional[int] = None) -> "Board":
+        """Lit la colonne board de la base : octets compacts, ou JSON pour les anciennes lignes"""
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return cls.from_bytes(bytes(value), rows, cols)
+        return cls.from_lists(json.loads(value))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self.rows == other.rows and self.cols == other.cols and self.cells == other.cells
+
+    def __repr__(self) -> str:
+        return f"Board({self.rows}x{self.cols}, {self.to_lists()})"
+
+@dataclass(slots=True)
 class Player:
     id: str
     username: str
     state: PlayerState
     rating: int = 1000
 
-@dataclass
+    @classmethod
+    def from_row(cls, row) -> "Player":
+        """Construit un joueur à partir d'une ligne de la table players"""
+        return cls(row['id'], row['username'], _PLAYER_STATES[row['state']], row['rating'])
+
+    def to_row(self) -> tuple:
+        """Valeurs pour (id, username, state, rating)"""
+        return (self.id, self.username, self.state.value, self.rating)
+
+    def to_wire(self) -> Dict[str, Any]:
+        """Représentation pour les messages du protocole"""
+        return {"id": self.id, "username": self.username, "state": self.state.value, "rating": self.rating}
+
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "Player":
+        """Construit un joueur à partir d'un message du protocole"""
+        return cls(data["id"], data["username"], _PLAYER_STATES[data["state"]], data.get("rating", 1000))
+
+@dataclass(slots=True)
 class Match:
     id: str
     player1: Player
     player2: Player
     state: GameState
-    board: List[List[int]]
+    board: Board
     current_player: Optional[Player] = None
     winner: Optional[Player] = None
 
-@dataclass
+    def to_row(self) -> tuple:
+        """Valeurs pour (id, player1_id, player2_id, state, board, current_player_id, winner_id)"""
+        return (
+            self.id,
+            self.player1.id,
+            self.player2.id,
+            self.state.value,
+            self.board.to_bytes(),
+            self.current_player.id if self.current_player else None,
+            self.winner.id if self.winner else None
+        )
+
+    @classmethod
+    def from_row(cls, row, players: Dict[str, Player]) -> "Match":
+        """Construit un match à partir d'une ligne de la table matches et des joueurs déjà chargés"""
+        return cls(
+            id=row['id'],
+            player1=players[row['player1_id']],
+            player2=players[row['player2_id']],
+            state=_GAME_STATES[row['state']],
+            board=Board.from_column(row['board']),
+            current_player=players.get(row['current_player_id']),
+            winner=players.get(row['winner_id'])
+        )
+
+    def to_wire(self) -> Dict[str, Any]:
+        """Représentation pour les messages du protocole"""
+        return {
+            "id": self.id,
+            "player1": self.player1.to_wire(),
+            "player2": self.player2.to_wire(),
+            "state": self.state.value,
+            "board": self.board.to_lists(),
+            "current_player": self.current_player.id if self.current_player else None,
+            "winner": self.winner.id if self.winner else None
+        }
+
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "Match":
+        """Construit un match à partir d'un message du protocole"""
+        player1 = Player.from_wire(data["player1"])
+        player2 = Player.from_wire(data["player2"])
+        players = {player1.id: player1, player2.id: player2}
+        return cls(
+            id=data["id"],
+            player1=player1,
+            player2=player2,
+            state=_GAME_STATES[data["state"]],
+            board=Board.from_lists(data["board"]),
+            current_player=players.get(data.get("current_player")),
+            winner=players.get(data.get("winner"))
+        )
+
+@dataclass(slots=True)
 class Move:
     match_id: str
     player_id: str
-    column: int 
\ No newline at end of file
+    column: int
+
+    def to_wire(self) -> Dict[str, Any]:
+        """Représentation pour les messages du protocole"""
+        return {"match_id": self.match_id, "player_id": self.player_id, "column": self.column}
+
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "Move":
+        """Construit un coup à partir d'un message du protocole"""
+        return cls(data["match_id"], data["player_id"], data["column"])
+
+@dataclass(slots=True)
+class PlayerStats:
+    player_id: str
+    username: str
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    games_played: int = 0
+    rating: int = 1000
+
+    @classmethod
+    def from_row(cls, row) -> "PlayerStats":
+        """Construit les statistiques à partir d'une ligne player_stats jointe à players"""
+        return cls(
+            row['player_id'],
+            row['username'],
+            row['wins'],
+            row['losses'],
+            row['draws'],
+            row['games_played'],
+            row['rating']
+        )
+
+# Quartet de fin utilisé lorsque le nombre de coups est impair
+_MOVES_END_NIBBLE = 0xF
+
+def pack_moves(columns: Iterable[int]) -> bytes:
+    """Compacte une suite de colonnes jouées (0-14) à raison de deux coups par octet"""
+    columns = list(columns)
+    if len(columns) % 2:
+        columns.append(_MOVES_END_NIBBLE)
+    return bytes((columns[i] << 4) | columns[i + 1] for i in range(0, len(columns), 2))
+
+def unpack_moves(data: bytes) -> List[int]:
+    """Décompacte une suite de coups produite par pack_moves"""
+    columns = []
+    for byte in data or b"":
+        columns.append(byte >> 4)
+        if byte & 0xF != _MOVES_END_NIBBLE:
+            columns.append(byte & 0xF)
+    return columns
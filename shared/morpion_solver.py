@@ -0,0 +1,126 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+# Position de morpion : 9 caractères, ligne par ligne ("0" vide, "1" X, "2" O)
+LINES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # Lignes
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # Colonnes
+    (0, 4, 8), (2, 4, 6),             # Diagonales
+]
+
+# Coups essayés dans cet ordre : centre, coins, bords (à score égal, le premier est gardé)
+MOVE_ORDER = [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "morpion_table.py")
+
+def build_symmetries() -> List[Tuple[int, ...]]:
+    """
+    Les 8 symétries du carré (rotations et reflets), comme permutations des cases :
+    la position transformée a en case i le contenu de la case perm[i].
+    """
+    transforms = [
+        lambda r, c: (r, c), lambda r, c: (c, 2 - r), lambda r, c: (2 - r, 2 - c), lambda r, c: (2 - c, r),
+        lambda r, c: (r, 2 - c), lambda r, c: (2 - r, c), lambda r, c: (c, r), lambda r, c: (2 - c, 2 - r),
+    ]
+    symmetries = []
+    for transform in transforms:
+        perm = []
+        for index in range(9):
+            row, col = transform(*divmod(index, 3))
+            perm.append(row * 3 + col)
+        symmetries.append(tuple(perm))
+    return symmetries
+
+SYMMETRIES = build_symmetries()
+
+def canonical(cells: str) -> Tuple[str, Tuple[int, ...]]:
+    """
+    Forme canonique de la position (la plus petite de ses 8 symétriques) et la
+    permutation qui y mène : la case i de la forme canonique est la case perm[i] de cells.
+    """
+    best, best_perm = None, None
+    for perm in SYMMETRIES:
+        key = "".join(cells[i] for i in perm)
+        if best is None or key < best:
+            best, best_perm = key, perm
+    return best, best_perm
+
+def is_win(cells: str, player: str) -> bool:
+    return any(cells[a] == cells[b] == cells[c] == player for a, b, c in LINES)
+
+def solve(cells: str, table: Dict[str, Tuple[int, int]]) -> int:
+    """
+    Minimax mémoïsé sur les positions canoniques ; remplit table et retourne le score
+    de la position pour le joueur au trait.
+
+    Une victoire vaut 10 moins le nombre de jetons posés (gagner vite vaut mieux),
+    une défaite l'opposé, un match nul 0.
+    """
+    key, _ = canonical(cells)
+    if key in table:
+        return table[key][0]
+    player = "1" if key.count("1") == key.count("2") else "2"
+    best_score, best_cell = None, None
+    for cell in MOVE_ORDER:
+        if key[cell] != "0":
+            continue
+        child = key[:cell] + player + key[cell + 1:]
+        if is_win(child, player):
+            score = 10 - (9 - child.count("0"))
+        elif "0" not in child:
+            score = 0
+        else:
+            score = -solve(child, table)
+        if best_score is None or score > best_score:
+            best_score, best_cell = score, cell
+    table[key] = (best_score, best_cell)
+    return best_score
+
+def build_table() -> Dict[str, Tuple[int, int]]:
+    """Parcourt tout l'arbre du morpion depuis le plateau vide"""
+    table: Dict[str, Tuple[int, int]] = {}
+    solve("0" * 9, table)
+    return table
+
+def write_table(path: str = TABLE_PATH) -> int:
+    """Génère shared/morpion_table.py ; retourne le nombre de positions"""
+    table = build_table()
+    lines = [
+        "# Fichier généré par python -m shared.morpion_solver : ne pas modifier à la main.",
+        "# Position canonique (9 cases ligne par ligne : 0 vide, 1 X, 2 O) -> (score, case)",
+        "# pour le joueur au trait ; score > 0 : victoire forcée, 0 : nul, < 0 : défaite.",
+        "MORPION_TABLE = {",
+    ]
+    for key in sorted(table):
+        score, cell = table[key]
+        lines.append(f'    "{key}": ({score}, {cell}),')
+    lines.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    return len(table)
+
+def best_move(board: List[List[int]]) -> Optional[Tuple[int, int]]:
+    """
+    Coup parfait (ligne, colonne) pour le joueur au trait, lu dans la table précalculée ;
+    None si la partie est terminée.
+    """
+    from shared.morpion_table import MORPION_TABLE
+
+    cells = "".join(str(cell) for line in board for cell in line)
+    key, perm = canonical(cells)
+    entry = MORPION_TABLE.get(key)
+    if entry is None:
+        return None
+    return divmod(perm[entry[1]], 3)
+
+def position_score(board: List[List[int]]) -> Optional[int]:
+    """Score de la position pour le joueur au trait (voir solve), None si la partie est terminée"""
+    from shared.morpion_table import MORPION_TABLE
+
+    key, _ = canonical("".join(str(cell) for line in board for cell in line))
+    entry = MORPION_TABLE.get(key)
+    return entry[0] if entry else None
+
+if __name__ == "__main__":
+    count = write_table()
+    print(f"{count} positions écrites dans {TABLE_PATH}")
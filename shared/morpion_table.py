@@ -0,0 +1,632 @@
+# Fichier généré par python -m shared.morpion_solver : ne pas modifier à la main.
+# Position canonique (9 cases ligne par ligne : 0 vide, 1 X, 2 O) -> (score, case)
+# pour le joueur au trait ; score > 0 : victoire forcée, 0 : nul, < 0 : défaite.
+MORPION_TABLE = {
+    "000000000": (0, 4),
+    "000000001": (0, 4),
+    "000000010": (0, 4),
+    "000000012": (0, 4),
+    "000000021": (3, 4),
+    "000000102": (3, 0),
+    "000000112": (2, 2),
+    "000000121": (0, 4),
+    "000001012": (0, 4),
+    "000001020": (3, 4),
+    "000001021": (-3, 2),
+    "000001102": (0, 4),
+    "000001120": (0, 4),
+    "000001122": (3, 4),
+    "000001200": (3, 8),
+    "000001201": (-3, 2),
+    "000001210": (2, 0),
+    "000001212": (3, 4),
+    "000001221": (5, 2),
+    "000002100": (3, 4),
+    "000002101": (-3, 7),
+    "000002110": (2, 8),
+    "000002112": (-2, 2),
+    "000002121": (3, 4),
+    "000002211": (3, 4),
+    "000010000": (0, 0),
+    "000010002": (0, 0),
+    "000010012": (0, 1),
+    "000010020": (3, 0),
+    "000010021": (-3, 0),
+    "000010102": (0, 2),
+    "000010122": (5, 2),
+    "000010212": (5, 1),
+    "000011020": (-3, 3),
+    "000011022": (5, 3),
+    "000011122": (-3, 0),
+    "000011200": (0, 3),
+    "000011202": (5, 3),
+    "000011212": (-3, 0),
+    "000011220": (5, 3),
+    "000011221": (-3, 0),
+    "000012021": (5, 0),
+    "000012100": (-3, 2),
+    "000012102": (5, 2),
+    "000012112": (4, 2),
+    "000012120": (5, 2),
+    "000012121": (-3, 0),
+    "000012201": (5, 0),
+    "000012210": (5, 1),
+    "000012211": (-3, 0),
+    "000020001": (0, 0),
+    "000020010": (0, 0),
+    "000020011": (0, 6),
+    "000020101": (0, 7),
+    "000020112": (0, 0),
+    "000020121": (0, 1),
+    "000021010": (0, 2),
+    "000021012": (0, 0),
+    "000021021": (5, 2),
+    "000021100": (0, 2),
+    "000021102": (0, 0),
+    "000021112": (4, 0),
+    "000021120": (0, 1),
+    "000021121": (4, 1),
+    "000021201": (5, 2),
+    "000021210": (0, 2),
+    "000021211": (4, 2),
+    "000022101": (5, 7),
+    "000022110": (5, 8),
+    "000101002": (2, 4),
+    "000101020": (2, 4),
+    "000101022": (5, 4),
+    "000101122": (-3, 4),
+    "000101202": (5, 4),
+    "000101212": (2, 4),
+    "000102000": (0, 4),
+    "000102001": (0, 0),
+    "000102010": (0, 0),
+    "000102012": (1, 2),
+    "000102021": (3, 0),
+    "000102100": (0, 0),
+    "000102102": (5, 0),
+    "000102112": (4, 2),
+    "000102120": (5, 0),
+    "000102121": (0, 0),
+    "000102201": (0, 4),
+    "000102210": (0, 4),
+    "000102211": (0, 4),
+    "000112000": (0, 0),
+    "000112002": (0, 2),
+    "000112012": (4, 2),
+    "000112020": (3, 0),
+    "000112021": (0, 0),
+    "000112102": (4, 2),
+    "000112120": (-3, 0),
+    "000112122": (3, 0),
+    "000112200": (0, 2),
+    "000112201": (0, 0),
+    "000112210": (0, 1),
+    "000112212": (3, 1),
+    "000112221": (3, 0),
+    "000121000": (2, 0),
+    "000121002": (-2, 0),
+    "000121012": (4, 0),
+    "000121020": (-2, 1),
+    "000121021": (4, 1),
+    "000121102": (4, 0),
+    "000121122": (3, 0),
+    "000121212": (-2, 0),
+    "000122001": (3, 6),
+    "000122010": (3, 6),
+    "000122011": (0, 6),
+    "000122100": (5, 0),
+    "000122101": (-3, 0),
+    "000122110": (-3, 0),
+    "000122112": (3, 0),
+    "000122121": (3, 0),
+    "000122211": (0, 2),
+    "000202011": (5, 6),
+    "000202101": (5, 7),
+    "000212001": (5, 0),
+    "000212010": (5, 1),
+    "000212011": (-3, 0),
+    "000212101": (-3, 0),
+    "000212112": (3, 2),
+    "000212121": (3, 0),
+    "001000102": (-3, 4),
+    "001000120": (0, 4),
+    "001000122": (5, 4),
+    "001000200": (3, 0),
+    "001000201": (-3, 5),
+    "001000210": (0, 4),
+    "001000212": (3, 1),
+    "001000221": (5, 5),
+    "001001122": (2, 4),
+    "001001200": (2, 8),
+    "001001202": (-2, 7),
+    "001001212": (2, 0),
+    "001001220": (5, 8),
+    "001002120": (5, 4),
+    "001002121": (2, 4),
+    "001002201": (3, 0),
+    "001002210": (3, 1),
+    "001002211": (2, 3),
+    "001010200": (0, 0),
+    "001010202": (0, 7),
+    "001010212": (0, 1),
+    "001010220": (3, 8),
+    "001010221": (-3, 0),
+    "001011202": (4, 7),
+    "001011220": (4, 8),
+    "001012200": (3, 0),
+    "001012201": (0, 0),
+    "001012210": (0, 1),
+    "001012212": (3, 1),
+    "001012221": (3, 0),
+    "001020100": (0, 1),
+    "001020102": (3, 0),
+    "001020112": (4, 0),
+    "001020120": (0, 1),
+    "001020121": (4, 1),
+    "001020201": (5, 5),
+    "001020210": (0, 0),
+    "001020211": (0, 5),
+    "001021120": (4, 1),
+    "001021122": (-2, 0),
+    "001021200": (5, 8),
+    "001021210": (0, 8),
+    "001021212": (0, 0),
+    "001022121": (-2, 0),
+    "001022211": (0, 3),
+    "001100002": (0, 6),
+    "001100020": (0, 4),
+    "001100022": (3, 6),
+    "001100122": (-3, 4),
+    "001100202": (0, 7),
+    "001100212": (0, 4),
+    "001100220": (1, 8),
+    "001100221": (-1, 5),
+    "001101022": (4, 6),
+    "001101202": (4, 7),
+    "001101220": (4, 8),
+    "001102002": (3, 0),
+    "001102012": (-1, 4),
+    "001102020": (3, 0),
+    "001102021": (0, 4),
+    "001102102": (-3, 4),
+    "001102120": (-3, 4),
+    "001102122": (3, 4),
+    "001102200": (0, 4),
+    "001102201": (0, 4),
+    "001102210": (0, 4),
+    "001102212": (1, 1),
+    "001102221": (1, 0),
+    "001110022": (4, 6),
+    "001110202": (4, 7),
+    "001110220": (4, 8),
+    "001112002": (0, 6),
+    "001112020": (0, 6),
+    "001112022": (3, 6),
+    "001112200": (0, 0),
+    "001112202": (0, 7),
+    "001112212": (0, 1),
+    "001112220": (0, 8),
+    "001112221": (0, 0),
+    "001120002": (3, 0),
+    "001120012": (4, 0),
+    "001120020": (0, 1),
+    "001120021": (4, 1),
+    "001120102": (4, 0),
+    "001120120": (4, 1),
+    "001120122": (3, 0),
+    "001120201": (0, 5),
+    "001120210": (0, 0),
+    "001120212": (0, 0),
+    "001120221": (3, 5),
+    "001121002": (4, 0),
+    "001121020": (4, 1),
+    "001121022": (-2, 0),
+    "001121122": (2, 0),
+    "001121200": (2, 8),
+    "001121202": (-2, 0),
+    "001121212": (2, 0),
+    "001121220": (3, 8),
+    "001122001": (0, 0),
+    "001122010": (0, 0),
+    "001122012": (1, 0),
+    "001122021": (0, 1),
+    "001122100": (0, 0),
+    "001122102": (3, 0),
+    "001122112": (2, 0),
+    "001122120": (3, 0),
+    "001122121": (2, 1),
+    "001122201": (0, 0),
+    "001122210": (0, 0),
+    "001122211": (0, 0),
+    "001200001": (-3, 5),
+    "001200012": (3, 4),
+    "001200021": (5, 5),
+    "001200102": (5, 4),
+    "001200112": (2, 4),
+    "001200120": (5, 4),
+    "001200121": (-3, 4),
+    "001200201": (5, 5),
+    "001200211": (4, 0),
+    "001201002": (0, 0),
+    "001201012": (2, 0),
+    "001201020": (5, 8),
+    "001201102": (0, 4),
+    "001201120": (-3, 4),
+    "001201122": (3, 4),
+    "001201200": (5, 8),
+    "001201210": (4, 0),
+    "001201212": (0, 0),
+    "001202001": (3, 4),
+    "001202010": (3, 4),
+    "001202011": (4, 4),
+    "001202100": (5, 4),
+    "001202101": (4, 4),
+    "001202110": (4, 4),
+    "001202112": (3, 4),
+    "001202121": (3, 4),
+    "001202211": (-2, 4),
+    "001210002": (5, 6),
+    "001210012": (-3, 0),
+    "001210020": (5, 6),
+    "001210021": (-3, 0),
+    "001210201": (4, 0),
+    "001210212": (3, 1),
+    "001210221": (3, 0),
+    "001211002": (2, 6),
+    "001211020": (-3, 0),
+    "001211022": (3, 6),
+    "001211200": (4, 0),
+    "001211202": (-2, 0),
+    "001211212": (2, 0),
+    "001211220": (3, 8),
+    "001212001": (-3, 0),
+    "001212010": (-3, 0),
+    "001212012": (3, 6),
+    "001212021": (3, 0),
+    "001212201": (3, 0),
+    "001212210": (3, 1),
+    "001212211": (2, 0),
+    "001220001": (5, 5),
+    "001220011": (4, 5),
+    "001220101": (4, 5),
+    "001220112": (-2, 0),
+    "001220121": (3, 5),
+    "001220211": (3, 5),
+    "001221010": (0, 8),
+    "001221012": (0, 0),
+    "001221102": (0, 0),
+    "001221112": (2, 0),
+    "001221120": (3, 8),
+    "001221210": (3, 8),
+    "002000211": (3, 4),
+    "002001210": (3, 4),
+    "002001211": (4, 4),
+    "002010201": (5, 0),
+    "002010210": (5, 1),
+    "002010211": (-3, 0),
+    "002011210": (-3, 0),
+    "002011212": (3, 1),
+    "002011221": (3, 0),
+    "002100010": (2, 0),
+    "002100012": (-2, 5),
+    "002100021": (3, 4),
+    "002100102": (5, 0),
+    "002100112": (4, 5),
+    "002100120": (5, 0),
+    "002100121": (0, 0),
+    "002100201": (3, 4),
+    "002100210": (3, 4),
+    "002100211": (4, 4),
+    "002101002": (5, 4),
+    "002101012": (2, 4),
+    "002101020": (5, 4),
+    "002101021": (2, 4),
+    "002101102": (-3, 4),
+    "002101120": (-3, 4),
+    "002101122": (3, 4),
+    "002101200": (5, 4),
+    "002101201": (4, 4),
+    "002101210": (4, 4),
+    "002101212": (3, 4),
+    "002101221": (3, 4),
+    "002102010": (1, 8),
+    "002102011": (-1, 6),
+    "002102101": (-3, 4),
+    "002102110": (4, 8),
+    "002102121": (3, 0),
+    "002102211": (1, 4),
+    "002110002": (5, 5),
+    "002110012": (4, 5),
+    "002110020": (5, 5),
+    "002110021": (-3, 0),
+    "002110102": (4, 5),
+    "002110120": (-3, 0),
+    "002110122": (3, 0),
+    "002110201": (-3, 0),
+    "002110210": (-3, 0),
+    "002110212": (3, 1),
+    "002110221": (3, 0),
+    "002112010": (4, 8),
+    "002112021": (3, 0),
+    "002112120": (3, 0),
+    "002112121": (0, 0),
+    "002112201": (3, 0),
+    "002112210": (3, 1),
+    "002112211": (-1, 0),
+    "002120010": (3, 6),
+    "002120011": (4, 6),
+    "002120101": (-3, 0),
+    "002120110": (-3, 0),
+    "002120112": (3, 0),
+    "002120121": (3, 0),
+    "002121010": (4, 6),
+    "002121012": (-2, 0),
+    "002121021": (-2, 0),
+    "002121102": (3, 0),
+    "002121112": (2, 0),
+    "002121120": (3, 0),
+    "002121121": (2, 1),
+    "002122011": (3, 6),
+    "002122101": (3, 0),
+    "002122110": (3, 0),
+    "002200011": (5, 6),
+    "002200101": (5, 7),
+    "002201010": (0, 4),
+    "002201011": (2, 6),
+    "002201101": (0, 7),
+    "002201110": (0, 8),
+    "002201112": (0, 4),
+    "002201121": (0, 4),
+    "002201211": (-2, 4),
+    "002210011": (-3, 0),
+    "002210101": (-3, 0),
+    "002210112": (3, 1),
+    "002210121": (3, 0),
+    "002210211": (3, 0),
+    "002211010": (0, 1),
+    "002211012": (3, 1),
+    "002211021": (3, 0),
+    "002211102": (0, 0),
+    "002211112": (0, 1),
+    "002211120": (0, 0),
+    "002211121": (0, 0),
+    "002211201": (3, 0),
+    "002211210": (3, 1),
+    "002211211": (2, 0),
+    "002212011": (3, 0),
+    "002212101": (3, 0),
+    "002212110": (3, 8),
+    "002221011": (3, 6),
+    "002221101": (3, 7),
+    "002221110": (3, 8),
+    "010101022": (4, 6),
+    "010101202": (4, 7),
+    "010102020": (3, 0),
+    "010102021": (0, 0),
+    "010102102": (4, 2),
+    "010102120": (0, 0),
+    "010102122": (3, 0),
+    "010102201": (0, 4),
+    "010102210": (0, 4),
+    "010102212": (3, 4),
+    "010102221": (1, 0),
+    "010112020": (2, 8),
+    "010112022": (-2, 0),
+    "010112122": (2, 2),
+    "010112202": (3, 7),
+    "010112220": (0, 8),
+    "010112221": (0, 0),
+    "010121020": (2, 6),
+    "010121022": (-2, 0),
+    "010121122": (2, 0),
+    "010121202": (-2, 0),
+    "010121212": (2, 0),
+    "010122021": (1, 0),
+    "010122102": (3, 0),
+    "010122112": (2, 0),
+    "010122120": (3, 0),
+    "010122121": (0, 0),
+    "010122201": (0, 2),
+    "010122210": (0, 2),
+    "010122211": (2, 2),
+    "010202010": (5, 4),
+    "010202011": (4, 4),
+    "010202101": (4, 4),
+    "010202112": (3, 4),
+    "010202121": (1, 4),
+    "010212021": (3, 0),
+    "010212102": (3, 2),
+    "010212121": (-1, 0),
+    "011100202": (4, 7),
+    "011102122": (-1, 4),
+    "011102202": (3, 0),
+    "011102212": (-1, 4),
+    "011102220": (3, 0),
+    "011102221": (0, 0),
+    "011112202": (2, 7),
+    "011112220": (2, 8),
+    "011120122": (2, 0),
+    "011120202": (3, 0),
+    "011120212": (2, 0),
+    "011120221": (-1, 0),
+    "011121202": (2, 0),
+    "011121220": (2, 8),
+    "011122120": (0, 0),
+    "011122122": (1, 0),
+    "011122201": (0, 0),
+    "011122210": (0, 0),
+    "011122212": (1, 0),
+    "011122221": (1, 0),
+    "011200012": (-3, 4),
+    "011200021": (-3, 4),
+    "011200102": (-3, 4),
+    "011200122": (3, 4),
+    "011200201": (4, 0),
+    "011200212": (3, 4),
+    "011200221": (3, 0),
+    "011201020": (-3, 4),
+    "011201022": (3, 0),
+    "011201122": (-1, 4),
+    "011201202": (3, 0),
+    "011201212": (2, 0),
+    "011201220": (3, 0),
+    "011202012": (3, 4),
+    "011202021": (3, 0),
+    "011202102": (3, 4),
+    "011202112": (2, 4),
+    "011202120": (3, 4),
+    "011202121": (2, 4),
+    "011202201": (3, 0),
+    "011202210": (3, 4),
+    "011202211": (2, 4),
+    "011210022": (3, 0),
+    "011210202": (3, 0),
+    "011210221": (2, 0),
+    "011211022": (2, 6),
+    "011211202": (2, 0),
+    "011211220": (2, 0),
+    "011212020": (3, 0),
+    "011212021": (-1, 0),
+    "011212201": (2, 0),
+    "011212221": (1, 0),
+    "011220012": (3, 0),
+    "011220021": (3, 0),
+    "011220102": (3, 0),
+    "011220112": (2, 0),
+    "011220121": (2, 5),
+    "011220201": (3, 0),
+    "011220211": (2, 0),
+    "011221012": (2, 0),
+    "011221020": (3, 0),
+    "011221102": (2, 0),
+    "011221120": (-1, 0),
+    "011221122": (1, 0),
+    "011221212": (1, 0),
+    "012100201": (4, 4),
+    "012100212": (3, 4),
+    "012100221": (1, 4),
+    "012101212": (2, 4),
+    "012101220": (3, 4),
+    "012101221": (2, 4),
+    "012110202": (3, 5),
+    "012110221": (-1, 0),
+    "012112221": (1, 0),
+    "012200101": (0, 7),
+    "012200112": (3, 4),
+    "012200121": (0, 4),
+    "012200211": (3, 4),
+    "012201012": (3, 4),
+    "012201021": (0, 4),
+    "012201102": (0, 4),
+    "012201112": (0, 4),
+    "012201120": (0, 4),
+    "012201121": (0, 4),
+    "012201201": (-2, 4),
+    "012201211": (2, 4),
+    "012202101": (3, 7),
+    "012210021": (3, 0),
+    "012210102": (3, 7),
+    "012210121": (0, 0),
+    "012210201": (3, 0),
+    "012211020": (0, 0),
+    "012211021": (0, 0),
+    "012211102": (0, 7),
+    "012211120": (0, 0),
+    "012211122": (0, 0),
+    "012211201": (2, 0),
+    "012211221": (1, 0),
+    "012212101": (-1, 0),
+    "012212121": (1, 0),
+    "012220101": (3, 7),
+    "012221101": (0, 7),
+    "012221112": (0, 0),
+    "012221121": (0, 0),
+    "020212101": (3, 0),
+    "021200101": (-3, 4),
+    "021200112": (3, 4),
+    "021200121": (3, 4),
+    "021200211": (3, 5),
+    "021201112": (0, 4),
+    "021210201": (3, 0),
+    "021210211": (2, 0),
+    "021211212": (0, 0),
+    "021212211": (1, 0),
+    "021220101": (3, 5),
+    "021221112": (0, 0),
+    "022211211": (1, 0),
+    "101000122": (-3, 4),
+    "101000202": (5, 1),
+    "101000212": (0, 1),
+    "101001202": (4, 7),
+    "101002122": (3, 4),
+    "101002201": (-3, 4),
+    "101002212": (3, 1),
+    "101002221": (3, 4),
+    "101010202": (4, 7),
+    "101012202": (3, 1),
+    "101012212": (0, 1),
+    "101020102": (-3, 1),
+    "101020122": (3, 1),
+    "101020212": (3, 1),
+    "101021122": (2, 1),
+    "101021202": (3, 1),
+    "101021212": (0, 1),
+    "101022121": (2, 1),
+    "101022201": (3, 1),
+    "101022211": (2, 3),
+    "101102202": (3, 1),
+    "101102212": (0, 1),
+    "101102221": (-1, 4),
+    "101112202": (2, 7),
+    "101121202": (2, 7),
+    "101122201": (0, 1),
+    "101122212": (1, 1),
+    "101122221": (1, 1),
+    "101202102": (3, 4),
+    "101202112": (2, 4),
+    "101202121": (2, 4),
+    "101212212": (1, 1),
+    "102000201": (5, 4),
+    "102000211": (4, 4),
+    "102001212": (1, 4),
+    "102001221": (3, 4),
+    "102010212": (3, 1),
+    "102011212": (-1, 1),
+    "102100212": (-2, 4),
+    "102100221": (3, 4),
+    "102101202": (3, 4),
+    "102101212": (2, 4),
+    "102101221": (2, 4),
+    "102102201": (3, 4),
+    "102102211": (2, 4),
+    "102110202": (3, 5),
+    "102110212": (2, 5),
+    "102200112": (0, 5),
+    "102200121": (3, 4),
+    "102201102": (0, 4),
+    "102201112": (0, 4),
+    "102201121": (0, 4),
+    "102201211": (2, 4),
+    "102210102": (0, 5),
+    "102210112": (2, 5),
+    "102211102": (0, 1),
+    "102211122": (0, 1),
+    "102211212": (1, 1),
+    "102221112": (0, 1),
+    "102221121": (0, 1),
+    "112100202": (-2, 4),
+    "112100212": (2, 4),
+    "112102221": (1, 4),
+    "112110202": (2, 5),
+    "112200112": (2, 5),
+    "112201122": (0, 4),
+    "112201212": (1, 4),
+    "112201221": (1, 4),
+    "112202121": (1, 4),
+    "112202211": (1, 4),
+    "112210122": (0, 5),
+    "112211202": (1, 7),
+    "112220112": (0, 5),
+    "121202121": (1, 4),
+    "212101212": (1, 4),
+}
@@ -1,19 +1,31 @@
+import asyncio
 import json
 import socket
 import struct
 import logging
+import threading
+import weakref
 from enum import Enum
-from typing import Dict, Any, Optional
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('protocol.log'),
-        logging.StreamHandler()
-    ]
-)
+from typing import Dict, Any, List, Optional
+
+# Journal du module : la configuration (fichiers, niveaux) revient au point
+# d'entrée de chaque programme (client, serveur, bot)
+logger = logging.getLogger(__name__)
+
+# Taille maximale acceptée pour un message (pour éviter les problèmes de mémoire)
+MAX_MESSAGE_SIZE = 1048576  # 1 MB
+
+# Verrou d'écriture par socket : plusieurs threads du serveur peuvent écrire sur le
+# même socket (gestionnaire de file, relais du chat...), une trame ne doit pas être coupée
+_send_locks = weakref.WeakKeyDictionary()
+_send_locks_guard = threading.Lock()
+
+def _get_send_lock(sock: socket.socket) -> threading.Lock:
+    with _send_locks_guard:
+        lock = _send_locks.get(sock)
+        if lock is None:
+            lock = _send_locks[sock] = threading.Lock()
+        return lock
 
 class MessageType(Enum):
     """Types de messages supportés par le protocole"""
@@ -25,6 +37,7 @@ class MessageType(Enum):
     ERROR = "ERROR"                # Message d'erreur
     CHAT_MESSAGE = "CHAT_MESSAGE"  # Nouveau type de message pour le chat
     QUEUE_UPDATE = "QUEUE_UPDATE"  # Mise à jour du nombre de joueurs en attente
+    LEADERBOARD = "LEADERBOARD"    # Demande / réponse du classement des joueurs
 
 def create_message(message_type: MessageType, data: Dict[str, Any] = None) -> Dict[str, Any]:
     """
@@ -56,7 +69,7 @@ def send_message(sock: socket.socket, message: Dict[str, Any]) -> bool:
     try:
         # Vérifier que le socket est valide
         if sock is None:
-            logging.error("Tentative d'envoi sur un socket None")
+            logger.error("Tentative d'envoi sur un socket None")
             return False
             
         # Convertir le message en JSON
@@ -66,25 +79,26 @@ def send_message(sock: socket.socket, message: Dict[str, Any]) -> bool:
         size = len(json_message)
         size_data = struct.pack('!I', size)
         
-        # Essayer d'envoyer l'en-tête de taille
-        try:
-            sock.sendall(size_data)
-        except Exception as e:
-            logging.error(f"Erreur lors de l'envoi de l'en-tête de taille: {e}")
-            return False
-            
-        # Essayer d'envoyer le message
-        try:
-            sock.sendall(json_message.encode())
-        except Exception as e:
-            logging.error(f"Erreur lors de l'envoi du corps du message: {e}")
-            return False
+        with _get_send_lock(sock):
+            # Essayer d'envoyer l'en-tête de taille
+            try:
+                sock.sendall(size_data)
+            except Exception as e:
+                logger.error(f"Erreur lors de l'envoi de l'en-tête de taille: {e}")
+                return False
+                
+            # Essayer d'envoyer le message
+            try:
+                sock.sendall(json_message.encode())
+            except Exception as e:
+                logger.error(f"Erreur lors de l'envoi du corps du message: {e}")
+                return False
             
-        logging.info(f"Message envoyé avec succès: {message.get('type')}")
+        logger.info(f"Message envoyé avec succès: {message.get('type')}")
         return True
         
     except Exception as e:
-        logging.error(f"Erreur lors de l'envoi du message: {e}")
+        logger.error(f"Erreur lors de l'envoi du message: {e}")
         return False
 
 def receive_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
@@ -106,8 +120,8 @@ def receive_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
         size = struct.unpack('!I', size_data)[0]
         
         # Vérifier que la taille est raisonnable (pour éviter les problèmes de mémoire)
-        if size > 1048576:  # 1 MB max
-            logging.error(f"Taille de message trop grande: {size} bytes")
+        if size > MAX_MESSAGE_SIZE:
+            logger.error(f"Taille de message trop grande: {size} bytes")
             return None
             
         # Recevoir le message
@@ -125,7 +139,7 @@ def receive_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
                 
                 # Si on ne reçoit rien, c'est probablement une déconnexion
                 if not chunk:
-                    logging.error("Connection closed during message reception")
+                    logger.error("Connection closed during message reception")
                     return None
                     
                 # Ajouter le chunk aux données
@@ -133,11 +147,11 @@ def receive_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
                 bytes_received = len(data)
                 
             except socket.timeout:
-                logging.warning("Socket timeout during message reception, retrying...")
+                logger.warning("Socket timeout during message reception, retrying...")
                 continue
                 
             except Exception as e:
-                logging.error(f"Erreur lors de la réception du message (chunk): {e}")
+                logger.error(f"Erreur lors de la réception du message (chunk): {e}")
                 return None
                 
         # Convertir le message en dictionnaire
@@ -145,15 +159,74 @@ def receive_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
             message = json.loads(data.decode())
             return message
         except json.JSONDecodeError as e:
-            logging.error(f"Erreur de décodage JSON: {e}, data: {data[:100]}...")
+            logger.error(f"Erreur de décodage JSON: {e}, data: {data[:100]}...")
             return None
             
     except socket.timeout:
-        logging.warning("Socket timeout during initial header reception")
+        logger.warning("Socket timeout during initial header reception")
+        return None
+        
+    except Exception as e:
+        logger.error(f"Erreur lors de la réception du message: {e}")
         return None
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """
+    Encode un message en une seule trame : en-tête de taille (4 octets) suivi du JSON.
+    
+    Args:
+        message: Message à encoder
+        
+    Returns:
+        Octets prêts à être écrits sur le socket
+    """
+    body = json.dumps(message).encode()
+    return struct.pack('!I', len(body)) + body
+
+async def send_message_async(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> bool:
+    """
+    Version asyncio de send_message, pour les clients sans interface (bots, tests de charge).
+    
+    Args:
+        writer: Flux d'écriture de la connexion
+        message: Message à envoyer
+        
+    Returns:
+        True si l'envoi a réussi, False sinon
+    """
+    try:
+        writer.write(encode_message(message))
+        await writer.drain()
+        return True
+    except Exception as e:
+        logger.error(f"Erreur lors de l'envoi du message: {e}")
+        return False
+
+async def receive_message_async(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """
+    Version asyncio de receive_message.
+    
+    Args:
+        reader: Flux de lecture de la connexion
         
+    Returns:
+        Le message reçu ou None en cas d'erreur ou de déconnexion
+    """
+    try:
+        size_data = await reader.readexactly(4)
+        size = struct.unpack('!I', size_data)[0]
+        if size > MAX_MESSAGE_SIZE:
+            logger.error(f"Taille de message trop grande: {size} bytes")
+            return None
+        data = await reader.readexactly(size)
+        return json.loads(data.decode())
+    except asyncio.IncompleteReadError:
+        return None
+    except json.JSONDecodeError as e:
+        logger.error(f"Erreur de décodage JSON: {e}")
+        return None
     except Exception as e:
-        logging.error(f"Erreur lors de la réception du message: {e}")
+        logger.error(f"Erreur lors de la réception du message: {e}")
         return None
 
 # Exemples d'utilisation des messages
@@ -173,35 +246,53 @@ def create_start_match_message(player1: str, player2: str, player: int) -> dict:
         "opponent": player2 if player == 1 else player1
     }
 
-def create_play_turn_message(row: int, col: int) -> Dict[str, Any]:
-    """Crée un message pour jouer un coup"""
-    return {
+def create_play_turn_message(row: int, col: int, seq: Optional[int] = None) -> Dict[str, Any]:
+    """Crée un message pour jouer un coup (seq : numéro du coup prédit par le client)"""
+    message = {
         "type": MessageType.PLAY_TURN.value,
         "row": row,
         "col": col
     }
+    if seq is not None:
+        message["seq"] = seq
+    return message
 
-def create_game_update_message(board: list, current_player: int) -> Dict[str, Any]:
-    """Crée un message de mise à jour du jeu"""
-    return {
+def create_game_update_message(board: list, current_player: int, seq: Optional[int] = None,
+                               clock: Optional[List[float]] = None) -> Dict[str, Any]:
+    """
+    Crée un message de mise à jour du jeu (seq : numéro du coup confirmé, pour son auteur ;
+    clock : temps restants [joueur 1, joueur 2] si le match a une pendule)
+    """
+    message = {
         "type": MessageType.GAME_UPDATE.value,
         "board": board,
         "current_player": current_player
     }
+    if seq is not None:
+        message["seq"] = seq
+    if clock is not None:
+        message["clock"] = clock
+    return message
 
-def create_end_game_message(winner: int) -> Dict[str, Any]:
-    """Crée un message de fin de partie"""
-    return {
+def create_end_game_message(winner: int, reason: Optional[str] = None) -> Dict[str, Any]:
+    """Crée un message de fin de partie (reason : "timeout" si un drapeau est tombé)"""
+    message = {
         "type": MessageType.END_GAME.value,
         "winner": winner
     }
+    if reason is not None:
+        message["reason"] = reason
+    return message
 
-def create_error_message(message: str) -> Dict[str, Any]:
-    """Crée un message d'erreur"""
-    return {
+def create_error_message(message: str, seq: Optional[int] = None) -> Dict[str, Any]:
+    """Crée un message d'erreur (seq : numéro du coup refusé, le cas échéant)"""
+    error = {
         "type": MessageType.ERROR.value,
         "message": message
     }
+    if seq is not None:
+        error["seq"] = seq
+    return error
 
 def create_chat_message(sender: str, message: str) -> dict:
     """Crée un message de chat"""
@@ -216,4 +307,19 @@ def create_queue_update_message(queue_size: int) -> dict:
     return {
         "type": MessageType.QUEUE_UPDATE.value,
         "queue_size": queue_size
-    } 
\ No newline at end of file
+    }
+
+def create_leaderboard_request_message(limit: int = 10) -> Dict[str, Any]:
+    """Crée une demande de classement"""
+    return {
+        "type": MessageType.LEADERBOARD.value,
+        "limit": limit
+    }
+
+def create_leaderboard_message(players: List[Dict[str, Any]], rank: Optional[int] = None) -> Dict[str, Any]:
+    """Crée un message de classement (meilleurs joueurs et rang du demandeur)"""
+    return {
+        "type": MessageType.LEADERBOARD.value,
+        "players": players,
+        "rank": rank
+    }
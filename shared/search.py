@@ -0,0 +1,240 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from shared.evaluation import ThreatEvaluator, build_windows
+from shared.game import Puissance4Game
+
+# Score d'une victoire ; une victoire plus rapide vaut plus (WIN_SCORE + profondeur restante)
+WIN_SCORE = 1_000_000
+INFINITY = 10 * WIN_SCORE
+
+# Colonnes du centre vers les bords : les meilleurs coups sont en général au centre,
+# les essayer d'abord fait couper l'alpha-bêta plus tôt
+COLUMN_ORDER = [3, 2, 4, 1, 5, 0, 6]
+
+# Types d'entrée de la table de transposition
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+class SearchCancelled(Exception):
+    """Levée quand la recherche est interrompue par should_stop"""
+
+WINDOWS = build_windows()
+
+def evaluate(board: List[List[int]], player: int) -> int:
+    """
+    Évaluation heuristique d'une position pour player.
+
+    Chaque fenêtre de 4 cases occupée par un seul joueur compte selon son nombre
+    de jetons ; les jetons de la colonne centrale comptent en plus.
+    """
+    opponent = 3 - player
+    score = 0
+    for row in board:
+        if row[3] == player:
+            score += 3
+        elif row[3] == opponent:
+            score -= 3
+    for window in WINDOWS:
+        mine = theirs = 0
+        for row, col in window:
+            cell = board[row][col]
+            if cell == player:
+                mine += 1
+            elif cell == opponent:
+                theirs += 1
+        if theirs == 0:
+            if mine == 3:
+                score += 5
+            elif mine == 2:
+                score += 2
+        elif mine == 0:
+            if theirs == 3:
+                score -= 4
+            elif theirs == 2:
+                score -= 2
+    return score
+
+class Search:
+    """
+    Recherche negamax alpha-bêta à profondeur croissante sur une copie de la partie.
+
+    Les coups sont joués et retirés en place (make_move / unmake_move), sans copie
+    du plateau ; la table de transposition est indexée par la clé de Zobrist
+    canonique (position_key), une position et son reflet partagent donc leur entrée.
+
+    iterate() produit, après chaque profondeur terminée, le score de chaque colonne
+    jouable du point de vue du joueur au trait. should_stop est consulté tous les
+    check_every nœuds ; s'il retourne True, la recherche lève SearchCancelled.
+
+    Avec threats (par défaut), les feuilles sont évaluées par un ThreatEvaluator
+    tenu à jour à chaque coup ; sinon par evaluate(), qui parcourt le plateau.
+    """
+
+    def __init__(self, game: Puissance4Game, should_stop: Optional[Callable[[], bool]] = None,
+                 check_every: int = 512, tt: Optional[dict] = None, threats: bool = True):
+        self.game = Puissance4Game()
+        self.game.set_board([line[:] for line in game.board], game.current_player)
+        self.should_stop = should_stop
+        self.check_every = check_every
+        self.nodes = 0
+        # Table de transposition : clé -> (profondeur, type, score) ; peut être partagée
+        # entre recherches successives (voir ParallelSearch)
+        self.tt = {} if tt is None else tt
+        self.evaluator = ThreatEvaluator(self.game) if threats else None
+
+    def play(self, col: int, depth: int, alpha: int, beta: int) -> int:
+        """Joue col, cherche la position obtenue puis retire le coup ; score pour le joueur qui a joué"""
+        game = self.game
+        game.make_move(col)
+        try:
+            if game.winner is not None:
+                return WIN_SCORE + depth
+            if game.game_over:
+                return 0  # Plateau plein : match nul
+            return -self.negamax(depth - 1, -beta, -alpha)
+        finally:
+            game.unmake_move()
+
+    def negamax(self, depth: int, alpha: int, beta: int) -> int:
+        """Score de la position pour le joueur au trait, à depth demi-coups"""
+        self.nodes += 1
+        if self.should_stop and self.nodes % self.check_every == 0 and self.should_stop():
+            raise SearchCancelled()
+
+        game = self.game
+        if depth == 0:
+            if self.evaluator:
+                return self.evaluator.evaluate(game.current_player)
+            return evaluate(game.board, game.current_player)
+
+        key = game.position_key()
+        entry = self.tt.get(key)
+        if entry is not None and entry[0] >= depth:
+            _, kind, score = entry
+            if kind == EXACT:
+                return score
+            if kind == LOWER_BOUND and score >= beta:
+                return score
+            if kind == UPPER_BOUND and score <= alpha:
+                return score
+
+        original_alpha = alpha
+        best = -INFINITY
+        heights = game.heights
+        for col in COLUMN_ORDER:
+            if heights[col] == game.ROWS:
+                continue
+            score = self.play(col, depth, alpha, beta)
+
+            if score > best:
+                best = score
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        # Plateau plein : match nul
+        if best == -INFINITY:
+            return 0
+
+        if best <= original_alpha:
+            kind = UPPER_BOUND
+        elif best >= beta:
+            kind = LOWER_BOUND
+        else:
+            kind = EXACT
+        self.tt[key] = (depth, kind, best)
+        return best
+
+    def score_moves(self, depth: int, order: Optional[List[int]] = None) -> Dict[int, int]:
+        """Score exact de chaque colonne jouable à la profondeur depth"""
+        scores = {}
+        for col in order or COLUMN_ORDER:
+            if self.game.heights[col] == self.game.ROWS:
+                continue
+            scores[col] = self.play(col, depth, -INFINITY, INFINITY)
+        return scores
+
+    def iterate(self, max_depth: int) -> Iterator[Tuple[int, Dict[int, int]]]:
+        """Approfondissement itératif : produit (profondeur, scores) pour depth = 1..max_depth"""
+        empty_cells = sum(line.count(0) for line in self.game.board)
+        order = COLUMN_ORDER
+        for depth in range(1, min(max_depth, empty_cells) + 1):
+            scores = self.score_moves(depth, order)
+            yield depth, scores
+            # Profondeur suivante : commencer par les meilleurs coups de celle-ci
+            order = sorted(scores, key=scores.get, reverse=True)
+            # Inutile d'aller plus loin si l'issue de chaque coup est déjà connue
+            if all(abs(score) >= WIN_SCORE for score in scores.values()):
+                return
+
+def is_decided(score: int) -> bool:
+    """True si le score correspond à une victoire ou une défaite forcée"""
+    return abs(score) >= WIN_SCORE
+
+# Table de transposition propre à chaque processus de ParallelSearch, conservée
+# d'une tâche à l'autre (les positions voisines se recoupent d'un coup à l'autre)
+_worker_tt: dict = {}
+
+def _score_root_moves(board: List[List[int]], player: int, depth: int,
+                      columns: List[int], max_tt_entries: int) -> Tuple[Dict[int, int], int]:
+    """Tâche d'un processus de ParallelSearch : score des colonnes columns de la racine"""
+    if len(_worker_tt) > max_tt_entries:
+        _worker_tt.clear()
+    game = Puissance4Game()
+    game.set_board(board, player)
+    search = Search(game, tt=_worker_tt)
+    return search.score_moves(depth, columns), search.nodes
+
+class ParallelSearch:
+    """
+    Recherche répartie sur plusieurs processus, par partage des coups de la racine.
+
+    Chaque colonne jouable est une tâche : le pool la confie au premier processus
+    libre, qui la cherche à la profondeur demandée avec sa propre table de
+    transposition. Les scores sont ensuite réunis et le meilleur coup choisi.
+    """
+
+    def __init__(self, workers: int = 4, max_tt_entries: int = 2_000_000):
+        self.workers = workers
+        self.max_tt_entries = max_tt_entries
+        self.pool = None
+        self.nodes = 0
+
+    def start(self):
+        """Démarre les processus (spawn : sûr depuis un programme qui a des threads)"""
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+
+    def score_moves(self, game: Puissance4Game, depth: int) -> Dict[int, int]:
+        """Score de chaque colonne jouable à la profondeur depth, du point de vue du joueur au trait"""
+        self.start()
+        board = [line[:] for line in game.board]
+        columns = [col for col in COLUMN_ORDER if game.get_next_row(col) != -1]
+        futures = [
+            self.pool.submit(_score_root_moves, board, game.current_player, depth, [col], self.max_tt_entries)
+            for col in columns
+        ]
+        scores = {}
+        self.nodes = 0
+        for future in futures:
+            partial, nodes = future.result()
+            scores.update(partial)
+            self.nodes += nodes
+        return scores
+
+    def best_move(self, game: Puissance4Game, depth: int) -> Tuple[Optional[int], Dict[int, int]]:
+        """Meilleure colonne (au centre en cas d'égalité) et scores de toutes les colonnes"""
+        scores = self.score_moves(game, depth)
+        if not scores:
+            return None, scores
+        best = max(scores.values())
+        return next(col for col in COLUMN_ORDER if scores.get(col) == best), scores
+
+    def close(self):
+        """Arrête les processus"""
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
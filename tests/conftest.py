@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Ajouter le répertoire parent au PYTHONPATH (comme les scripts du projet)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,77 @@
+import sqlite3
+import time
+
+import pytest
+
+from server.archive import MatchArchiver
+from server.database import Database
+from shared.models import pack_moves, unpack_moves
+
+@pytest.fixture
+def database():
+    db = Database(":memory:")
+    yield db
+    db.close()
+
+def save_match(database: Database, finished_at: float, moves=(3, 3, 4)) -> str:
+    """Enregistre un match terminé et force sa date de fin"""
+    alice = database.get_or_create_player("alice").id
+    bob = database.get_or_create_player("bob").id
+    board = [[0] * 7 for _ in range(6)]
+    match_id = database.save_finished_match(alice, bob, alice, board, list(moves))
+    with database.lock:
+        database.conn.execute("UPDATE matches SET finished_at = ? WHERE id = ?", (finished_at, match_id))
+        database.conn.commit()
+    return match_id
+
+def archived_rows(archiver: MatchArchiver):
+    return archiver.database.conn.execute(
+        f"SELECT * FROM {archiver.schema}.matches_archive ORDER BY finished_at"
+    ).fetchall()
+
+@pytest.mark.parametrize("moves", [[], [0], [3, 4], [6, 0, 14, 1, 2], list(range(7)) * 6])
+def test_pack_moves_round_trip(moves):
+    data = pack_moves(moves)
+    assert len(data) == (len(moves) + 1) // 2
+    assert unpack_moves(data) == moves
+
+def test_unpack_moves_accepts_none():
+    assert unpack_moves(None) == []
+
+def test_archive_batch_moves_only_old_matches(database):
+    now = time.time()
+    old = [save_match(database, now - 1000 - i) for i in range(3)]
+    recent = save_match(database, now)
+    archiver = MatchArchiver(database, batch_size=2)
+
+    assert archiver.archive_batch(now - 500) == 2
+    assert archiver.archive_batch(now - 500) == 1
+    assert archiver.archive_batch(now - 500) == 0
+
+    remaining = [row['id'] for row in database.conn.execute("SELECT id FROM matches")]
+    assert remaining == [recent]
+    rows = archived_rows(archiver)
+    assert sorted(row['id'] for row in rows) == sorted(old)
+    assert all(unpack_moves(row['moves']) == [3, 3, 4] for row in rows)
+    # Le plateau n'est gardé que pour les matchs sans suite de coups
+    assert all(row['board'] is None for row in rows)
+
+def test_run_once_in_separate_file(database, tmp_path):
+    save_match(database, time.time() - 3600)
+    archiver = MatchArchiver(database, archive_path=str(tmp_path / "archive.db"), max_age=60)
+    assert archiver.run_once() == 1
+    assert archiver.run_once() == 0
+    assert len(archived_rows(archiver)) == 1
+    assert database.conn.execute("SELECT COUNT(*) FROM main.matches").fetchone()[0] == 0
+
+def test_legacy_database_is_converted_at_startup(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE legacy (x)")
+    conn.commit()
+    conn.close()
+    database = Database(path)
+    try:
+        assert database.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    finally:
+        database.close()
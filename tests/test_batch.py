@@ -0,0 +1,47 @@
+import numpy as np
+
+from shared.batch import BatchGame, self_play
+from shared.game import Puissance4Game
+
+def test_batch_matches_single_games():
+    count = 64
+    rng = np.random.default_rng(0)
+    batch = BatchGame(count)
+    games = [Puissance4Game() for _ in range(count)]
+    while not batch.done.all():
+        columns = batch.random_moves(rng)
+        played = batch.play(columns)
+        for i, game in enumerate(games):
+            assert played[i] == (columns[i] != -1 and not game.is_game_over())
+            if played[i]:
+                assert game.make_move(int(columns[i]))
+            assert batch.boards[i].tolist() == game.board
+            assert batch.heights[i].tolist() == game.heights
+            assert bool(batch.done[i]) == game.is_game_over()
+            assert (int(batch.winner[i]) or None) == game.winner
+            assert int(batch.current_player[i]) == game.current_player
+
+def test_illegal_moves_are_ignored():
+    batch = BatchGame(3)
+    for _ in range(batch.ROWS):
+        batch.play(np.array([0, 0, 0]))
+    before = batch.cells.copy()
+    played = batch.play(np.array([0, -1, batch.COLS]))
+    assert not played.any()
+    assert (batch.cells == before).all()
+
+def test_load_and_to_game_round_trip():
+    game = Puissance4Game()
+    for col in (3, 3, 2, 4, 1):
+        game.make_move(col)
+    batch = BatchGame(2)
+    batch.load(1, game)
+    copy = batch.to_game(1)
+    assert copy.board == game.board
+    assert copy.heights == game.heights
+    assert copy.current_player == game.current_player
+    assert copy.hash == game.hash
+    assert batch.boards[0].sum() == 0
+
+def test_self_play_counts_every_game():
+    assert sum(self_play(500, seed=1)) == 500
@@ -0,0 +1,132 @@
+import threading
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+from client.chat import ChatLog
+from server import chat as server_chat
+from server.chat import ChatRateLimiter, ChatRelay
+
+class FakeText:
+    """Widget Text minimal (insertion en fin, suppression des premières lignes)"""
+
+    def __init__(self):
+        self.content = ""
+        self.inserts = 0
+
+    def config(self, **options):
+        pass
+
+    def see(self, index):
+        pass
+
+    def insert(self, index, *args):
+        assert index == tk.END
+        self.inserts += 1
+        self.content += "".join(args[0::2])
+
+    def delete(self, start, end):
+        if end == tk.END:
+            self.content = ""
+            return
+        assert start == "1.0"
+        lines = int(end.split(".")[0]) - 1
+        self.content = "".join(self.content.splitlines(keepends=True)[lines:])
+
+@pytest.fixture
+def now(monkeypatch):
+    """Fige time.monotonic du limiteur de débit"""
+    current = [1000.0]
+    monkeypatch.setattr(server_chat.time, "monotonic", lambda: current[0])
+    return current
+
+def test_rate_limiter_burst_then_refill(now):
+    limiter = ChatRateLimiter(rate=2.0, burst=3)
+    assert [limiter.allow("alice") for _ in range(4)] == [True, True, True, False]
+    # Les utilisateurs ont chacun leur seau
+    assert limiter.allow("bob")
+    now[0] += 0.5  # Un jeton regagné
+    assert limiter.allow("alice")
+    assert not limiter.allow("alice")
+    now[0] += 60  # Jamais plus que burst jetons
+    assert [limiter.allow("alice") for _ in range(4)] == [True, True, True, False]
+
+def test_rate_limiter_forget(now):
+    limiter = ChatRateLimiter(rate=0.0, burst=1)
+    assert limiter.allow("alice")
+    assert not limiter.allow("alice")
+    limiter.forget("alice")
+    limiter.forget("inconnu")
+    assert limiter.allow("alice")
+
+def test_chat_log_batches_and_trims():
+    text = FakeText()
+    log = ChatLog(text, max_messages=3)
+    for i in range(5):
+        log.add("bob", f"message {i}")
+    log.flush()
+    log.flush()  # Rien en attente : aucune insertion
+    assert text.inserts == 1
+    assert [entry[1] for entry in log.history] == ["message 2", "message 3", "message 4"]
+    assert "message 1" not in text.content and "message 4" in text.content
+
+    log.add("moi", "message 5", "self")
+    log.add("", "bienvenue", "system")
+    log.flush()
+    assert [entry[1] for entry in log.history] == ["message 4", "message 5", "bienvenue"]
+    assert len(log.line_counts) == 3
+    # Le widget ne contient plus que les trois derniers messages
+    assert text.content.count("\n") == sum(log.line_counts)
+    assert "message 3" not in text.content and text.content.lstrip("\n").startswith("[")
+
+    log.clear()
+    assert text.content == "" and not log.history and not log.line_counts
+
+def test_chat_log_with_tk_text():
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        pytest.skip("Pas d'affichage disponible")
+    try:
+        text = tk.Text(root)
+        log = ChatLog(text, max_messages=2)
+        for i in range(4):
+            log.add("bob", f"message {i}")
+            log.flush()
+        content = text.get("1.0", tk.END)
+        assert "message 1" not in content and "message 3" in content
+    finally:
+        root.destroy()
+
+def test_relay_sends_in_order_and_reports_failures():
+    received = []
+    failures = []
+    done = threading.Event()
+
+    def send(recipient, message):
+        received.append((recipient, message["n"]))
+        if message["n"] == 4:
+            done.set()
+        return message["n"] != 2
+
+    relay = ChatRelay(send)
+    assert not relay.relay("alice", {"n": 0})  # Relais pas encore démarré
+    relay.start()
+    for n in range(1, 5):
+        assert relay.relay("alice", {"n": n}, lambda n=n: failures.append(n))
+    assert done.wait(2.0)
+    assert received == [("alice", n) for n in range(1, 5)]
+    assert failures == [2]
+    relay.stop()
+    assert not relay.relay("alice", {"n": 5})
+
+def test_relay_drops_when_queue_is_full():
+    release = threading.Event()
+    relay = ChatRelay(lambda recipient, message: release.wait(2.0), max_pending=2)
+    relay.start()
+    results = [relay.relay("bob", {"n": n}) for n in range(5)]
+    release.set()
+    relay.stop()
+    # Le premier message peut déjà être en cours d'envoi : au plus 3 acceptés
+    assert results[:2] == [True, True] and results[-1] is False
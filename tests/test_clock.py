@@ -0,0 +1,92 @@
+import threading
+
+import pytest
+
+from server.clock import MatchClock, TimerScheduler
+
+class FakeClock:
+    """Horloge manuelle pour les tests"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def scheduler():
+    scheduler = TimerScheduler()
+    scheduler.start()
+    yield scheduler
+    scheduler.stop()
+
+def test_only_the_running_player_spends_time(clock):
+    match_clock = MatchClock(60.0, increment=2.0, clock=clock)
+    match_clock.start(1)
+    clock.now += 10
+    assert match_clock.time_left(1) == 50.0
+    assert match_clock.time_left(2) == 60.0
+    assert match_clock.deadline() == 160.0
+
+    assert match_clock.press(1) == 50.0
+    assert match_clock.running == 2
+    clock.now += 5
+    assert match_clock.snapshot() == [52.0, 55.0]
+
+    match_clock.stop()
+    clock.now += 100
+    assert match_clock.running is None and match_clock.deadline() is None
+    assert match_clock.snapshot() == [52.0, 55.0]
+    assert not match_clock.flag_fallen()
+
+def test_flag_falls_without_increment(clock):
+    match_clock = MatchClock(3.0, increment=5.0, clock=clock)
+    match_clock.start(1)
+    clock.now += 2.9
+    assert not match_clock.flag_fallen()
+    clock.now += 0.2
+    assert match_clock.flag_fallen()
+    assert match_clock.snapshot() == [0.0, 3.0]
+    # Un coup joué trop tard ne rapporte pas d'incrément
+    assert match_clock.press(1) <= 0
+    assert match_clock.remaining[1] <= 0
+
+def test_timers_fire_in_deadline_order(scheduler):
+    fired = []
+    done = threading.Event()
+    scheduler.schedule(0.06, lambda: (fired.append("c"), done.set()))
+    scheduler.schedule(0.02, fired.append, "a")
+    scheduler.schedule(0.04, fired.append, "b")
+    assert done.wait(2.0)
+    assert fired == ["a", "b", "c"]
+    assert len(scheduler) == 0
+
+def test_cancelled_timer_never_fires(scheduler):
+    fired = []
+    done = threading.Event()
+    timer = scheduler.schedule(0.01, fired.append, "annulée")
+    scheduler.cancel(timer)
+    scheduler.cancel(timer)  # Sans effet la deuxième fois
+    scheduler.cancel(None)
+    scheduler.schedule(0.03, done.set)
+    assert done.wait(2.0)
+    assert fired == []
+
+def test_failing_callback_does_not_stop_the_thread(scheduler):
+    done = threading.Event()
+    scheduler.schedule(0.0, lambda: 1 / 0)
+    scheduler.schedule(0.01, done.set)
+    assert done.wait(2.0)
+
+def test_heap_is_rebuilt_when_mostly_cancelled(clock):
+    scheduler = TimerScheduler(clock=clock)  # Thread non démarré : rien ne part
+    timers = [scheduler.schedule(10.0 + i, print) for i in range(100)]
+    for timer in timers[:64]:
+        scheduler.cancel(timer)
+    assert len(scheduler) == 100
+    scheduler.cancel(timers[64])
+    assert len(scheduler) == 35
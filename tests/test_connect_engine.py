@@ -0,0 +1,44 @@
+import random
+
+import pytest
+
+from shared.connect_engine import ConnectEngine
+from shared.game import MorpionGame, Puissance4Game
+
+@pytest.mark.parametrize("seed", range(20))
+def test_puissance4_matches_engine(seed):
+    rng = random.Random(seed)
+    game = Puissance4Game()
+    engine = ConnectEngine.from_variant("puissance4")
+    while not game.is_game_over():
+        col = rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS])
+        assert game.make_move(col) and engine.make_move(None, col)
+        assert (game.game_over, game.winner, game.current_player) == (engine.game_over, engine.winner, engine.current_player)
+        assert game.bits == engine.bits
+    # Les masques suivent aussi set_board et unmake_move
+    copy = Puissance4Game()
+    copy.set_board([line[:] for line in game.board])
+    assert copy.bits == game.bits
+    while game.unmake_move():
+        pass
+    assert game.bits == [0, 0, 0]
+
+@pytest.mark.parametrize("seed", range(20))
+def test_morpion_matches_engine(seed):
+    rng = random.Random(seed)
+    game = MorpionGame()
+    engine = ConnectEngine.from_variant("morpion")
+    while not game.game_over:
+        row, col = rng.choice([(r, c) for r in range(3) for c in range(3) if game.board[r][c] == 0])
+        assert game.play_move(row, col) and engine.make_move(row, col)
+        assert (game.game_over, game.winner, game.current_player) == (engine.game_over, engine.winner, engine.current_player)
+        assert game.check_winner() == (engine.winner is not None)
+
+def test_check_winner_only_counts_lines_through_the_cell():
+    game = Puissance4Game()
+    for col in (0, 1, 0, 1, 0, 1, 6):
+        game.make_move(col)
+    assert not game.check_winner(5, 6)
+    assert not game.check_winner(5, 0)  # Trois jetons seulement
+    game.make_move(1)  # Quatrième jeton du joueur 2 en colonne 1
+    assert game.check_winner(2, 1) and game.winner == 2
@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from shared.evaluation import ThreatEvaluator
+from shared.game import Puissance4Game
+
+def random_columns(rng: random.Random, game: Puissance4Game):
+    """Colonnes jouées au hasard jusqu'à la fin de la partie (la partie est jouée)"""
+    columns = []
+    while not game.is_game_over():
+        col = rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS])
+        assert game.make_move(col)
+        columns.append(col)
+    return columns
+
+def state(game: Puissance4Game) -> tuple:
+    """Tout l'état qu'un coup modifie"""
+    return (
+        [line[:] for line in game.board], game.heights[:], game.hash, game.mirror_hash,
+        game.current_player, game.game_over, game.winner, game.moves[:],
+    )
+
+def evaluator_state(evaluator: ThreatEvaluator) -> tuple:
+    return (
+        [counts[:] for counts in evaluator.counts],
+        [None] + [[line[:] for line in cells] for cells in evaluator.threat_cells[1:]],
+        evaluator.odd_threats[:], evaluator.even_threats[:],
+        evaluator.line_score, evaluator.center,
+    )
+
+def rebuilt(game: Puissance4Game) -> Puissance4Game:
+    """Même position reconstruite de zéro depuis le plateau"""
+    fresh = Puissance4Game()
+    ThreatEvaluator(fresh)
+    fresh.set_board([line[:] for line in game.board], game.current_player)
+    return fresh
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_state_matches_rebuild(seed):
+    rng = random.Random(seed)
+    game = Puissance4Game()
+    ThreatEvaluator(game)
+    while not game.is_game_over():
+        col = rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS])
+        assert game.make_move(col)
+        fresh = rebuilt(game)
+        assert (game.hash, game.mirror_hash, game.heights) == (fresh.hash, fresh.mirror_hash, fresh.heights)
+        assert evaluator_state(game.evaluator) == evaluator_state(fresh.evaluator)
+        assert game.evaluator.evaluate(1) == fresh.evaluator.evaluate(1)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_unmake_restores_everything(seed):
+    rng = random.Random(seed)
+    game = Puissance4Game()
+    ThreatEvaluator(game)
+    history = []
+    while not game.is_game_over():
+        history.append((state(game), evaluator_state(game.evaluator)))
+        col = rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS])
+        assert game.make_move(col)
+    for expected in reversed(history):
+        assert game.unmake_move()
+        assert (state(game), evaluator_state(game.evaluator)) == expected
+    assert not game.unmake_move()
+
+def test_undo_redo_round_trip():
+    game = Puissance4Game()
+    random_columns(random.Random(3), game)
+    final = state(game)
+    while game.undo_move():
+        pass
+    assert state(game) == state(Puissance4Game())
+    while game.redo_move():
+        pass
+    assert state(game) == final
+
+@pytest.mark.parametrize("seed", range(10))
+def test_position_key_is_mirror_invariant(seed):
+    rng = random.Random(seed)
+    game = Puissance4Game()
+    mirror = Puissance4Game()
+    while not game.is_game_over():
+        col = rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS])
+        game.make_move(col)
+        mirror.make_move(game.COLS - 1 - col)
+        assert game.position_key() == mirror.position_key()
+        assert (game.hash, game.mirror_hash) == (mirror.mirror_hash, mirror.hash)
+
+def test_position_key_separates_positions():
+    game = Puissance4Game()
+    keys = set()
+    for col in range(game.COLS):
+        game.make_move(col)
+        keys.add(game.position_key())
+        game.unmake_move()
+    # Les coups symétriques (0 et 6, 1 et 5, 2 et 4) donnent la même clé
+    assert len(keys) == 4
+
+@pytest.mark.parametrize("seed", range(10))
+def test_play_ai_move_leaves_the_game_untouched(seed):
+    rng = random.Random(seed)
+    game = Puissance4Game()
+    ThreatEvaluator(game)
+    while not game.is_game_over():
+        before = (state(game), evaluator_state(game.evaluator), game.move_stack[:], game.redo_stack[:])
+        row, col = game.play_ai_move()
+        assert row == game.get_next_row(col) and row != -1
+        assert (state(game), evaluator_state(game.evaluator), game.move_stack[:], game.redo_stack[:]) == before
+        game.make_move(rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS]))
+
+def test_play_ai_move_wins_then_blocks():
+    game = Puissance4Game()
+    for col in (0, 6, 1, 6, 2):
+        game.make_move(col)
+    # Le joueur 2 doit bloquer la colonne 3
+    assert game.play_ai_move() == (5, 3)
+    game.make_move(5)
+    # Le joueur 1 gagne en colonne 3
+    assert game.play_ai_move() == (5, 3)
@@ -0,0 +1,68 @@
+import pytest
+
+from server.database import Database, compute_elo
+from server.leaderboard import Leaderboard
+
+@pytest.fixture
+def database():
+    db = Database(":memory:")
+    yield db
+    db.close()
+
+def add_players(database: Database, *names: str):
+    """Crée les joueurs et retourne leurs IDs"""
+    return [database.get_or_create_player(name).id for name in names]
+
+def test_compute_elo_is_zero_sum():
+    assert compute_elo(1000, 1000, 1.0) == (1016, 984)
+    assert compute_elo(1000, 1000, 0.5) == (1000, 1000)
+    # Le favori gagne peu, l'outsider gagne beaucoup
+    assert compute_elo(1400, 1000, 1.0) == (1403, 997)
+    assert compute_elo(1000, 1400, 1.0) == (1029, 1371)
+
+def test_record_match_result_updates_stats(database):
+    alice, bob = add_players(database, "alice", "bob")
+    database.record_match_result(alice, bob, alice)
+    database.record_match_result(alice, bob, None)
+    stats = {s.username: s for s in database.get_top_players()}
+    assert (stats["alice"].wins, stats["alice"].draws, stats["alice"].games_played) == (1, 1, 2)
+    assert (stats["bob"].losses, stats["bob"].draws, stats["bob"].games_played) == (1, 1, 2)
+    assert stats["alice"].rating + stats["bob"].rating == 2000
+    assert database.get_player(alice).rating == stats["alice"].rating
+
+def test_player_rank(database):
+    alice, bob, carol, dave = add_players(database, "alice", "bob", "carol", "dave")
+    database.record_match_result(alice, bob, alice)
+    database.record_match_result(alice, carol, alice)
+    assert database.get_player_rank(alice) == 1
+    # bob et carol ont perdu contre le même adversaire : ex aequo ou non, jamais devant alice
+    assert {database.get_player_rank(bob), database.get_player_rank(carol)} <= {2, 3}
+    # Un joueur qui n'a jamais joué n'est pas classé
+    assert database.get_player_rank(dave) is None
+    assert database.get_player_rank("inconnu") is None
+
+def test_leaderboard_message(database):
+    alice, bob, carol = add_players(database, "alice", "bob", "carol")
+    database.record_match_result(alice, bob, alice)
+    leaderboard = Leaderboard(database, size=1)
+    leaderboard.refresh()
+
+    message = leaderboard.get_message(bob)
+    assert [p["username"] for p in message["players"]] == ["alice"]
+    assert message["players"][0]["rank"] == 1
+    assert message["rank"] == 2
+    assert leaderboard.get_message(carol)["rank"] is None
+    assert leaderboard.get_message(limit=0)["players"] == []
+
+def test_leaderboard_rank_cache_is_reset_on_refresh(database):
+    alice, bob = add_players(database, "alice", "bob")
+    leaderboard = Leaderboard(database)
+    leaderboard.refresh()
+    database.record_match_result(alice, bob, bob)
+    assert leaderboard.get_message(alice)["rank"] == 2
+    leaderboard.record_result(alice, bob, alice)
+    leaderboard.record_result(alice, bob, alice)
+    # Le rang reste celui du cache jusqu'au prochain rafraîchissement
+    assert leaderboard.get_message(alice)["rank"] == 2
+    leaderboard.refresh()
+    assert leaderboard.get_message(alice)["rank"] == 1
@@ -0,0 +1,62 @@
+from shared.mcts import MCTS, play, position_from_board
+
+def subtree(mcts: MCTS, node: int) -> tuple:
+    """Contenu d'un sous-arbre, indépendamment de sa place dans les tableaux"""
+    first = mcts.first_child[node]
+    children = tuple(
+        (mcts.move[child], subtree(mcts, child))
+        for child in range(first, first + mcts.child_count[node])
+    )
+    return mcts.terminal[node], mcts.visits[node], mcts.wins[node], children
+
+def size(tree: tuple) -> int:
+    return 1 + sum(size(child) for _, child in tree[3])
+
+def child(mcts: MCTS, node: int, col: int) -> int:
+    first = mcts.first_child[node]
+    for index in range(first, first + mcts.child_count[node]):
+        if mcts.move[index] == col:
+            return index
+    raise AssertionError(f"Coup {col} absent du nœud {node}")
+
+def most_visited(mcts: MCTS, node: int) -> int:
+    first = mcts.first_child[node]
+    return mcts.move[max(range(first, first + mcts.child_count[node]), key=lambda index: mcts.visits[index])]
+
+def test_advance_keeps_the_played_subtree():
+    mcts = MCTS(seed=1)
+    mcts.search(3000)
+    col = mcts.best_move()
+    expected = subtree(mcts, child(mcts, 0, col))
+    position = play(mcts.root_current, mcts.root_mask, col)[:2]
+    mcts.advance(col)
+    assert (mcts.root_current, mcts.root_mask) == position
+    assert subtree(mcts, 0) == expected
+    assert mcts.node_count == size(expected)
+
+def test_sync_reuses_two_plies():
+    mcts = MCTS(seed=2)
+    mcts.search(3000)
+    ours = mcts.best_move()
+    ours_node = child(mcts, 0, ours)
+    reply = most_visited(mcts, ours_node)
+    expected = subtree(mcts, child(mcts, ours_node, reply))
+
+    board = [[0] * 7 for _ in range(6)]
+    board[5][ours] = 1
+    board[4 if reply == ours else 5][reply] = 2
+    mcts.sync(board, 1)
+    assert (mcts.root_current, mcts.root_mask) == position_from_board(board, 1)
+    assert subtree(mcts, 0) == expected
+
+def test_sync_rebuilds_unrelated_positions():
+    mcts = MCTS(seed=3)
+    mcts.search(500)
+    board = [[0] * 7 for _ in range(6)]
+    for col in (0, 1, 2):
+        board[5][col] = 1
+    for col in (4, 5, 6):
+        board[5][col] = 2
+    mcts.sync(board, 1)
+    assert mcts.node_count == 1
+    assert mcts.search(500) == 3  # Victoire immédiate en colonne 3
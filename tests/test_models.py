@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from server.database import Database
+from shared.models import Board, GameState, Match, Move, Player, PlayerState
+
+def sample_board() -> Board:
+    """Plateau 6x7 avec quelques jetons"""
+    board = Board()
+    board.set(5, 3, 1)
+    board.set(5, 4, 2)
+    board.set(4, 3, 1)
+    return board
+
+def sample_match() -> Match:
+    alice = Player("id-alice", "alice", PlayerState.PLAYING, 1032)
+    bob = Player("id-bob", "bob", PlayerState.PLAYING)
+    return Match("id-match", alice, bob, GameState.PLAYING, sample_board(), current_player=bob)
+
+def test_board_get_set_and_lists():
+    board = sample_board()
+    assert (board.rows, board.cols, len(board.cells)) == (6, 7, 42)
+    assert board.get(5, 3) == 1 and board.get(5, 4) == 2 and board.get(0, 0) == 0
+    lists = board.to_lists()
+    assert lists[5] == [0, 0, 0, 1, 2, 0, 0]
+    assert Board.from_lists(lists) == board
+
+def test_board_bytes_and_column_round_trip():
+    board = sample_board()
+    data = board.to_bytes()
+    assert isinstance(data, bytes) and len(data) == 42
+    assert Board.from_bytes(data) == board
+    assert Board.from_column(data) == board
+    assert Board.from_column(memoryview(data)) == board
+    # Anciennes lignes : plateau stocké en JSON
+    assert Board.from_column(json.dumps(board.to_lists())) == board
+
+def test_board_other_dimensions():
+    board = Board(3, 3)
+    board.set(1, 1, 2)
+    assert Board.from_bytes(board.to_bytes(), 3, 3) == board
+    assert Board.from_bytes(board.to_bytes()) != board
+
+def test_player_round_trips():
+    player = Player("id-alice", "alice", PlayerState.QUEUED, 1100)
+    row = dict(zip(("id", "username", "state", "rating"), player.to_row()))
+    assert Player.from_row(row) == player
+    assert Player.from_wire(player.to_wire()) == player
+    assert Player.from_wire({"id": "x", "username": "x", "state": "idle"}).rating == 1000
+
+def test_match_round_trips():
+    match = sample_match()
+    players = {match.player1.id: match.player1, match.player2.id: match.player2}
+    columns = ("id", "player1_id", "player2_id", "state", "board", "current_player_id", "winner_id")
+    row = dict(zip(columns, match.to_row()))
+    assert Match.from_row(row, players) == match
+    wire = match.to_wire()
+    assert json.loads(json.dumps(wire)) == wire
+    assert Match.from_wire(wire) == match
+
+def test_match_database_round_trip():
+    database = Database(":memory:")
+    try:
+        match = sample_match()
+        match.winner = match.player1
+        database.add_player(match.player1)
+        database.add_player(match.player2)
+        database.create_match(match)
+        assert database.get_match(match.id) == match
+        assert database.get_match("inconnu") is None
+    finally:
+        database.close()
+
+def test_move_round_trip():
+    move = Move("id-match", "id-alice", 3)
+    assert Move.from_wire(move.to_wire()) == move
+
+def test_models_have_no_instance_dict():
+    with pytest.raises(AttributeError):
+        sample_board().extra = 1
+    with pytest.raises(AttributeError):
+        sample_match().player1.extra = 1
@@ -0,0 +1,77 @@
+import pytest
+
+from shared.game import MorpionGame
+from shared.morpion_solver import SYMMETRIES, best_move, build_table, canonical, position_score
+from shared.morpion_table import MORPION_TABLE
+
+def play(moves):
+    """Joue une suite de coups (ligne, colonne) et retourne la partie"""
+    game = MorpionGame()
+    for row, col in moves:
+        assert game.play_move(row, col)
+    return game
+
+def play_copy(game: MorpionGame, row: int, col: int) -> MorpionGame:
+    child = MorpionGame()
+    for r in range(3):
+        for c in range(3):
+            if game.board[r][c]:
+                child.board[r][c] = game.board[r][c]
+                child.bits[game.board[r][c]] |= 1 << (r * 3 + c)
+    child.current_player = game.current_player
+    assert child.play_move(row, col)
+    return child
+
+def never_loses(game: MorpionGame, ai_player: int) -> bool:
+    """Explore toutes les réponses de l'adversaire contre l'IA parfaite"""
+    if game.game_over:
+        return game.winner in (None, ai_player)
+    if game.current_player == ai_player:
+        row, col = game.play_ai_move()
+        child = play_copy(game, row, col)
+        return never_loses(child, ai_player)
+    return all(
+        never_loses(play_copy(game, row, col), ai_player)
+        for row in range(3) for col in range(3) if game.board[row][col] == 0
+    )
+
+def test_table_is_up_to_date():
+    assert MORPION_TABLE == build_table()
+
+def test_symmetries_are_permutations():
+    assert len(set(SYMMETRIES)) == 8
+    assert all(sorted(perm) == list(range(9)) for perm in SYMMETRIES)
+    key, perm = canonical("100000000")
+    assert key == min("".join("100000000"[i] for i in p) for p in SYMMETRIES)
+    assert "".join("100000000"[i] for i in perm) == key
+
+def test_empty_board():
+    empty = [[0] * 3 for _ in range(3)]
+    assert best_move(empty) == (1, 1)
+    assert position_score(empty) == 0
+
+@pytest.mark.parametrize("moves, expected", [
+    # X complète la ligne du haut plutôt que de bloquer
+    ([(0, 0), (1, 0), (0, 1), (1, 1)], (0, 2)),
+    # Même position tournée : le coup est retransformé dans le repère du plateau
+    ([(0, 2), (0, 1), (1, 2), (1, 1)], (2, 2)),
+    # O doit bloquer la diagonale
+    ([(0, 0), (0, 1), (1, 1)], (2, 2)),
+])
+def test_best_move_wins_or_blocks(moves, expected):
+    assert best_move(play(moves).board) == expected
+
+def test_finished_game_has_no_move():
+    game = play([(0, 0), (1, 0), (0, 1), (1, 1), (0, 2)])
+    assert game.game_over and game.winner == 1
+    assert game.play_ai_move() is None
+
+def test_perfect_play_is_a_draw():
+    game = MorpionGame()
+    while not game.game_over:
+        assert game.play_move(*game.play_ai_move())
+    assert game.winner is None
+
+@pytest.mark.parametrize("ai_player", [1, 2])
+def test_perfect_player_never_loses(ai_player):
+    assert never_loses(MorpionGame(), ai_player)
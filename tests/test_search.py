@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from shared.game import Puissance4Game
+from shared.search import WIN_SCORE, ParallelSearch, Search
+
+def position(seed: int, plies: int) -> Puissance4Game:
+    """Partie en cours après plies coups joués au hasard"""
+    rng = random.Random(seed)
+    while True:
+        game = Puissance4Game()
+        for _ in range(plies):
+            game.make_move(rng.choice([c for c in range(game.COLS) if game.heights[c] < game.ROWS]))
+            if game.game_over:
+                break
+        if not game.game_over:
+            return game
+
+@pytest.fixture(scope="module")
+def parallel():
+    # Les processus gardent leur table de transposition d'une tâche à l'autre : toutes
+    # les positions du module ont le même nombre de jetons et sont cherchées à la même
+    # profondeur, pour qu'aucune entrée plus profonde ne change les scores
+    search = ParallelSearch(workers=2)
+    yield search
+    search.close()
+
+@pytest.mark.parametrize("seed", range(6))
+def test_parallel_scores_match_search(parallel, seed):
+    game = position(seed, 6)
+    board = [line[:] for line in game.board]
+    scores = parallel.score_moves(game, 4)
+    assert scores == Search(game).score_moves(4)
+    assert parallel.nodes > 0
+    # La partie n'est pas modifiée
+    assert game.board == board
+
+def test_parallel_best_move_takes_the_win(parallel):
+    game = Puissance4Game()
+    for col in (0, 6, 1, 6, 2, 5):
+        game.make_move(col)
+    best, scores = parallel.best_move(game, 4)
+    assert best == 3
+    assert scores[3] >= WIN_SCORE
+    assert scores == Search(game).score_moves(4)
+
+def test_parallel_best_move_on_full_board():
+    game = Puissance4Game()
+    game.set_board([[(row + col) % 2 + 1 for col in range(7)] for row in range(6)], 1)
+    search = ParallelSearch(workers=1)
+    try:
+        assert search.best_move(game, 2) == (None, {})
+    finally:
+        search.close()